@@ -3,7 +3,7 @@ from __future__ import annotations
 
 __version__ = "7.2.0"
 
-from ibis import examples, util
+from ibis import util
 from ibis.backends.base import BaseBackend
 from ibis.common.exceptions import IbisError
 from ibis.config import options
@@ -12,7 +12,7 @@ from ibis.expr import types as ir
 from ibis.expr.api import *  # noqa: F403
 from ibis.expr.operations import udf
 
-__all__ = [  # noqa: PLE0604
+__all__ = [  # noqa: F405, PLE0604
     "api",
     "examples",
     "ir",
@@ -22,6 +22,7 @@ __all__ = [  # noqa: PLE0604
     "IbisError",
     "options",
     *api.__all__,
+    *api._LAZY_ATTRIBUTES,
 ]
 
 _KNOWN_BACKENDS = ["heavyai"]
@@ -38,7 +39,8 @@ def __dir__() -> list[str]:
 def __getattr__(name: str) -> BaseBackend:
     """Load backends in a lazy way with `ibis.<backend-name>`.
 
-    This also registers the backend options.
+    This also registers the backend options. The `examples` module and
+    the APIs depending on expensive imports are loaded lazily here as well.
 
     Examples
     --------
@@ -50,6 +52,15 @@ def __getattr__(name: str) -> BaseBackend:
     the `ibis.backends` entrypoints. If successful, the `ibis.sqlite`
     attribute is "cached", so this function is only called the first time.
     """
+    if name == "examples":
+        import ibis.examples
+
+        return ibis.examples
+    elif name in api._LAZY_ATTRIBUTES:
+        value = getattr(api, name)
+        globals()[name] = value
+        return value
+
     entry_points = {ep for ep in util.backend_entry_points() if ep.name == name}
 
     if not entry_points:
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import abc
 import collections.abc
+import concurrent.futures
 import functools
-import importlib.metadata
 import keyword
 import re
 import sys
@@ -21,10 +21,17 @@ import ibis.config
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
 from ibis import util
-from ibis.common.caching import RefCountedCache
+from ibis.common.caching import PersistentCache, RefCountedCache
+from ibis.common.fingerprint import tokenize
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+    from collections.abc import (
+        AsyncIterator,
+        Iterable,
+        Iterator,
+        Mapping,
+        MutableMapping,
+    )
     from pathlib import Path
 
     import pandas as pd
@@ -316,9 +323,7 @@ class _FileIOHandler:
         expr = expr.as_table()
         schema = expr.schema()
         yield from (
-            orig_expr.__pandas_result__(
-                PandasData.convert_table(batch.to_pandas(), schema)
-            )
+            orig_expr.__pandas_result__(PandasData.convert_pyarrow_table(batch, schema))
             for batch in self.to_pyarrow_batches(
                 expr, params=params, limit=limit, chunk_size=chunk_size, **kwargs
             )
@@ -775,13 +780,16 @@ class BaseBackend(abc.ABC, _FileIOHandler):
     supports_temporary_tables = False
     supports_python_udfs = False
     supports_in_memory_tables = True
+    # whether `execute` and `to_pyarrow` can be called from multiple threads at
+    # once, see `execute_many`
+    supports_concurrent_execution = False
 
     def __init__(self, *args, **kwargs):
         self._con_args: tuple[Any] = args
         self._con_kwargs: dict[str, Any] = kwargs
         # expression cache
         self._query_cache = RefCountedCache(
-            populate=self._load_into_cache,
+            populate=self._populate_cache,
             lookup=lambda name: self.table(name).op(),
             finalize=self._clean_up_cached_table,
             generate_name=functools.partial(util.gen_name, "cache"),
@@ -1032,6 +1040,236 @@ class BaseBackend(abc.ABC, _FileIOHandler):
     def execute(self, expr: ir.Expr) -> Any:
         """Execute an expression."""
 
+    @functools.cached_property
+    def _async_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        # queries issued from coroutines are serialized on a single worker
+        # thread unless the client can be used from multiple threads at once;
+        # clients bound to the thread that created them must allow being used
+        # from other threads
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=None if self.supports_concurrent_execution else 1,
+            thread_name_prefix=f"ibis-{self.name}-async",
+        )
+
+    async def _run_async(self, func: Callable, /, *args: Any, **kwargs: Any) -> Any:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._async_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def execute_async(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = "default",
+        **kwargs: Any,
+    ) -> pd.DataFrame | pd.Series | Any:
+        """Asynchronously execute an expression.
+
+        The query runs on an executor managed by the backend, so awaiting the
+        result doesn't block the event loop.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to execute.
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        kwargs
+            Keyword arguments passed to `execute`.
+        """
+        return await self._run_async(
+            self.execute, expr, params=params, limit=limit, **kwargs
+        )
+
+    async def to_pyarrow_async(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        **kwargs: Any,
+    ) -> pa.Table:
+        """Asynchronously execute an expression and return a pyarrow table.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow.
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        kwargs
+            Keyword arguments passed to `to_pyarrow`.
+        """
+        return await self._run_async(
+            self.to_pyarrow, expr, params=params, limit=limit, **kwargs
+        )
+
+    async def to_pyarrow_batches_async(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Asynchronously execute an expression and iterate over record batches.
+
+        Every batch is fetched on the executor managed by the backend.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow.
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments passed to `to_pyarrow_batches`.
+        """
+
+        def read_next_batch(reader):
+            # StopIteration can't be raised into a future
+            try:
+                return reader.read_next_batch()
+            except StopIteration:
+                return None
+
+        reader = await self._run_async(
+            self.to_pyarrow_batches,
+            expr,
+            params=params,
+            limit=limit,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+        try:
+            while (batch := await self._run_async(read_next_batch, reader)) is not None:
+                yield batch
+        finally:
+            await self._run_async(reader.close)
+
+    def _execute_many(
+        self,
+        method: Callable,
+        exprs: Iterable[ir.Expr],
+        max_concurrency: int | None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        exprs = list(exprs)
+        if (
+            not self.supports_concurrent_execution
+            or max_concurrency == 1
+            or len(exprs) < 2
+        ):
+            return [method(expr, **kwargs) for expr in exprs]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix=f"ibis-{self.name}"
+        ) as executor:
+            return list(executor.map(functools.partial(method, **kwargs), exprs))
+
+    def execute_many(
+        self,
+        exprs: Iterable[ir.Expr],
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = "default",
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> list[pd.DataFrame | pd.Series | Any]:
+        """Execute multiple independent expressions.
+
+        Backends whose client supports it run the queries concurrently, so the
+        total latency approaches the latency of the slowest query; the other
+        backends execute the expressions one after the other.
+
+        Parameters
+        ----------
+        exprs
+            Ibis expressions to execute.
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        max_concurrency
+            Maximum number of queries to run at the same time. Defaults to the
+            default number of workers of a
+            `concurrent.futures.ThreadPoolExecutor`.
+        kwargs
+            Keyword arguments passed to `execute`.
+
+        Returns
+        -------
+        list
+            The results of the expressions, in the order of `exprs`. The first
+            exception raised by any of the queries is re-raised.
+        """
+        return self._execute_many(
+            self.execute,
+            exprs,
+            max_concurrency,
+            params=params,
+            limit=limit,
+            **kwargs,
+        )
+
+    def to_pyarrow_many(
+        self,
+        exprs: Iterable[ir.Expr],
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> list[pa.Table | pa.Array | pa.Scalar]:
+        """Execute multiple independent expressions and return pyarrow results.
+
+        See `execute_many` for details about the execution of the queries.
+
+        Parameters
+        ----------
+        exprs
+            Ibis expressions to export to pyarrow.
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        max_concurrency
+            Maximum number of queries to run at the same time.
+        kwargs
+            Keyword arguments passed to `to_pyarrow`.
+
+        Returns
+        -------
+        list
+            The results of the expressions, in the order of `exprs`.
+        """
+        return self._execute_many(
+            self.to_pyarrow,
+            exprs,
+            max_concurrency,
+            params=params,
+            limit=limit,
+            **kwargs,
+        )
+
     def add_operation(self, operation: ops.Node) -> Callable:
         """Add a translation function to the backend for a specific operation.
 
@@ -1228,6 +1466,63 @@ class BaseBackend(abc.ABC, _FileIOHandler):
         """
         del self._query_cache[expr.op()]
 
+    @property
+    def _persistent_cache(self) -> PersistentCache | None:
+        options = ibis.options.cache
+        if options.directory is None:
+            return None
+        return PersistentCache(options.directory, max_size=options.max_size)
+
+    def _table_fingerprint(self, op: ops.DatabaseTable) -> str | None:
+        """Return a digest of the current contents of the table `op`.
+
+        Persistent cache entries are keyed on the contents of the tables an
+        expression reads. Backends that can't compute such a digest return
+        [](`None`), which disables the persistent cache for the expression.
+        """
+        return None
+
+    def _persistent_cache_key(self, cache: PersistentCache, expr) -> str | None:
+        op = expr.op()
+        # the contents of SQL queries and unbound tables can't be tracked
+        if op.find((ops.SQLQueryResult, ops.SQLStringView, ops.UnboundTable)):
+            return None
+
+        versions = []
+        for table in op.find(ops.DatabaseTable):
+            if (version := table.source._table_fingerprint(table)) is None:
+                return None
+            versions.append(version)
+        return cache.key((op, tuple(versions)))
+
+    def _populate_cache(self, name, expr):
+        """Load `expr` into the cache, going through the persistent cache if enabled.
+
+        On a hit the stored result is loaded into the backend instead of
+        recomputing `expr`; on a miss the freshly cached table is written to
+        the persistent cache for later sessions.
+        """
+        if (cache := self._persistent_cache) is None:
+            self._load_into_cache(name, expr)
+            return
+
+        try:
+            key = self._persistent_cache_key(cache, expr)
+        except TypeError:
+            # the expression contains values that can't be fingerprinted
+            key = None
+
+        if key is None:
+            self._load_into_cache(name, expr)
+            return
+
+        if (data := cache.get(key)) is not None:
+            self._load_into_cache(name, ibis.memtable(data, schema=expr.schema()))
+        else:
+            self._load_into_cache(name, expr)
+            op = self._query_cache.lookup(name)
+            cache.store(key, op.to_expr().to_pyarrow())
+
     def _load_into_cache(self, name, expr):
         raise NotImplementedError(self.name)
 
@@ -1255,6 +1550,11 @@ class BaseBackend(abc.ABC, _FileIOHandler):
         return query
 
 
+@tokenize.register(BaseBackend)
+def _tokenize_backend(backend: BaseBackend) -> bytes:
+    return tokenize(backend.db_identity)
+
+
 @functools.cache
 def _get_backend_names() -> frozenset[str]:
     """Return the set of known backend names.
@@ -1266,6 +1566,7 @@ def _get_backend_names() -> frozenset[str]:
     If a `set` is used, then any in-place modifications to the set
     are visible to every caller of this function.
     """
+    import importlib.metadata
 
     if sys.version_info < (3, 10):
         entrypoints = importlib.metadata.entry_points()["ibis.backends"]
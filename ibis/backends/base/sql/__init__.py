@@ -3,12 +3,16 @@ from __future__ import annotations
 import abc
 import contextlib
 import os
-from functools import lru_cache
+import threading
+import time
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Any, Optional
 
 import toolz
 
 import ibis.common.exceptions as exc
+import ibis.config
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
@@ -17,7 +21,7 @@ from ibis.backends.base import BaseBackend
 from ibis.backends.base.sql.compiler import Compiler
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Hashable, Iterator, Mapping
 
     import pandas as pd
     import pyarrow as pa
@@ -25,11 +29,57 @@ if TYPE_CHECKING:
 __all__ = ["BaseSQLBackend"]
 
 
+def _native_arrow_batches(cursor) -> Iterator[pa.RecordBatch] | None:
+    """Return an iterator of record batches if the driver can fetch Arrow data.
+
+    Returns `None` if `cursor` doesn't support fetching Arrow data natively.
+    """
+    import pyarrow as pa
+
+    # unwrap SQLAlchemy results to get at the DBAPI cursor
+    cursor = getattr(cursor, "cursor", cursor)
+
+    # ADBC and DuckDB
+    if (fetch_record_batch := getattr(cursor, "fetch_record_batch", None)) is not None:
+        return iter(fetch_record_batch())
+    # Snowflake
+    elif (
+        fetch_arrow_batches := getattr(cursor, "fetch_arrow_batches", None)
+    ) is not None:
+        return (
+            batch
+            for table in fetch_arrow_batches()
+            for batch in pa.table(table).to_batches()
+        )
+    return None
+
+
+def _rows_to_record_batch(rows: list, schema: pa.Schema) -> pa.RecordBatch:
+    """Convert a list of rows into a record batch with the given schema.
+
+    Rows are transposed into columns so that each column is converted
+    directly to an array of its target type.
+    """
+    import pyarrow as pa
+
+    columns = zip(*rows)
+    arrays = [
+        pa.array(column, type=field.type) for column, field in zip(columns, schema)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
 class BaseSQLBackend(BaseBackend):
     """Base backend class for backends that compile to SQL."""
 
     compiler = Compiler
 
+    # maximum number of compiled queries kept around per backend instance
+    compile_cache_size = 256
+    # number of seconds the schemas of tables and SQL queries are cached for,
+    # `None` keeps them until they are invalidated and `0` disables caching
+    schema_cache_ttl: float | None = 0
+
     @property
     def _sqlglot_dialect(self) -> str:
         return self.name
@@ -89,7 +139,9 @@ class BaseSQLBackend(BaseBackend):
                 f"`database` must be a string; got {type(database)}"
             )
         qualified_name = self._fully_qualified_name(name, database)
-        schema = self.get_schema(qualified_name)
+        schema = self._cached_schema(
+            ("table", name, database), lambda: self.get_schema(qualified_name)
+        )
         node = ops.DatabaseTable(
             name, schema, self, namespace=ops.Namespace(database=database)
         )
@@ -122,7 +174,9 @@ class BaseSQLBackend(BaseBackend):
         """
         query = self._transpile_sql(query, dialect=dialect)
         if schema is None:
-            schema = self._get_schema_using_query(query)
+            schema = self._cached_schema(
+                ("query", query), lambda: self._get_schema_using_query(query)
+            )
         else:
             schema = sch.schema(schema)
         return ops.SQLQueryResult(query, schema, self).to_expr()
@@ -130,6 +184,67 @@ class BaseSQLBackend(BaseBackend):
     def _get_schema_using_query(self, query):
         raise NotImplementedError(f"Backend {self.name} does not support .sql()")
 
+    @cached_property
+    def _schema_cache(self) -> dict[Hashable, tuple[Any, float]]:
+        return {}
+
+    @cached_property
+    def _schema_cache_lock(self) -> threading.Lock:
+        return threading.Lock()
+
+    def _cached_schema(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the catalog information stored under `key`.
+
+        The information is fetched with `fetch` if it isn't cached or the
+        cached value is older than `schema_cache_ttl` seconds. Keys are tuples
+        whose first element is either `"table"`, followed by the table name
+        and its namespace, or `"query"`, followed by the SQL query.
+        """
+        if (ttl := self.schema_cache_ttl) == 0:
+            return fetch()
+
+        cache = self._schema_cache
+        lock = self._schema_cache_lock
+        now = time.monotonic()
+        with lock:
+            entry = cache.get(key)
+        if entry is not None:
+            value, fetched_at = entry
+            if ttl is None or now - fetched_at < ttl:
+                return value
+
+        value = fetch()
+        with lock:
+            if ttl is not None:
+                # drop expired entries so that the cache doesn't grow unbounded
+                for expired in [k for k, (_, t) in cache.items() if now - t >= ttl]:
+                    del cache[expired]
+            cache[key] = value, now
+        return value
+
+    def invalidate_schema(self, name: str | None = None) -> None:
+        """Remove cached table and query schemas.
+
+        Schemas are only cached if `schema_cache_ttl` is set. Creating,
+        dropping or renaming tables and views through the backend invalidates
+        their schemas automatically, changes made by other means are picked
+        up once the cached schemas expire or after calling this method.
+
+        Parameters
+        ----------
+        name
+            Name of the table or view whose schema to remove from the cache,
+            in any database. The schemas of SQL queries, which may depend on
+            the table, are removed as well. If `None`, the cache is cleared.
+        """
+        cache = self._schema_cache
+        with self._schema_cache_lock:
+            if name is None:
+                cache.clear()
+            else:
+                for key in [k for k in cache if k[0] == "query" or k[1] == name]:
+                    del cache[key]
+
     def raw_sql(self, query: str):
         """Execute a query string and return the cursor used for execution.
 
@@ -188,20 +303,37 @@ class BaseSQLBackend(BaseBackend):
     def _safe_raw_sql(self, *args, **kwargs):
         yield self.raw_sql(*args, **kwargs)
 
-    def _cursor_batches(
+    def _fetch_rows(self, cursor, chunk_size: int) -> Iterator[list]:
+        """Yield lists of at most `chunk_size` rows from `cursor`."""
+        while batch := cursor.fetchmany(chunk_size):
+            yield batch
+
+    def _record_batches(
         self,
         expr: ir.Expr,
+        *,
+        schema: sch.Schema,
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: int | str | None = None,
         chunk_size: int = 1_000_000,
-    ) -> Iterable[list]:
+    ) -> Iterator[pa.RecordBatch]:
+        import pyarrow as pa
+
+        from ibis.formats.pyarrow import PyArrowData
+
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        sql = self._compile_query(expr, limit=limit, params=params)
+        arrow_schema = schema.to_pyarrow()
 
         with self._safe_raw_sql(sql) as cursor:
-            while batch := cursor.fetchmany(chunk_size):
-                yield batch
+            if (native := _native_arrow_batches(cursor)) is not None:
+                for batch in native:
+                    table = pa.Table.from_batches([batch])
+                    table = PyArrowData.convert_table(table, schema)
+                    yield from table.to_batches(max_chunksize=chunk_size)
+            else:
+                for rows in self._fetch_rows(cursor, chunk_size):
+                    yield _rows_to_record_batch(rows, arrow_schema)
 
     @util.experimental
     def to_pyarrow_batches(
@@ -238,15 +370,9 @@ class BaseSQLBackend(BaseBackend):
         pa = self._import_pyarrow()
 
         schema = expr.as_table().schema()
-        array_type = schema.as_struct().to_pyarrow()
-        arrays = (
-            pa.array(map(tuple, batch), type=array_type)
-            for batch in self._cursor_batches(
-                expr, params=params, limit=limit, chunk_size=chunk_size
-            )
+        batches = self._record_batches(
+            expr, schema=schema, params=params, limit=limit, chunk_size=chunk_size
         )
-        batches = map(pa.RecordBatch.from_struct_array, arrays)
-
         return pa.ipc.RecordBatchReader.from_batches(schema.to_pyarrow(), batches)
 
     def _register_udfs(self, expr: ir.Expr) -> None:
@@ -333,8 +459,7 @@ class BaseSQLBackend(BaseBackend):
         self._run_pre_execute_hooks(expr)
 
         kwargs.pop("timecontext", None)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        sql = self._compile_query(expr, limit=limit, params=params)
         self._log(sql)
 
         schema = expr.as_table().schema()
@@ -348,9 +473,14 @@ class BaseSQLBackend(BaseBackend):
         raise NotImplementedError(self.name)
 
     def _register_in_memory_tables(self, expr: ir.Expr) -> None:
-        if self.compiler.cheap_in_memory_tables:
+        compiler = self.compiler
+        if (
+            compiler.cheap_in_memory_tables
+            or compiler.in_memory_table_registration_threshold is not None
+        ):
             for memtable in expr.op().find(ops.InMemoryTable):
-                self._register_in_memory_table(memtable)
+                if compiler.registers_in_memory_table(memtable):
+                    self._register_in_memory_table(memtable)
 
     @abc.abstractmethod
     def fetch_from_cursor(self, cursor, schema):
@@ -391,8 +521,73 @@ class BaseSQLBackend(BaseBackend):
             The output of compilation. The type of this value depends on the
             backend.
         """
+        return self._compile_query(expr, limit=limit, params=params)
+
+    @cached_property
+    def _compiled_queries(self) -> OrderedDict:
+        return OrderedDict()
+
+    @cached_property
+    def _compiled_queries_lock(self) -> threading.Lock:
+        return threading.Lock()
+
+    def _compile_query(
+        self,
+        expr: ir.Expr,
+        limit: int | str | None = None,
+        params: Mapping[ir.Expr, Any] | None = None,
+    ) -> Any:
+        """Compile `expr`, reusing the result of a previous identical compilation.
+
+        Compiled queries are kept in a per-backend LRU cache of at most
+        `compile_cache_size` entries, keyed on the expression, the limit and
+        the parameters' values and their types. Parameter values are inlined
+        into the query by the translators, so queries that only differ in
+        their parameter values are compiled separately. Expressions containing
+        in-memory tables aren't cached, so that the cache doesn't keep their
+        data alive.
+        """
+        if limit == "default":
+            default_limit = ibis.config.options.sql.default_limit
+        else:
+            default_limit = None
+
+        if params:
+            params_key = tuple(
+                (param.op(), type(value), value) for param, value in params.items()
+            )
+        else:
+            params_key = ()
+
+        op = expr.op()
+        key = (op, limit, default_limit, params_key)
+        if op.find(ops.InMemoryTable):
+            key = None
+        else:
+            try:
+                hash(key)
+            except TypeError:
+                # unhashable parameter values, e.g., lists
+                key = None
+
+        cache = self._compiled_queries
+        lock = self._compiled_queries_lock
+        if key is not None:
+            with lock:
+                if (query := cache.get(key)) is not None:
+                    cache.move_to_end(key)
+                    return query
+
         self._define_udf_translation_rules(expr)
-        return self.compiler.to_ast_ensure_limit(expr, limit, params=params).compile()
+        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
+        query = query_ast.compile()
+
+        if key is not None and self.compile_cache_size:
+            with lock:
+                cache[key] = query
+                while len(cache) > self.compile_cache_size:
+                    cache.popitem(last=False)
+        return query
 
     def _to_sql(self, expr: ir.Expr, **kwargs) -> str:
         return str(self.compile(expr, **kwargs))
@@ -123,6 +123,8 @@ class BaseAlchemyBackend(BaseSQLBackend):
     compiler = AlchemyCompiler
     supports_temporary_tables = True
     _temporary_prefix = "TEMPORARY"
+    # number of rows sent to the database per bulk insert statement
+    insert_batch_size = 10_000
 
     def _scalar_query(self, query):
         method = "exec_driver_sql" if isinstance(query, str) else "execute"
@@ -168,6 +170,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         self._inspector = None
         self._schemas: dict[str, sch.Schema] = {}
         self._temp_views: set[str] = set()
+        self._registered_in_memory_tables: set[str] = set()
 
     @property
     def version(self):
@@ -254,6 +257,20 @@ class BaseAlchemyBackend(BaseSQLBackend):
         with self.begin() as bind:
             tmptable.drop(bind=bind)
 
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+        # upload the data into a temporary table once, using the backend's
+        # bulk insert path, instead of compiling it into every query
+        if (name := op.name) in self._registered_in_memory_tables:
+            return
+
+        table = self._table_from_schema(name, op.schema, temp=True)
+        data = op.data.to_pyarrow(op.schema)
+        with self.begin() as bind:
+            table.create(bind=bind)
+            if data.num_rows:
+                self._bulk_insert(bind, table, data)
+        self._registered_in_memory_tables.add(name)
+
     def create_table(
         self,
         name: str,
@@ -382,6 +399,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
                 if overwrite:
                     table.drop(bind=bind, checkfirst=True)
                 table.create(bind=bind)
+        self.invalidate_schema(name)
         return self.table(name, database=database)
 
     def _get_insert_method(self, expr):
@@ -462,6 +480,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         )
         with self.begin() as bind:
             t.drop(bind=bind, checkfirst=force)
+        self.invalidate_schema(name)
 
         qualified_name = self._fully_qualified_name(name, database)
 
@@ -532,6 +551,18 @@ class BaseAlchemyBackend(BaseSQLBackend):
                 return table
             return self._handle_failed_column_type_inference(table, nulltype_cols)
 
+    def _get_cached_sqla_table(
+        self,
+        name: str,
+        *,
+        namespace: ops.Namespace = ops.Namespace(),  # noqa: B008
+    ) -> sa.Table:
+        """Reflect the table `name`, reusing tables cached by `_cached_schema`."""
+        return self._cached_schema(
+            ("table", name, namespace.database, namespace.schema),
+            lambda: self._get_sqla_table(name, namespace=namespace),
+        )
+
     # TODO(kszucs): remove the schema parameter
     @classmethod
     def _schema_from_sqla_table(
@@ -685,7 +716,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         """
         namespace = ops.Namespace(schema=schema, database=database)
 
-        sqla_table = self._get_sqla_table(name, namespace=namespace)
+        sqla_table = self._get_cached_sqla_table(name, namespace=namespace)
 
         schema = self._schema_from_sqla_table(
             sqla_table, schema=self._schemas.get(name)
@@ -698,18 +729,48 @@ class BaseAlchemyBackend(BaseSQLBackend):
     def _insert_dataframe(
         self, table_name: str, df: pd.DataFrame, overwrite: bool
     ) -> None:
+        import pyarrow as pa
+
+        try:
+            data = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # columns of mixed python objects can't be converted to arrow, let
+            # the driver deal with them
+            namespace = ops.Namespace(schema=self._current_schema)
+            t = self._get_sqla_table(table_name, namespace=namespace)
+            with self.con.begin() as con:
+                if overwrite:
+                    con.execute(t.delete())
+                con.execute(t.insert(), df.to_dict(orient="records"))
+        else:
+            self._insert_arrow(table_name, data, overwrite=overwrite)
+
+    def _insert_arrow(self, table_name: str, data: pa.Table, overwrite: bool) -> None:
         namespace = ops.Namespace(schema=self._current_schema)
 
         t = self._get_sqla_table(table_name, namespace=namespace)
         with self.con.begin() as con:
             if overwrite:
                 con.execute(t.delete())
-            con.execute(t.insert(), df.to_dict(orient="records"))
+            if data.num_rows:
+                self._bulk_insert(con, t, data)
+
+    def _bulk_insert(self, con, table: sa.Table, data: pa.Table) -> None:
+        """Insert the rows of `data` into `table` using the connection `con`.
+
+        `con` has an open transaction. Backends with a native bulk loading
+        mechanism should override this method; the default implementation
+        issues one `executemany` per `insert_batch_size` rows, so that only a
+        single batch is ever materialized as python objects.
+        """
+        stmt = table.insert()
+        for batch in data.to_batches(max_chunksize=self.insert_batch_size):
+            con.execute(stmt, batch.to_pylist())
 
     def insert(
         self,
         table_name: str,
-        obj: pd.DataFrame | ir.Table | list | dict,
+        obj: pd.DataFrame | pa.Table | ir.Table | list | dict,
         database: str | None = None,
         overwrite: bool = False,
     ) -> None:
@@ -735,6 +796,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         """
 
         import pandas as pd
+        import pyarrow as pa
 
         if database == self.current_database:
             # avoid fully qualified name
@@ -746,13 +808,15 @@ class BaseAlchemyBackend(BaseSQLBackend):
                 "yet implemented"
             )
 
-        # If we've been passed a `memtable`, pull out the underlying dataframe
+        # If we've been passed a `memtable`, pull out the underlying data
         if isinstance(obj, ir.Table) and isinstance(
             in_mem_table := obj.op(), ops.InMemoryTable
         ):
-            obj = in_mem_table.data.to_frame()
+            obj = in_mem_table.data.to_pyarrow(in_mem_table.schema)
 
-        if isinstance(obj, pd.DataFrame):
+        if isinstance(obj, pa.Table):
+            self._insert_arrow(table_name, obj, overwrite=overwrite)
+        elif isinstance(obj, pd.DataFrame):
             self._insert_dataframe(table_name, obj, overwrite=overwrite)
         elif isinstance(obj, ir.Table):
             to_table_expr = self.table(table_name)
@@ -788,7 +852,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         else:
             raise ValueError(
                 "No operation is being performed. Either the obj parameter "
-                "is not a pandas DataFrame or is not a ibis Table."
+                "is not a pandas DataFrame, a pyarrow Table or an ibis Table."
                 f"The given obj is of type {type(obj).__name__} ."
             )
 
@@ -896,6 +960,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
             raise ValueError(f"{raw_name} already exists as a table or view")
         name = self._quote(raw_name)
         self._execute_view_creation(name, definition)
+        self.invalidate_schema(raw_name)
         self._temp_views.add(raw_name)
         self._register_temp_view_cleanup(name, raw_name)
 
@@ -929,7 +994,13 @@ class BaseAlchemyBackend(BaseSQLBackend):
     ) -> ir.Table:
         from sqlalchemy_views import CreateView
 
-        source = self.compile(obj)
+        self._run_pre_execute_hooks(obj)
+
+        # the view outlives the temporary tables that large in-memory tables
+        # are uploaded into, so compile their data into its definition
+        context = self.compiler.make_context()
+        context.inline_in_memory_tables = True
+        source = self.compiler.to_ast(obj, context).compile()
         view = CreateView(
             sa.Table(
                 name,
@@ -942,6 +1013,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         )
         with self.begin() as con:
             con.execute(view)
+        self.invalidate_schema(name)
         return self.table(name, database=database)
 
     def drop_view(
@@ -961,6 +1033,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
 
         with self.begin() as con:
             con.execute(view)
+        self.invalidate_schema(name)
 
 
 class AlchemyCrossSchemaBackend(BaseAlchemyBackend):
@@ -1040,6 +1113,7 @@ class AlchemyCrossSchemaBackend(BaseAlchemyBackend):
         drop_table_sql = drop_table.sql(dialect=self.name)
         with self.begin() as con:
             con.exec_driver_sql(drop_table_sql)
+        self.invalidate_schema(name)
 
 
 @compiles(sa.Table, "trino", "duckdb")
@@ -22,6 +22,9 @@ from ibis.backends.base.sql.compiler import (
     TableSetFormatter,
 )
 from ibis.backends.base.sql.compiler.base import SetOp
+from ibis.backends.base.sql.compiler.query_builder import (
+    translate_in_memory_table_rows,
+)
 
 
 class _AlchemyTableSetFormatter(TableSetFormatter):
@@ -96,7 +99,7 @@ class _AlchemyTableSetFormatter(TableSetFormatter):
 
         if isinstance(op, ops.DatabaseTable):
             namespace = op.namespace
-            result = op.source._get_sqla_table(op.name, namespace=namespace)
+            result = op.source._get_cached_sqla_table(op.name, namespace=namespace)
         elif isinstance(op, ops.UnboundTable):
             # use SQLAlchemy's TableClause for unbound tables
             name = op.name
@@ -169,7 +172,7 @@ class _AlchemyTableSetFormatter(TableSetFormatter):
 
     def _format_in_memory_table(self, op, translator):
         columns = translator._schema_to_sqlalchemy_columns(op.schema)
-        if self.context.compiler.cheap_in_memory_tables:
+        if self.context.registers_in_memory_table(op):
             result = sa.Table(
                 op.name,
                 sa.MetaData(),
@@ -187,15 +190,20 @@ class _AlchemyTableSetFormatter(TableSetFormatter):
             rows = list(op.data.to_frame().itertuples(index=False))
             result = sa.values(*columns, name=op.name).data(rows).select().subquery()
         else:
-            raw_rows = (
-                sa.select(
-                    *(
-                        translator.translate(ops.Literal(val, dtype=type_)).label(name)
-                        for val, (name, type_) in zip(row, op.schema.items())
-                    )
-                )
-                for row in op.data.to_frame().itertuples(index=False)
-            )
+            names = op.schema.names
+            raw_rows = [
+                sa.select(*(literal.label(name) for literal, name in zip(row, names)))
+                for row in translate_in_memory_table_rows(op, translator.translate)
+            ]
+            size = self.context.compiler.in_memory_table_registration_threshold
+            if size is not None and len(raw_rows) > size:
+                # tables this large are only inlined into view definitions,
+                # split them so that no compound SELECT gets larger than
+                # those the backend inlines into queries
+                raw_rows = [
+                    sa.select(sa.union_all(*chunk).subquery())
+                    for chunk in toolz.partition_all(size, raw_rows)
+                ]
             result = sa.union_all(*raw_rows).alias(op.name)
         return result
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from io import StringIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import sqlglot as sg
 import toolz
@@ -19,7 +19,39 @@ from ibis.config import options
 from ibis.expr.rewrites import rewrite_dropna, rewrite_fillna
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
+
+
+def translate_in_memory_table_rows(
+    op: ops.InMemoryTable, translate: Callable[[ops.Literal], Any]
+) -> list[tuple]:
+    """Translate the values of `op` into literals, one column at a time.
+
+    Every distinct value of a column is only translated once.
+    """
+    df = op.data.to_frame()
+    columns = []
+    for name, dtype in op.schema.items():
+        literals = {}
+        column = []
+        for value in df[name]:
+            try:
+                hash(value)
+            except TypeError:
+                # unhashable values, e.g., arrays
+                column.append(translate(ops.Literal(value, dtype=dtype)))
+                continue
+            # key on the representation rather than on equality, so that e.g.
+            # `1` and `True`, `0.0` and `-0.0` or `Decimal("1.0")` and
+            # `Decimal("1.00")` aren't conflated
+            key = type(value), repr(value)
+            try:
+                literal = literals[key]
+            except KeyError:
+                literal = literals[key] = translate(ops.Literal(value, dtype=dtype))
+            column.append(literal)
+        columns.append(column)
+    return list(zip(*columns))
 
 
 class TableSetFormatter:
@@ -77,19 +109,14 @@ class TableSetFormatter:
         return quote_identifier(name)
 
     def _format_in_memory_table(self, op):
-        if self.context.compiler.cheap_in_memory_tables:
+        if self.context.registers_in_memory_table(op):
             return op.name
 
-        names = op.schema.names
-        raw_rows = []
-        for row in op.data.to_frame().itertuples(index=False):
-            raw_row = []
-            for val, name in zip(row, names):
-                lit = ops.Literal(val, dtype=op.schema[name])
-                raw_row.append(
-                    f"{self._translate(lit)} AS {self._quote_identifier(name)}"
-                )
-            raw_rows.append(", ".join(raw_row))
+        names = list(map(self._quote_identifier, op.schema.names))
+        raw_rows = [
+            ", ".join(f"{literal} AS {name}" for literal, name in zip(row, names))
+            for row in translate_in_memory_table_rows(op, self._translate)
+        ]
 
         if self.context.compiler.support_values_syntax_in_select:
             rows = ", ".join(f"({raw_row})" for raw_row in raw_rows)
@@ -526,11 +553,24 @@ class Compiler:
     difference_class = Difference
 
     cheap_in_memory_tables = False
+    # in-memory tables with more rows than this are registered with the
+    # backend and referenced by name even if they aren't cheap to register,
+    # instead of being compiled into the query as literals; `None` disables
+    # registering them
+    in_memory_table_registration_threshold: int | None = None
     support_values_syntax_in_select = True
     null_limit = None
 
     rewrites = rewrite_fillna | rewrite_dropna
 
+    @classmethod
+    def registers_in_memory_table(cls, op: ops.InMemoryTable) -> bool:
+        """Whether `op` is registered with the backend and referenced by name."""
+        if cls.cheap_in_memory_tables:
+            return True
+        threshold = cls.in_memory_table_registration_threshold
+        return threshold is not None and len(op.data) > threshold
+
     @classmethod
     def make_context(cls, params=None):
         params = params or {}
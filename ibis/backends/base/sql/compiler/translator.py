@@ -31,6 +31,10 @@ class QueryContext:
         self.query = None
         self.params = params if params is not None else {}
         self._alias_counter = getattr(parent, "_alias_counter", 0)
+        # compile in-memory tables into the query even if the backend would
+        # otherwise register them, e.g., for view definitions that must not
+        # depend on temporary tables
+        self.inline_in_memory_tables = getattr(parent, "inline_in_memory_tables", False)
 
     def _compile_subquery(self, op):
         sub_ctx = self.subcontext()
@@ -139,6 +143,15 @@ class QueryContext:
             params=self.params,
         )
 
+    def registers_in_memory_table(self, op: ops.InMemoryTable) -> bool:
+        """Whether `op` is referenced by name instead of compiled inline."""
+        if self.compiler.cheap_in_memory_tables:
+            return True
+        return (
+            not self.inline_in_memory_tables
+            and self.compiler.registers_in_memory_table(op)
+        )
+
     # Maybe temporary hacks for correlated / uncorrelated subqueries
 
     def set_query(self, query):
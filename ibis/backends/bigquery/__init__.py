@@ -30,6 +30,7 @@ from ibis.backends.bigquery.client import (
     BigQueryCursor,
     bigquery_param,
     parse_project_and_dataset,
+    read_table_batches,
     rename_partitioned_column,
     schema_from_bigquery_table,
 )
@@ -40,7 +41,7 @@ with contextlib.suppress(ImportError):
     from ibis.backends.bigquery.udf import udf  # noqa: F401
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterable, Iterator, Mapping
     from pathlib import Path
 
     import pyarrow as pa
@@ -93,6 +94,12 @@ def _anonymous_unnest_to_explode(node: sg.exp.Expression):
     return node
 
 
+def _is_ordered(sql: str) -> bool:
+    """Check whether the last statement of `sql` is an ordered query."""
+    *_, query = sg.parse(sql, read="bigquery")
+    return query is not None and query.args.get("order") is not None
+
+
 _MEMTABLE_PATTERN = re.compile(r"^_?ibis_(?:pandas|pyarrow)_memtable_[a-z0-9]{26}$")
 
 
@@ -114,6 +121,7 @@ class Backend(BaseSQLBackend, CanCreateSchema):
     compiler = BigQueryCompiler
     supports_in_memory_tables = True
     supports_python_udfs = False
+    supports_concurrent_execution = True
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -535,11 +543,14 @@ class Backend(BaseSQLBackend, CanCreateSchema):
 
         project, dataset = self._parse_project_and_dataset(database)
 
-        bq_table = self.client.get_table(
-            bq.TableReference(
-                bq.DatasetReference(project=project, dataset_id=dataset),
-                table.name,
-            )
+        bq_table = self._cached_schema(
+            ("table", table.name, project, dataset),
+            lambda: self.client.get_table(
+                bq.TableReference(
+                    bq.DatasetReference(project=project, dataset_id=dataset),
+                    table.name,
+                )
+            ),
         )
 
         node = ops.DatabaseTable(
@@ -567,6 +578,15 @@ class Backend(BaseSQLBackend, CanCreateSchema):
                 dataset_id=query.destination.dataset_id,
             )
 
+    def _execute_many(self, method, exprs, max_concurrency, **kwargs):
+        # create the session dataset and register the in-memory tables upfront
+        # instead of racing to create them from the worker threads
+        self._make_session()
+        exprs = list(exprs)
+        for expr in exprs:
+            self._run_pre_execute_hooks(expr)
+        return super()._execute_many(method, exprs, max_concurrency, **kwargs)
+
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         self._make_session()
 
@@ -731,20 +751,93 @@ class Backend(BaseSQLBackend, CanCreateSchema):
             query_result._project = orig_project
         return arrow_obj
 
+    def _read_arrow_batches(
+        self,
+        cursor,
+        schema: sch.Schema,
+        *,
+        chunk_size: int | None = None,
+        max_stream_count: int = 0,
+        preserve_order: bool | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        import pyarrow as pa
+
+        from ibis.formats.pyarrow import PyArrowData
+
+        query = cursor.query
+        if (destination := query.destination) is None:
+            # e.g. scripts don't have a single destination table to read from
+            batches = self._cursor_to_arrow(
+                cursor,
+                method=lambda result: result.to_arrow_iterable(
+                    bqstorage_client=self.storage_client
+                ),
+                chunk_size=chunk_size,
+            )
+        else:
+            if preserve_order is None:
+                preserve_order = _is_ordered(query.query)
+            # the rows are only ordered within each stream, so read a single
+            # stream if the order of the result matters
+            batches = read_table_batches(
+                self.storage_client,
+                destination,
+                parent=f"projects/{self.billing_project}",
+                max_stream_count=1 if preserve_order else max_stream_count,
+            )
+
+        for batch in batches:
+            table = PyArrowData.convert_table(pa.Table.from_batches([batch]), schema)
+            yield from table.to_batches()
+
     def to_pyarrow(
         self,
         expr: ir.Expr,
         *,
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: int | str | None = None,
+        max_stream_count: int = 0,
+        preserve_order: bool | None = None,
         **kwargs: Any,
     ) -> pa.Table:
-        self._import_pyarrow()
+        """Execute expression and return results in as a pyarrow table.
+
+        The result is downloaded through the BigQuery Storage Read API, reading
+        multiple streams in parallel.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        max_stream_count
+            Maximum number of streams to read in parallel, the default lets
+            the server decide.
+        preserve_order
+            Read the result using a single stream to preserve the order of the
+            rows. By default the order is preserved if the query is ordered.
+        kwargs
+            Keyword arguments
+        """
+        pa = self._import_pyarrow()
         self._register_in_memory_tables(expr)
         sql = self.compile(expr, limit=limit, params=params, **kwargs)
         self._log(sql)
         cursor = self.raw_sql(sql, params=params, **kwargs)
-        table = self._cursor_to_arrow(cursor)
+        schema = expr.as_table().schema()
+        table = pa.Table.from_batches(
+            self._read_arrow_batches(
+                cursor,
+                schema,
+                max_stream_count=max_stream_count,
+                preserve_order=preserve_order,
+            ),
+            schema=schema.to_pyarrow(),
+        )
         return expr.__pyarrow_result__(table)
 
     def to_pyarrow_batches(
@@ -754,8 +847,38 @@ class Backend(BaseSQLBackend, CanCreateSchema):
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: int | str | None = None,
         chunk_size: int = 1_000_000,
+        max_stream_count: int = 0,
+        preserve_order: bool | None = None,
         **kwargs: Any,
     ):
+        """Execute expression and return a RecordBatchReader.
+
+        The batches are downloaded through the BigQuery Storage Read API,
+        reading multiple streams in parallel and yielding the batches as they
+        arrive.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        chunk_size
+            Maximum number of rows in each returned record batch. Only used if
+            the result can't be read through the Storage Read API, otherwise
+            the size of the batches is determined by the server.
+        max_stream_count
+            Maximum number of streams to read in parallel, the default lets
+            the server decide.
+        preserve_order
+            Read the result using a single stream to preserve the order of the
+            rows. By default the order is preserved if the query is ordered.
+        kwargs
+            Keyword arguments
+        """
         pa = self._import_pyarrow()
 
         schema = expr.as_table().schema()
@@ -764,14 +887,14 @@ class Backend(BaseSQLBackend, CanCreateSchema):
         sql = self.compile(expr, limit=limit, params=params, **kwargs)
         self._log(sql)
         cursor = self.raw_sql(sql, params=params, **kwargs)
-        batch_iter = self._cursor_to_arrow(
+        batches = self._read_arrow_batches(
             cursor,
-            method=lambda result: result.to_arrow_iterable(
-                bqstorage_client=self.storage_client
-            ),
+            schema,
             chunk_size=chunk_size,
+            max_stream_count=max_stream_count,
+            preserve_order=preserve_order,
         )
-        return pa.RecordBatchReader.from_batches(schema.to_pyarrow(), batch_iter)
+        return pa.RecordBatchReader.from_batches(schema.to_pyarrow(), batches)
 
     def _gen_udf_name(self, name: str, schema: Optional[str]) -> str:
         func = ".".join(filter(None, (schema, name)))
@@ -996,6 +1119,7 @@ class Backend(BaseSQLBackend, CanCreateSchema):
         sql = stmt.sql(self.name)
 
         self.raw_sql(sql)
+        self.invalidate_schema(table.name)
         return self.table(table.name, schema=table.db, database=table.catalog)
 
     def drop_table(
@@ -1016,6 +1140,7 @@ class Backend(BaseSQLBackend, CanCreateSchema):
             exists=force,
         )
         self.raw_sql(stmt.sql(self.name))
+        self.invalidate_schema(name)
 
     def create_view(
         self,
@@ -1038,6 +1163,7 @@ class Backend(BaseSQLBackend, CanCreateSchema):
         )
         self._register_in_memory_tables(obj)
         self.raw_sql(stmt.sql(self.name))
+        self.invalidate_schema(name)
         return self.table(name, schema=schema, database=database)
 
     def drop_view(
@@ -1058,6 +1184,7 @@ class Backend(BaseSQLBackend, CanCreateSchema):
             exists=force,
         )
         self.raw_sql(stmt.sql(self.name))
+        self.invalidate_schema(name)
 
     def _load_into_cache(self, name, expr):
         self.create_table(name, expr, schema=expr.schema(), temp=True)
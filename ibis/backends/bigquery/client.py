@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import functools
+from typing import TYPE_CHECKING
 
 import google.cloud.bigquery as bq
+import google.cloud.bigquery_storage_v1 as bqstorage
 import pandas as pd
 
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
+from ibis import util
 from ibis.backends.bigquery.datatypes import BigQuerySchema, BigQueryType
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pyarrow as pa
+
 NATIVE_PARTITION_COL = "_PARTITIONTIME"
 
 
@@ -65,6 +73,55 @@ class BigQueryCursor:
         """No-op for compatibility."""
 
 
+def read_table_batches(
+    storage_client: bqstorage.BigQueryReadClient,
+    table: bq.TableReference,
+    *,
+    parent: str,
+    max_stream_count: int = 0,
+    max_queue_size: int = 8,
+) -> Iterator[pa.RecordBatch]:
+    """Read a table as Arrow record batches using the BigQuery Storage Read API.
+
+    The read session is split into at most `max_stream_count` streams, zero
+    lets the server decide. The streams are read concurrently and their
+    batches are yielded as soon as they arrive, so the order of the rows is
+    only preserved when reading a single stream.
+
+    Parameters
+    ----------
+    storage_client
+        The BigQuery Storage API client.
+    table
+        The table to read, usually the destination table of a query job.
+    parent
+        The project creating the read session, e.g. `projects/my-project`.
+    max_stream_count
+        Maximum number of streams to read in parallel.
+    max_queue_size
+        Maximum number of batches buffered ahead of the consumer.
+    """
+    requested_session = bqstorage.types.ReadSession(
+        table=f"projects/{table.project}/datasets/{table.dataset_id}/tables/{table.table_id}",
+        data_format=bqstorage.types.DataFormat.ARROW,
+    )
+    session = storage_client.create_read_session(
+        parent=parent,
+        read_session=requested_session,
+        max_stream_count=max_stream_count,
+    )
+
+    def read_stream(stream):
+        for page in storage_client.read_rows(stream.name).rows(session).pages:
+            yield page.to_arrow()
+
+    streams = [read_stream(stream) for stream in session.streams]
+    if len(streams) == 1:
+        yield from streams[0]
+    else:
+        yield from util.merge_threaded(streams, maxsize=max_queue_size)
+
+
 @functools.singledispatch
 def bigquery_param(dtype, value, name):
     raise NotADirectoryError(dtype)
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+
+import google.cloud.bigquery as bq
+import pyarrow as pa
 import pytest
 
 from ibis.backends.bigquery import client
@@ -30,3 +34,73 @@ def test_parse_project_and_dataset_raises_error():
     expected_message = "data-project.my_dataset.table is not a BigQuery dataset"
     with pytest.raises(ValueError, match=expected_message):
         client.parse_project_and_dataset("my-project", "data-project.my_dataset.table")
+
+
+class FakeStorageClient:
+    """Serve the batches of every stream from memory."""
+
+    def __init__(self, streams):
+        self.streams = streams
+        self.sessions = []
+
+    def create_read_session(self, *, parent, read_session, max_stream_count):
+        self.sessions.append((parent, read_session.table, max_stream_count))
+        names = list(self.streams)
+        if max_stream_count == 1:
+            # the server assigns all the rows to the single stream
+            self.streams = {"all": [b for name in names for b in self.streams[name]]}
+            names = ["all"]
+        return SimpleNamespace(streams=[SimpleNamespace(name=name) for name in names])
+
+    def read_rows(self, name):
+        batches = self.streams[name]
+
+        def rows(session):
+            pages = [SimpleNamespace(to_arrow=lambda b=b: b) for b in batches]
+            return SimpleNamespace(pages=pages)
+
+        return SimpleNamespace(rows=rows)
+
+
+def make_batch(*values):
+    return pa.RecordBatch.from_pydict({"a": list(values)})
+
+
+def test_read_table_batches():
+    streams = {
+        "s0": [make_batch(1, 2), make_batch(3)],
+        "s1": [make_batch(4), make_batch(5, 6)],
+        "s2": [],
+    }
+    storage_client = FakeStorageClient(streams)
+    table = bq.TableReference.from_string("my-project.my_dataset.my_table")
+
+    batches = list(
+        client.read_table_batches(
+            storage_client, table, parent="projects/billing-project"
+        )
+    )
+
+    assert storage_client.sessions == [
+        (
+            "projects/billing-project",
+            "projects/my-project/datasets/my_dataset/tables/my_table",
+            0,
+        )
+    ]
+    values = [batch["a"].to_pylist() for batch in batches]
+    assert sorted(values) == [[1, 2], [3], [4], [5, 6]]
+    # batches of the same stream are yielded in order
+    assert values.index([1, 2]) < values.index([3])
+    assert values.index([4]) < values.index([5, 6])
+
+
+def test_read_table_batches_single_stream():
+    streams = {"s0": [make_batch(1, 2)], "s1": [make_batch(3)]}
+    storage_client = FakeStorageClient(streams)
+    table = bq.TableReference.from_string("my-project.my_dataset.my_table")
+
+    batches = client.read_table_batches(
+        storage_client, table, parent="projects/my-project", max_stream_count=1
+    )
+    assert [batch["a"].to_pylist() for batch in batches] == [[1, 2], [3]]
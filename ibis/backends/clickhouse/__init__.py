@@ -18,6 +18,7 @@ from clickhouse_connect.driver.external import ExternalData
 import ibis
 import ibis.common.exceptions as com
 import ibis.config
+import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
@@ -40,6 +41,53 @@ def _to_memtable(v):
     return ibis.memtable(v).op() if not isinstance(v, ops.InMemoryTable) else v
 
 
+def _supports_arrow_stream(dtype: dt.DataType) -> bool:
+    """Check whether values of `dtype` can be fetched in the ArrowStream format.
+
+    Only the types whose Arrow representation can be fixed up by
+    `_cast_arrow_array` are supported.
+    """
+    return (
+        dtype.is_numeric()
+        or dtype.is_boolean()
+        or dtype.is_string()
+        or dtype.is_date()
+        or dtype.is_timestamp()
+    )
+
+
+def _cast_arrow_array(array: pa.Array, to: pa.DataType) -> pa.Array:
+    """Cast an array produced by ClickHouse's ArrowStream format to `to`."""
+    if array.type == to:
+        return array
+    if pa.types.is_timestamp(to) and pa.types.is_integer(array.type):
+        # `DateTime` is sent as uint32 seconds since the epoch, which can't be
+        # cast to a timestamp directly
+        array = array.cast(pa.int64()).cast(pa.timestamp("s", tz=to.tz))
+    elif pa.types.is_date(to) and pa.types.is_integer(array.type):
+        # `Date` is sent as uint16 days since the epoch
+        array = array.cast(pa.int32()).cast(pa.date32())
+    return array.cast(to)
+
+
+def _can_cast_arrow_type(typ: pa.DataType, to: pa.DataType) -> bool:
+    """Check whether `_cast_arrow_array` can convert arrays of `typ` to `to`.
+
+    `Enum` columns are sent as their integer codes and `FixedString` columns
+    as fixed size binary, and neither can be decoded without the ClickHouse
+    column type.
+    """
+    if pa.types.is_string(to):
+        return (
+            pa.types.is_string(typ)
+            or pa.types.is_large_string(typ)
+            or pa.types.is_binary(typ)
+            or pa.types.is_large_binary(typ)
+            or pa.types.is_dictionary(typ)
+        )
+    return True
+
+
 class Backend(BaseBackend, CanCreateDatabase):
     name = "clickhouse"
 
@@ -260,18 +308,8 @@ class Backend(BaseBackend, CanCreateDatabase):
         external_tables: Mapping[str, Any] | None = None,
         **kwargs: Any,
     ):
-        # we convert to batches first to avoid a bunch of rigmarole resulting
-        # from the following rough edges
-        #
-        # 1. clickhouse's awkward
-        #    client-settings-are-permissioned-on-the-server "feature"
-        # 2. the bizarre conversion of `DateTime64` without scale to arrow
-        #    uint32 inside of clickhouse
-        # 3. the fact that uint32 cannot be cast to pa.timestamp without first
-        #    casting it to int64
-        #
-        # the extra code to make this dance work without first converting to
-        # record batches isn't worth it without some benchmarking
+        # the batches are already cast to the expected schema, see
+        # `to_pyarrow_batches`
         with self.to_pyarrow_batches(
             expr=expr,
             params=params,
@@ -321,13 +359,17 @@ class Backend(BaseBackend, CanCreateDatabase):
         -----
         There are a variety of ways to implement clickhouse -> record batches.
 
-        1. FORMAT ArrowStream -> record batches via raw_query
-           This has the same type conversion problem(s) as `to_pyarrow`.
-           It's harder to address due to lack of `cast` on `RecordBatch`.
-           However, this is a ClickHouse problem: we should be able to get
-           string data out without a bunch of settings/permissions rigmarole.
+        1. FORMAT ArrowStream -> record batches
+           This is what is implemented for results consisting of numeric,
+           boolean, string and temporal columns. ClickHouse sends `DateTime`
+           and `Date` values as unsigned integers and strings as binary if the
+           server doesn't permit changing the output settings, so the batches
+           are cast to the expected types on the Arrow level. Results with
+           `Enum` or `FixedString` columns, which can't be decoded from their
+           Arrow representation, fall back to 2.
         2. Native -> Python objects -> pyarrow batches
-           This is what is implemented, using `query_column_block_stream`.
+           This is used for all the other results, using
+           `query_column_block_stream`.
         3. Native -> Python objects -> DataFrame chunks -> pyarrow batches
            This is not implemented because it adds an unnecessary pandas step in
            between Python object -> arrow. We can go directly to record batches
@@ -339,12 +381,11 @@ class Backend(BaseBackend, CanCreateDatabase):
         external_tables = self._collect_in_memory_tables(expr, external_tables)
         external_data = self._normalize_external_tables(external_tables)
 
-        def batcher(sql: str, *, schema: pa.Schema) -> Iterator[pa.RecordBatch]:
-            settings = {}
+        settings = {}
+        if self._is_writable_setting("max_block_size"):
+            settings["max_block_size"] = chunk_size
 
-            # readonly != 1 means that the server setting is writable
-            if self.con.server_settings["max_block_size"].readonly != 1:
-                settings["max_block_size"] = chunk_size
+        def batcher(sql: str, *, schema: pa.Schema) -> Iterator[pa.RecordBatch]:
             with self.con.query_column_block_stream(
                 sql, external_data=external_data, settings=settings
             ) as blocks:
@@ -352,9 +393,62 @@ class Backend(BaseBackend, CanCreateDatabase):
                     partial(pa.RecordBatch.from_arrays, schema=schema), blocks
                 )
 
+        def arrow_batcher(sql: str, *, schema: pa.Schema) -> Iterator[pa.RecordBatch]:
+            arrow_settings = settings.copy()
+            if self._is_writable_setting("output_format_arrow_string_as_string"):
+                arrow_settings["output_format_arrow_string_as_string"] = 1
+
+            # newer versions of the client can stream the response
+            if (raw_stream := getattr(self.con, "raw_stream", None)) is not None:
+                source = raw_stream(
+                    sql,
+                    settings=arrow_settings,
+                    fmt="ArrowStream",
+                    external_data=external_data,
+                )
+            else:
+                data = self.con.raw_query(
+                    sql,
+                    settings=arrow_settings,
+                    fmt="ArrowStream",
+                    external_data=external_data,
+                )
+                if not data:
+                    return
+                source = pa.BufferReader(data)
+
+            with closing(source), pa.ipc.open_stream(source) as reader:
+                decodable = all(
+                    map(_can_cast_arrow_type, reader.schema.types, schema.types)
+                )
+                if decodable:
+                    for batch in reader:
+                        yield pa.RecordBatch.from_arrays(
+                            [
+                                _cast_arrow_array(column, field.type)
+                                for column, field in zip(batch.columns, schema)
+                            ],
+                            schema=schema,
+                        )
+
+            if not decodable:
+                # the result has columns whose values can only be decoded by
+                # the client, e.g. enums
+                yield from batcher(sql, schema=schema)
+
         self._log(sql)
-        schema = table.schema().to_pyarrow()
-        return pa.RecordBatchReader.from_batches(schema, batcher(sql, schema=schema))
+        ibis_schema = table.schema()
+        schema = ibis_schema.to_pyarrow()
+        if all(map(_supports_arrow_stream, ibis_schema.types)):
+            batches = arrow_batcher(sql, schema=schema)
+        else:
+            batches = batcher(sql, schema=schema)
+        return pa.RecordBatchReader.from_batches(schema, batches)
+
+    def _is_writable_setting(self, name: str) -> bool:
+        # readonly != 1 means that the server setting is writable
+        setting = self.con.server_settings.get(name)
+        return setting is not None and setting.readonly != 1
 
     def execute(
         self,
@@ -314,3 +314,47 @@ def test_builtin_agg_udf(con, func):
         external_data=con._normalize_external_tables({table_name: t.op()}),
     ).squeeze()
     assert result == expected
+
+
+def test_to_pyarrow_batches_arrow_stream(con):
+    t = ibis.memtable(
+        {
+            "x": [1, 2, None],
+            "s": ["a", None, "c"],
+            "d": pd.to_datetime(["2023-01-01", "2023-01-02", "2023-01-03"]).date,
+        }
+    )
+    expr = t.mutate(
+        ts=ibis.literal("2023-01-01 00:00:01").cast("timestamp"),
+        ts_utc=ibis.literal("2023-01-01 00:00:01").cast("timestamp('UTC')"),
+    )
+    with con.to_pyarrow_batches(expr, chunk_size=2) as reader:
+        result = reader.read_all()
+    schema = expr.schema().to_pyarrow()
+    assert result.schema == schema
+    assert result.num_rows == 3
+    assert result["s"].to_pylist() == ["a", None, "c"]
+
+
+def test_to_pyarrow_batches_enum(con):
+    expr = con.sql(
+        "SELECT CAST(number % 2 + 1 AS Enum8('a' = 1, 'b' = 2)) AS e FROM numbers(3)"
+    )
+    with con.to_pyarrow_batches(expr) as reader:
+        result = reader.read_all()
+    assert result["e"].to_pylist() == ["a", "b", "a"]
+
+
+@pytest.mark.parametrize(
+    ("typ", "expected"),
+    [
+        param(pa.string(), True, id="string"),
+        param(pa.binary(), True, id="binary"),
+        param(pa.int8(), False, id="enum"),
+        param(pa.binary(2), False, id="fixed_string"),
+    ],
+)
+def test_can_cast_arrow_type_to_string(typ, expected):
+    from ibis.backends.clickhouse import _can_cast_arrow_type
+
+    assert _can_cast_arrow_type(typ, pa.string()) is expected
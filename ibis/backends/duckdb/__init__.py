@@ -259,6 +259,8 @@ WHERE catalog_name = :database"""
             dbapi_connection.execute("SET TimeZone = 'UTC'")
 
         self._record_batch_readers_consumed = {}
+        # names of the in-memory tables registered with the connection
+        self._memtables: set[str] = set()
 
         # TODO(cpcloud): remove this when duckdb is >0.8.1
         # this is here to workaround https://github.com/duckdb/duckdb/issues/8735
@@ -398,6 +400,8 @@ WHERE catalog_name = :database"""
         )
 
     def _compile_temp_view(self, table_name, source):
+        # the view may replace an existing one with a different schema
+        self.invalidate_schema(table_name)
         raw_source = source.compile(
             dialect=self.con.dialect, compile_kwargs=dict(literal_binds=True)
         )
@@ -618,6 +622,7 @@ WHERE catalog_name = :database"""
             # by the time we execute against this so we register it
             # explicitly.
             con.connection.register(table_name, dataset)
+        self.invalidate_schema(table_name)
 
     def read_in_memory(
         self,
@@ -642,6 +647,7 @@ WHERE catalog_name = :database"""
         table_name = table_name or util.gen_name("read_in_memory")
         with self.begin() as con:
             con.connection.register(table_name, source)
+        self.invalidate_schema(table_name)
 
         if isinstance(source, pa.RecordBatchReader):
             # Ensure the reader isn't marked as started, in case the name is
@@ -1007,8 +1013,7 @@ WHERE catalog_name = :database"""
             :::
         """
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        sql = self._compile_query(expr, limit=limit, params=params)
 
         def batch_producer(con):
             with con.begin() as c, contextlib.closing(c.execute(sql)) as cur:
@@ -1030,14 +1035,14 @@ WHERE catalog_name = :database"""
         **_: Any,
     ) -> pa.Table:
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
+        query = self._compile_query(expr, limit=limit, params=params)
 
         # We use `.sql` instead of `.execute` below for performance - in
         # certain cases duckdb query -> arrow table can be significantly faster
         # in this configuration. Currently `.sql` doesn't support parametrized
         # queries, so we need to compile with literal_binds for now.
         sql = str(
-            query_ast.compile().compile(
+            query.compile(
                 dialect=self.con.dialect, compile_kwargs={"literal_binds": True}
             )
         )
@@ -1177,28 +1182,8 @@ WHERE catalog_name = :database"""
     def fetch_from_cursor(
         self, cursor: duckdb.DuckDBPyConnection, schema: sch.Schema
     ) -> pd.DataFrame:
-        import pandas as pd
-        import pyarrow.types as pat
-
         table = cursor.cursor.fetch_arrow_table()
-
-        df = pd.DataFrame(
-            {
-                name: (
-                    col.to_pylist()
-                    if (
-                        pat.is_nested(col.type)
-                        or
-                        # pyarrow / duckdb type null literals columns as int32?
-                        # but calling `to_pylist()` will render it as None
-                        col.null_count
-                    )
-                    else col.to_pandas(timestamp_as_object=True)
-                )
-                for name, col in zip(table.column_names, table.columns)
-            }
-        )
-        df = PandasData.convert_table(df, schema)
+        df = PandasData.convert_pyarrow_table(table, schema)
         if not df.empty and geospatial_supported:
             return self._to_geodataframe(df, schema)
         return df
@@ -1243,7 +1228,7 @@ WHERE catalog_name = :database"""
             )
 
         # only register if we haven't already done so
-        if (name := op.name) not in self.list_tables():
+        if (name := op.name) not in self._memtables:
             table = op.data.to_pyarrow(schema)
 
             # register creates a transaction, and we can't nest transactions so
@@ -1253,6 +1238,13 @@ WHERE catalog_name = :database"""
                     con.connection.register(name, table)
 
             _register(name, table)
+            self._memtables.add(name)
+
+    def drop_view(
+        self, name: str, *, database: str | None = None, force: bool = False
+    ) -> None:
+        super().drop_view(name, database=database, force=force)
+        self._memtables.discard(name)
 
     def _get_temp_view_definition(
         self, name: str, definition: sa.sql.compiler.Compiled
@@ -1324,6 +1316,27 @@ WHERE catalog_name = :database"""
                 con.execute(t.delete())
             con.execute(t.insert().from_select(columns, sa.select(source)))
 
+    def _bulk_insert(self, con, table: sa.Table, data: pa.Table) -> None:
+        # let duckdb scan the arrow data directly instead of binding values
+        name = util.gen_name("insert")
+        columns = data.column_names
+        source = sa.table(name, *map(sa.column, columns))
+        con.connection.register(name, data)
+        try:
+            con.execute(table.insert().from_select(columns, sa.select(source)))
+        finally:
+            con.connection.unregister(name)
+
+    def _table_fingerprint(self, op: ops.DatabaseTable) -> str:
+        table = self._get_table_identifier(name=op.name, namespace=op.namespace)
+        # an order independent digest of the rows
+        query = (
+            f"SELECT count(*), sum(hash(t)::HUGEINT) FROM {table.sql(self.name)} AS t"
+        )
+        with self.begin() as con:
+            count, digest = con.exec_driver_sql(query).one()
+        return f"{count}:{digest}"
+
     def table(
         self,
         name: str,
@@ -8,6 +8,7 @@ from pytest import param
 
 import ibis
 import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
 from ibis.conftest import LINUX, SANDBOXED
 from ibis.util import gen_name
 
@@ -158,3 +159,210 @@ def test_config_options_bad_option(con):
 
     with pytest.raises(KeyError):
         con.settings["i_didnt_set_this"]
+
+
+def test_persistent_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(ibis.options.cache, "directory", str(tmpdir.join("cache")))
+
+    path = str(tmpdir.join("test.ddb"))
+    con = ibis.duckdb.connect(path)
+    t = con.create_table("t", ibis.memtable({"a": [1, 2, 3]}))
+    expr = t.mutate(b=t.a * 2)
+
+    with expr.cache() as cached:
+        assert cached.b.sum().execute() == 12
+
+    cache = con._persistent_cache
+    assert len(cache) == 1
+
+    # a new session reuses the stored result instead of recomputing it
+    con = ibis.duckdb.connect(path)
+    t = con.table("t")
+    expr = t.mutate(b=t.a * 2)
+
+    loaded = []
+    load_into_cache = con._load_into_cache
+
+    def spy(name, expr):
+        loaded.append(expr.op())
+        return load_into_cache(name, expr)
+
+    monkeypatch.setattr(con, "_load_into_cache", spy)
+
+    with expr.cache() as cached:
+        assert cached.b.sum().execute() == 12
+
+    (op,) = loaded
+    assert isinstance(op, ops.InMemoryTable)
+
+    cache.clear()
+    assert not len(cache)
+
+
+def test_persistent_cache_tracks_table_contents(tmpdir, monkeypatch):
+    monkeypatch.setattr(ibis.options.cache, "directory", str(tmpdir.join("cache")))
+
+    def cached_sum(data):
+        con = ibis.duckdb.connect()
+        t = con.create_table("t", ibis.memtable({"a": data}))
+        with t.mutate(b=t.a * 2).cache() as cached:
+            return cached.b.sum().execute()
+
+    assert cached_sum([1, 2, 3]) == 12
+    assert cached_sum([4, 5, 6]) == 30
+
+    con = ibis.duckdb.connect()
+    con.create_table("t", ibis.memtable({"a": [1, 2, 3]}))
+    assert len(con._persistent_cache) == 2
+
+    # the contents of raw SQL queries aren't tracked, so they aren't persisted
+    expr = con.sql("SELECT a + 1 AS a FROM t")
+    with expr.cache() as cached:
+        assert cached.a.sum().execute() == 9
+    assert len(con._persistent_cache) == 2
+
+
+def test_compile_cache(monkeypatch):
+    con = ibis.duckdb.connect()
+    t = con.create_table("t", ibis.memtable({"a": [1, 2, 3]}))
+    p = ibis.param("int64")
+    expr = t.filter(t.a > p).a.sum()
+
+    calls = []
+    to_ast_ensure_limit = con.compiler.to_ast_ensure_limit
+
+    def spy(*args, **kwargs):
+        calls.append(args)
+        return to_ast_ensure_limit(*args, **kwargs)
+
+    monkeypatch.setattr(con.compiler, "to_ast_ensure_limit", spy)
+
+    assert con.execute(expr, params={p: 1}) == 5
+    assert con.execute(expr, params={p: 1}) == 5
+    assert len(calls) == 1
+
+    # different parameter values and limits are compiled separately
+    assert con.execute(expr, params={p: 2}) == 3
+    assert len(calls) == 2
+    assert len(con.execute(t, limit=1)) == 1
+    assert len(con.execute(t, limit=2)) == 2
+    assert len(calls) == 4
+
+    # changing the default limit invalidates queries compiled with it
+    with ibis.config.option_context("sql.default_limit", 1):
+        assert len(con.execute(t)) == 1
+    assert len(con.execute(t)) == 3
+    assert len(calls) == 6
+
+    monkeypatch.setattr(con, "compile_cache_size", 2)
+    con.execute(t.a.max())
+    assert len(con._compiled_queries) == 2
+
+    # expressions over in-memory tables aren't cached, the cache would keep
+    # their data alive
+    con._compiled_queries.clear()
+    assert con.execute(ibis.memtable({"a": [1, 2]}).a.sum()) == 3
+    assert not con._compiled_queries
+
+
+def test_schema_cache(monkeypatch):
+    import ibis.backends.base.sql as base_sql
+
+    con = ibis.duckdb.connect()
+    con.create_table("t", schema=ibis.schema({"a": "int64"}))
+
+    now = 0.0
+    monkeypatch.setattr(base_sql.time, "monotonic", lambda: now)
+    monkeypatch.setattr(con, "schema_cache_ttl", 60)
+
+    reflections = []
+    get_sqla_table = con._get_sqla_table
+
+    def spy(name, **kwargs):
+        reflections.append(name)
+        return get_sqla_table(name, **kwargs)
+
+    monkeypatch.setattr(con, "_get_sqla_table", spy)
+
+    t = con.table("t")
+    assert con.execute(t.count()) == 0
+    assert con.table("t").schema() == t.schema()
+    assert reflections == ["t"]
+
+    queries = []
+    get_schema_using_query = con._get_schema_using_query
+
+    def query_spy(query):
+        queries.append(query)
+        return get_schema_using_query(query)
+
+    monkeypatch.setattr(con, "_get_schema_using_query", query_spy)
+    con.sql("SELECT a FROM t")
+    con.sql("SELECT a FROM t")
+    assert len(queries) == 1
+
+    # changes made through the backend invalidate the cache
+    con.create_table("t", schema=ibis.schema({"b": "string"}), overwrite=True)
+    assert con.table("t").columns == ["b"]
+    assert con.sql("SELECT * FROM t").columns == ["b"]
+    assert len(queries) == 2
+
+    # changes made by other means are picked up once the entries expire
+    with con.begin() as c:
+        c.exec_driver_sql("CREATE OR REPLACE TABLE t (c DOUBLE)")
+    assert con.table("t").columns == ["b"]
+    now = 61.0
+    assert con.table("t").columns == ["c"]
+
+    with con.begin() as c:
+        c.exec_driver_sql("CREATE OR REPLACE TABLE t (d DOUBLE)")
+    con.invalidate_schema("t")
+    assert con.table("t").columns == ["d"]
+
+    # caching is disabled by default
+    monkeypatch.setattr(con, "schema_cache_ttl", 0)
+    del reflections[:]
+    con.table("t")
+    con.table("t")
+    assert reflections == ["t", "t"]
+
+
+def test_insert_arrow():
+    con = ibis.duckdb.connect()
+    t = con.create_table("t", schema=ibis.schema({"a": "int64", "b": "string"}))
+    tables = con.list_tables()
+
+    con.insert("t", pa.table({"a": [1, 2], "b": ["x", None]}))
+    con.insert("t", ibis.memtable({"a": [3], "b": ["z"]}))
+    assert t.order_by("a").to_pyarrow().to_pydict() == {
+        "a": [1, 2, 3],
+        "b": ["x", None, "z"],
+    }
+
+    con.insert("t", pa.table({"a": [4], "b": ["w"]}), overwrite=True)
+    assert t.to_pyarrow().to_pydict() == {"a": [4], "b": ["w"]}
+
+    # the registered arrow data doesn't outlive the insert
+    assert con.list_tables() == tables
+
+
+def test_memtable_registration_skips_catalog(monkeypatch):
+    con = ibis.duckdb.connect()
+    t = ibis.memtable({"a": [1, 2, 3]})
+    expr = t.a.sum()
+    assert con.execute(expr) == 6
+
+    def list_tables(*_, **__):
+        raise AssertionError("list_tables must not be called")
+
+    monkeypatch.setattr(con, "list_tables", list_tables)
+    assert con.execute(expr) == 6
+
+    # dropping the registered view invalidates the registry
+    monkeypatch.undo()
+    con.drop_view(t.op().name)
+    assert con.execute(expr) == 6
+
+    # as does reconnecting
+    con.reconnect()
+    assert con.execute(expr) == 6
@@ -405,11 +405,13 @@ class Backend(BaseSQLBackend):
         select = ast.queries[0]
         statement = CreateView(name, select, database=database, can_exist=overwrite)
         self._safe_exec_sql(statement)
+        self.invalidate_schema(name)
         return self.table(name, database=database)
 
     def drop_view(self, name, database=None, force=False):
         stmt = DropView(name, database=database, must_exist=not force)
         self._safe_exec_sql(stmt)
+        self.invalidate_schema(name)
 
     def table(self, name: str, database: str | None = None, **kwargs: Any) -> ir.Table:
         expr = super().table(name, database=database, **kwargs)
@@ -506,6 +508,7 @@ class Backend(BaseSQLBackend):
                     partition=partition,
                 )
             )
+        self.invalidate_schema(name)
         return self.table(name, database=database)
 
     def avro_file(
@@ -741,6 +744,7 @@ class Backend(BaseSQLBackend):
         """
         statement = DropTable(name, database=database, must_exist=not force)
         self._safe_exec_sql(statement)
+        self.invalidate_schema(name)
 
     def truncate_table(self, name: str, database: str | None = None) -> None:
         """Delete all rows from an existing table.
@@ -767,6 +771,8 @@ class Backend(BaseSQLBackend):
         """
         statement = RenameTable(old_name, new_name)
         self._safe_exec_sql(statement)
+        self.invalidate_schema(old_name)
+        self.invalidate_schema(new_name)
 
     def drop_table_or_view(self, name, *, database=None, force=False):
         """Drop view or table."""
@@ -6,24 +6,24 @@ import contextlib
 from typing import TYPE_CHECKING, Any
 
 import sqlalchemy as sa
-import toolz
 
+from ibis import util
 from ibis.backends.base import CanCreateDatabase
 from ibis.backends.base.sql.alchemy import AlchemyCanCreateSchema, BaseAlchemyBackend
 from ibis.backends.mssql.compiler import MsSqlCompiler
 from ibis.backends.mssql.datatypes import _type_from_result_set_info
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterator, Mapping
 
     import ibis.expr.schema as sch
-    import ibis.expr.types as ir
 
 
 class Backend(BaseAlchemyBackend, CanCreateDatabase, AlchemyCanCreateSchema):
     name = "mssql"
     compiler = MsSqlCompiler
     supports_create_or_replace = False
+    prefetch_batches = 2
 
     _sqlglot_dialect = "tsql"
 
@@ -125,24 +125,12 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase, AlchemyCanCreateSchema):
             temp * "#" + name, schema=schema, database=database, temp=False
         )
 
-    def _cursor_batches(
-        self,
-        expr: ir.Expr,
-        params: Mapping[ir.Scalar, Any] | None = None,
-        limit: int | str | None = None,
-        chunk_size: int = 1_000_000,
-    ) -> Iterable[list]:
-        self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
-
-        with self._safe_raw_sql(sql) as cursor:
-            # this is expensive for large result sets
-            #
-            # see https://github.com/ibis-project/ibis/pull/6513
-            batch = cursor.fetchall()
-
-        yield from toolz.partition_all(chunk_size, batch)
+    def _fetch_rows(self, cursor, chunk_size: int) -> Iterator[list]:
+        # fetch the next chunk from the server while the previous one is being
+        # converted, holding at most `prefetch_batches` chunks in memory
+        yield from util.prefetch(
+            super()._fetch_rows(cursor, chunk_size), maxsize=self.prefetch_batches
+        )
 
     def create_database(self, name: str, force: bool = False) -> None:
         name = self._quote(name)
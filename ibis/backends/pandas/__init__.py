@@ -15,6 +15,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends.base import BaseBackend
+from ibis.common.fingerprint import tokenize
 from ibis.formats.pandas import PandasData, PandasSchema
 from ibis.formats.pyarrow import PyArrowData
 
@@ -286,6 +287,21 @@ class BasePandasBackend(BaseBackend):
     def _clean_up_cached_table(self, op):
         del self.dictionary[op.name]
 
+    def _table_fingerprint(self, op):
+        return tokenize(self.dictionary[op.name]).hex()
+
+    @staticmethod
+    def _frame_to_pyarrow(df: pd.DataFrame, schema: sch.Schema) -> pa.Table:
+        output = pa.Table.from_pandas(df)
+
+        # cudf.pandas adds a column with the name `__index_level_0__` (and maybe
+        # other index level columns) but these aren't part of the known schema
+        # so we drop them
+        output = output.drop_columns(
+            filter(lambda col: col.startswith("__index_level_"), output.column_names)
+        )
+        return PyArrowData.convert_table(output, schema)
+
     def to_pyarrow(
         self,
         expr: ir.Expr,
@@ -294,17 +310,8 @@ class BasePandasBackend(BaseBackend):
         **kwargs: Any,
     ) -> pa.Table:
         table_expr = expr.as_table()
-        output = pa.Table.from_pandas(
-            self.execute(table_expr, params=params, limit=limit, **kwargs)
-        )
-
-        # cudf.pandas adds a column with the name `__index_level_0__` (and maybe
-        # other index level columns) but these aren't part of the known schema
-        # so we drop them
-        output = output.drop_columns(
-            filter(lambda col: col.startswith("__index_level_"), output.column_names)
-        )
-        table = PyArrowData.convert_table(output, table_expr.schema())
+        df = self.execute(table_expr, params=params, limit=limit, **kwargs)
+        table = self._frame_to_pyarrow(df, table_expr.schema())
         return expr.__pyarrow_result__(table)
 
     def to_pyarrow_batches(
@@ -317,12 +324,21 @@ class BasePandasBackend(BaseBackend):
         **kwargs: Any,
     ) -> pa.ipc.RecordBatchReader:
         pa = self._import_pyarrow()
-        pa_table = self.to_pyarrow(
-            expr.as_table(), params=params, limit=limit, **kwargs
-        )
-        return pa.RecordBatchReader.from_batches(
-            pa_table.schema, pa_table.to_batches(max_chunksize=chunk_size)
-        )
+        table_expr = expr.as_table()
+        schema = table_expr.schema()
+        df = self.execute(table_expr, params=params, limit=limit, **kwargs)
+        arrow_schema = schema.to_pyarrow()
+
+        # convert the result one chunk at a time so that only a single chunk
+        # of the result is held in both pandas and arrow memory at once
+        def batches():
+            for start in range(0, len(df), chunk_size):
+                chunk = self._frame_to_pyarrow(
+                    df.iloc[start : start + chunk_size], schema
+                )
+                yield from chunk.replace_schema_metadata().to_batches()
+
+        return pa.RecordBatchReader.from_batches(arrow_schema, batches())
 
 
 class Backend(BasePandasBackend):
@@ -543,19 +543,37 @@ def window_agg_udf(
     masked_window_lower_indices = window_lower_indices[mask].astype("i8")
     masked_window_upper_indices = window_upper_indices[mask].astype("i8")
 
-    input_iters = [
-        create_window_input_iter(
-            arg, masked_window_lower_indices, masked_window_upper_indices
+    if (window_function := getattr(function, "__window_func__", None)) is not None:
+        # the UDF computes all windows at once from their bounds
+        valid_result = window_function(
+            masked_window_lower_indices.values,
+            masked_window_upper_indices.values,
+            *(
+                getattr(arg, "obj", arg).values
+                if isinstance(arg, (pd.Series, SeriesGroupBy))
+                else arg
+                for arg in inputs
+            ),
+        )
+        if len(valid_result) != len(masked_window_lower_indices):
+            raise ValueError(
+                f"Window UDF returned {len(valid_result)} values for "
+                f"{len(masked_window_lower_indices)} windows"
+            )
+    else:
+        input_iters = [
+            create_window_input_iter(
+                arg, masked_window_lower_indices, masked_window_upper_indices
+            )
+            if isinstance(arg, (pd.Series, SeriesGroupBy))
+            else itertools.repeat(arg)
+            for arg in inputs
+        ]
+
+        valid_result = (
+            function(*(next(gen) for gen in input_iters))
+            for i in range(len(masked_window_lower_indices))
         )
-        if isinstance(arg, (pd.Series, SeriesGroupBy))
-        else itertools.repeat(arg)
-        for arg in inputs
-    ]
-
-    valid_result = pd.Series(
-        function(*(next(gen) for gen in input_iters))
-        for i in range(len(masked_window_lower_indices))
-    )
 
     valid_result = pd.Series(valid_result)
     valid_result.index = masked_window_lower_indices.index
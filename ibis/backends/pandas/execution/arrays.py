@@ -7,25 +7,53 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.core.groupby import SeriesGroupBy
 
 import ibis.expr.operations as ops
 from ibis.backends.pandas.core import execute
 from ibis.backends.pandas.dispatch import execute_node
+from ibis.backends.pandas.execution.util import arrow_array, from_arrow
 
 if TYPE_CHECKING:
     from collections.abc import Collection
 
 
+def _arrow_list(data: pd.Series) -> pa.Array | None:
+    """Return the Arrow array backing `data` if it's a variable size list."""
+    array = arrow_array(data)
+    if array is not None and (
+        pa.types.is_list(array.type) or pa.types.is_large_list(array.type)
+    ):
+        return array
+    return None
+
+
 @execute_node.register(ops.ArrayColumn, tuple)
 def execute_array_column(op, cols, **kwargs):
     cols = [execute(arg, **kwargs) for arg in cols]
+    first, *rest = cols
+    arrays = list(map(arrow_array, cols))
+    if all(array is not None for array in arrays) and all(
+        col.index.equals(first.index) for col in rest
+    ):
+        # interleave the columns into a single values array
+        value_type = op.dtype.value_type.to_pyarrow()
+        values = pa.concat_arrays([array.cast(value_type) for array in arrays])
+        n, k = len(first), len(cols)
+        values = values.take(np.arange(n * k).reshape(k, n).T.ravel())
+        offsets = np.arange(0, n * k + 1, k, dtype=np.int32)
+        result = pa.ListArray.from_arrays(offsets, values)
+        return from_arrow(result, first).rename(None)
     df = pd.concat(cols, axis=1)
     return df.apply(lambda row: np.array(row, dtype=object), axis=1)
 
 
 @execute_node.register(ops.ArrayLength, pd.Series)
 def execute_array_length(op, data, **kwargs):
+    if (array := _arrow_list(data)) is not None:
+        return from_arrow(pc.list_value_length(array).cast(pa.int64()), data)
     return data.apply(len)
 
 
@@ -36,6 +64,13 @@ def execute_array_length_scalar(op, data, **kwargs):
 
 @execute_node.register(ops.ArraySlice, pd.Series, int, (int, type(None)))
 def execute_array_slice(op, data, start, stop, **kwargs):
+    # `list_slice` doesn't support negative indices
+    if (
+        hasattr(pc, "list_slice")
+        and (array := _arrow_list(data)) is not None
+        and 0 <= start <= (start if stop is None else stop)
+    ):
+        return from_arrow(pc.list_slice(array, start, stop), data)
     return data.apply(operator.itemgetter(slice(start, stop)))
 
 
@@ -46,6 +81,14 @@ def execute_array_slice_scalar(op, data, start, stop, **kwargs):
 
 @execute_node.register(ops.ArrayIndex, pd.Series, int)
 def execute_array_index(op, data, index, **kwargs):
+    if (array := _arrow_list(data)) is not None:
+        offsets = array.offsets.to_numpy()
+        starts, ends = offsets[:-1], offsets[1:]
+        positions = (starts if index >= 0 else ends) + index
+        valid = array.is_valid().to_numpy(zero_copy_only=False)
+        valid &= (starts <= positions) & (positions < ends)
+        indices = pa.array(np.where(valid, positions, 0), mask=~valid)
+        return from_arrow(array.values.take(indices), data)
     return data.apply(
         lambda array, index=index: (
             array[index] if -len(array) <= index < len(array) else None
@@ -152,6 +195,17 @@ def execute_unnest(op, data, **kwargs):
 
 @execute_node.register(ops.ArrayFlatten, pd.Series)
 def execute_array_flatten(op, data, **kwargs):
+    if (array := _arrow_list(data)) is not None and (
+        pa.types.is_list(array.type.value_type)
+        or pa.types.is_large_list(array.type.value_type)
+    ):
+        # the offsets of the inner lists at the outer offsets delimit the
+        # flattened rows
+        inner = array.values
+        offsets = inner.offsets.to_numpy()[array.offsets.to_numpy()]
+        mask = np.append(array.is_null().to_numpy(zero_copy_only=False), False)
+        offsets = pa.array(offsets, type=inner.offsets.type, mask=mask)
+        return from_arrow(type(inner).from_arrays(offsets, inner.values), data)
     return data.map(
         lambda v: list(itertools.chain.from_iterable(v)), na_action="ignore"
     )
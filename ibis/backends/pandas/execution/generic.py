@@ -14,6 +14,7 @@ from collections.abc import Mapping, Sized
 
 import numpy as np
 import pandas as pd
+import pyarrow.compute as pc
 import pytz
 import toolz
 from pandas.core.groupby import DataFrameGroupBy, SeriesGroupBy
@@ -41,7 +42,11 @@ from ibis.backends.pandas.core import (
 )
 from ibis.backends.pandas.dispatch import execute_literal, execute_node
 from ibis.backends.pandas.execution import constants
-from ibis.backends.pandas.execution.util import coerce_to_output, get_grouping
+from ibis.backends.pandas.execution.util import (
+    arrow_strings,
+    coerce_to_output,
+    get_grouping,
+)
 
 
 # By default return the literal value
@@ -1048,6 +1053,9 @@ def execute_not_series(op, data, **kwargs):
 
 @execute_node.register(ops.StringSplit, pd.Series, (pd.Series, str))
 def execute_string_split(op, data, delimiter, **kwargs):
+    if isinstance(delimiter, str) and (array := arrow_strings(data)) is not None:
+        result = pc.split_pattern(array, delimiter).to_numpy(zero_copy_only=False)
+        return pd.Series(result, index=data.index)
     # Doing the iteration using `map` is much faster than doing the iteration
     # using `Series.apply` due to Pandas-related overhead.
     return pd.Series(np.array(s.split(delimiter)) for s in data)
@@ -1,14 +1,48 @@
 from __future__ import annotations
 
 import collections
+import contextlib
 import functools
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import toolz
 
 import ibis.expr.operations as ops
 from ibis.backends.pandas.dispatch import execute_node
+from ibis.backends.pandas.execution.util import arrow_array, from_arrow
+
+
+def _arrow_map(data: pd.Series) -> pa.MapArray | None:
+    """Return the Arrow array backing `data` if it's a map array."""
+    array = arrow_array(data)
+    if array is not None and pa.types.is_map(array.type):
+        return array
+    return None
+
+
+def _arrow_map_nulls(array: pa.MapArray) -> np.ndarray:
+    return array.is_null().to_numpy(zero_copy_only=False)
+
+
+def _arrow_map_entries(array: pa.MapArray, entries: pa.Array) -> pa.ListArray:
+    """Gather the keys or items of every map in `array` into a list array."""
+    mask = np.append(_arrow_map_nulls(array), False)
+    offsets = pa.array(array.offsets.to_numpy(), mask=mask)
+    return pa.ListArray.from_arrays(offsets, entries)
+
+
+def _arrow_map_contains(array: pa.MapArray, key) -> np.ndarray:
+    """Compute whether every map in `array` contains `key`."""
+    key = pa.scalar(key, type=array.type.key_type)
+    found = pc.equal(array.keys, key).to_numpy(zero_copy_only=False)
+    # count the matching keys in each map using the offsets of the maps into
+    # the flattened keys
+    counts = np.concatenate([[0], np.cumsum(found)])
+    offsets = array.offsets.to_numpy()
+    return counts[offsets[1:]] > counts[offsets[:-1]]
 
 
 @execute_node.register(ops.Map, np.ndarray, np.ndarray)
@@ -23,6 +57,10 @@ def map_series_series(op, keys, values, **kwargs):
 
 @execute_node.register(ops.MapLength, pd.Series)
 def map_length_series(op, data, **kwargs):
+    if (array := _arrow_map(data)) is not None:
+        lengths = np.diff(array.offsets.to_numpy())
+        lengths = pa.array(lengths, type=pa.int64(), mask=_arrow_map_nulls(array))
+        return from_arrow(lengths, data)
     # TODO: investigate whether calling a lambda is faster
     return data.dropna().map(len).reindex(data.index)
 
@@ -34,6 +72,16 @@ def map_length_dict(op, data, **kwargs):
 
 @execute_node.register(ops.MapGet, pd.Series, object, object)
 def map_get_series_scalar_scalar(op, data, key, default, **kwargs):
+    if (array := _arrow_map(data)) is not None:
+        value_type = array.type.item_type
+        with contextlib.suppress(
+            pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError
+        ):
+            contains = _arrow_map_contains(array, key)
+            values = pc.map_lookup(array, pa.scalar(key, array.type.key_type), "first")
+            result = pc.if_else(contains, values, pa.scalar(default, value_type))
+            result = pc.if_else(array.is_valid(), result, pa.scalar(None, value_type))
+            return from_arrow(result, data)
     return data.map(functools.partial(safe_get, key=key, default=default))
 
 
@@ -105,6 +153,11 @@ def map_contains_dict_series(op, data, key, **kwargs):
 
 @execute_node.register(ops.MapContains, pd.Series, object)
 def map_contains_series_object(op, data, key, **kwargs):
+    if (array := _arrow_map(data)) is not None:
+        with contextlib.suppress(pa.ArrowInvalid, pa.ArrowTypeError):
+            contains = _arrow_map_contains(array, key)
+            mask = _arrow_map_nulls(array)
+            return from_arrow(pa.array(contains, mask=mask), data)
     return data.map(lambda d: safe_contains(d, key))
 
 
@@ -150,6 +203,8 @@ def safe_values(mapping):
 
 @execute_node.register(ops.MapKeys, pd.Series)
 def map_keys_series(op, data, **kwargs):
+    if (array := _arrow_map(data)) is not None:
+        return from_arrow(_arrow_map_entries(array, array.keys), data)
     return data.map(safe_keys)
 
 
@@ -163,6 +218,8 @@ def map_keys_dict(op, data, **kwargs):
 
 @execute_node.register(ops.MapValues, pd.Series)
 def map_values_series(op, data, **kwargs):
+    if (array := _arrow_map(data)) is not None:
+        return from_arrow(_arrow_map_entries(array, array.items), data)
     res = data.map(safe_values)
     return res
 
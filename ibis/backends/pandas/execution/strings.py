@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import itertools
 import json
 import operator
@@ -8,6 +9,8 @@ from urllib.parse import parse_qs, urlsplit
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import toolz
 from pandas.core.groupby import SeriesGroupBy
 
@@ -20,11 +23,17 @@ import ibis.expr.operations as ops
 import ibis.util
 from ibis.backends.pandas.core import execute, integer_types, scalar_types
 from ibis.backends.pandas.dispatch import execute_node
-from ibis.backends.pandas.execution.util import get_grouping
+from ibis.backends.pandas.execution.util import (
+    arrow_strings,
+    from_arrow,
+    get_grouping,
+)
 
 
 @execute_node.register(ops.StringLength, pd.Series)
 def execute_string_length_series(op, data, **kwargs):
+    if (array := arrow_strings(data)) is not None:
+        return from_arrow(pc.utf8_length(array).cast(pa.int32()), data)
     return data.str.len().astype("int32")
 
 
@@ -242,6 +251,12 @@ def execute_group_concat_series_gb_mask(op, data, sep, mask, aggcontext=None, **
 
 @execute_node.register(ops.StringAscii, pd.Series)
 def execute_string_ascii(op, data, **kwargs):
+    if (array := arrow_strings(data)) is not None:
+        # the UTF-32 encoding of the first character is its code point
+        first = pc.fill_null(pc.utf8_slice_codeunits(array, 0, 1), "")
+        codes = np.asarray(first.to_pandas(), dtype="U1").view(np.int32)
+        mask = pc.is_null(array).to_pandas().to_numpy()
+        return from_arrow(pa.array(codes, mask=mask), data)
     return data.map(ord).astype("int32")
 
 
@@ -252,8 +267,22 @@ def execute_string_ascii_group_by(op, data, **kwargs):
     )
 
 
+# Constructs that RE2 accepts with a different meaning than Python: the
+# character classes are ASCII only, and `$` doesn't match before a trailing
+# newline
+_RE2_INCOMPATIBLE = re.compile(r"\\[wWdDsSbBZ]|\$|\[:")
+
+
+def _re2_compatible(pattern: str) -> bool:
+    return _RE2_INCOMPATIBLE.search(pattern) is None
+
+
 @execute_node.register(ops.RegexSearch, pd.Series, str)
 def execute_series_regex_search(op, data, pattern, **kwargs):
+    if (array := arrow_strings(data)) is not None and _re2_compatible(pattern):
+        # fall back to Python for patterns that RE2 doesn't support
+        with contextlib.suppress(pa.ArrowInvalid):
+            return from_arrow(pc.match_substring_regex(array, pattern), data)
     pattern = re.compile(pattern)
     return data.map(lambda x, pattern=pattern: pattern.search(x) is not None)
 
@@ -297,7 +326,21 @@ def execute_series_regex_extract_gb(op, data, pattern, index, **kwargs):
 
 @execute_node.register(ops.RegexReplace, pd.Series, str, str)
 def execute_series_regex_replace(op, data, pattern, replacement, **kwargs):
-    pattern = re.compile(pattern)
+    compiled = re.compile(pattern)
+    if (
+        (array := arrow_strings(data)) is not None
+        and _re2_compatible(pattern)
+        # RE2 only understands single digit group references in the
+        # replacement
+        and not re.search(r"\\(?![1-9](?!\d))", replacement)
+        # RE2 skips empty matches directly after a match, Python doesn't
+        and compiled.fullmatch("") is None
+    ):
+        with contextlib.suppress(pa.ArrowInvalid):
+            return from_arrow(
+                pc.replace_substring_regex(array, pattern, replacement), data
+            )
+    pattern = compiled
 
     def replacer(x, pattern=pattern):
         return pattern.sub(replacement, x)
@@ -6,11 +6,13 @@ import collections
 import functools
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.core.groupby import SeriesGroupBy
 
 import ibis.expr.operations as ops
 from ibis.backends.pandas.dispatch import execute_node
-from ibis.backends.pandas.execution.util import get_grouping
+from ibis.backends.pandas.execution.util import arrow_array, from_arrow, get_grouping
 
 
 @execute_node.register(ops.StructField, (collections.abc.Mapping, pd.DataFrame))
@@ -33,12 +35,17 @@ def _safe_getter(value, field: str):
 
 @execute_node.register(ops.StructField, pd.Series)
 def execute_node_struct_field_series(op, data, **kwargs):
+    array = arrow_array(data)
+    if array is not None and pa.types.is_struct(array.type):
+        index = array.type.get_field_index(op.field)
+        return from_arrow(pc.struct_field(array, [index]), data).rename(op.field)
     getter = functools.partial(_safe_getter, field=op.field)
     return data.map(getter).rename(op.field)
 
 
 @execute_node.register(ops.StructField, SeriesGroupBy)
 def execute_node_struct_field_series_group_by(op, data, **kwargs):
-    getter = functools.partial(_safe_getter, field=op.field)
     groupings = get_grouping(data.grouper.groupings)
-    return data.obj.map(getter).rename(op.field).groupby(groupings, group_keys=False)
+    return execute_node_struct_field_series(op, data.obj, **kwargs).groupby(
+        groupings, group_keys=False
+    )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
 import ibis.expr.analysis as an
 import ibis.expr.operations as ops
@@ -20,6 +21,55 @@ def get_grouping(grouper):
     return grouper
 
 
+_has_arrow_dtype = hasattr(pd, "ArrowDtype")
+
+
+def arrow_array(data: pd.Series) -> pa.Array | None:
+    """Return the Arrow array backing `data`.
+
+    Returns `None` for columns that aren't backed by Arrow memory, and on
+    versions of pandas without `ArrowDtype`.
+    """
+    dtype = data.dtype
+    if not _has_arrow_dtype:
+        return None
+    elif isinstance(dtype, pd.StringDtype):
+        if not dtype.storage.startswith("pyarrow"):
+            return None
+    elif not isinstance(dtype, pd.ArrowDtype):
+        return None
+
+    array = pa.array(data.array)
+    if isinstance(array, pa.ChunkedArray):
+        # offsets based kernels need a contiguous array
+        array = array.chunk(0) if array.num_chunks == 1 else array.combine_chunks()
+    return array
+
+
+def arrow_strings(data: pd.Series) -> pa.Array | None:
+    """Return the Arrow array backing `data` if it holds Arrow strings.
+
+    Returns `None` for other columns, e.g., strings stored as Python objects.
+    """
+    array = arrow_array(data)
+    if array is not None and (
+        pa.types.is_string(array.type) or pa.types.is_large_string(array.type)
+    ):
+        return array
+    return None
+
+
+def from_arrow(result: pa.Array | pa.ChunkedArray, data: pd.Series) -> pd.Series:
+    """Wrap the result of an Arrow compute kernel applied to `data`."""
+    series = pd.Series(
+        pd.arrays.ArrowExtensionArray(result), index=data.index, name=data.name
+    )
+    if isinstance(data.dtype, pd.StringDtype) and result.type == pa.string():
+        # keep string results in the same dtype as the input
+        series = series.astype(data.dtype)
+    return series
+
+
 def get_join_suffix_for_op(op: ops.TableColumn, join_op: ops.Join):
     (root_table,) = an.find_immediate_parent_tables(op)
     left_root, right_root = an.find_immediate_parent_tables(
@@ -3,9 +3,12 @@ from __future__ import annotations
 import numpy as np
 import numpy.testing as nt
 import pandas as pd
+import pyarrow as pa
 import pytest
+from pytest import param
 
 import ibis
+from ibis.backends.pandas.execution import execute
 from ibis.backends.pandas.tests.conftest import TestConf as tm
 
 
@@ -213,3 +216,38 @@ def test_array_concat_scalar(client, op, op_raw):
     result = client.execute(expr)
     expected = op_raw(raw_left, raw_right)
     nt.assert_array_equal(result, expected)
+
+
+@pytest.fixture
+def arrow_array_table():
+    values = [[1, 2, 3], None, [], [4]]
+    nested = [[[1], [2, 3]], None, [[]], [[4], None]]
+    df = pd.DataFrame(
+        {
+            "a": pd.Series(values, dtype=pd.ArrowDtype(pa.list_(pa.int64()))),
+            "b": pd.Series(nested, dtype=pd.ArrowDtype(pa.list_(pa.list_(pa.int64())))),
+            "x": pd.Series([1, 2, None, 4], dtype="int64[pyarrow]"),
+        }
+    )
+    return ibis.pandas.connect({"df": df}).table("df")
+
+
+@pytest.mark.parametrize(
+    ("func", "expected"),
+    [
+        param(lambda t: t.a.length(), [3, pd.NA, 0, 1], id="length"),
+        param(lambda t: t.a[1:], [[2, 3], pd.NA, [], []], id="slice"),
+        param(lambda t: t.a[0], [1, pd.NA, pd.NA, 4], id="index"),
+        param(lambda t: t.a[-2], [2, pd.NA, pd.NA, pd.NA], id="negative_index"),
+        param(lambda t: t.b.flatten(), [[1, 2, 3], pd.NA, [], [4]], id="flatten"),
+        param(
+            lambda t: ibis.array([t.x, t.x + 1]),
+            [[1, 2], [2, 3], [None, None], [4, 5]],
+            id="array_column",
+        ),
+    ],
+)
+def test_array_arrow_series(arrow_array_table, func, expected):
+    result = execute(func(arrow_array_table).op())
+    assert isinstance(result.dtype, pd.ArrowDtype)
+    assert result.tolist() == expected
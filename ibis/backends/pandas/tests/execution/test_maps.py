@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytest
+from pytest import param
 
 import ibis
+from ibis.backends.pandas.execution import execute
 from ibis.backends.pandas.tests.conftest import TestConf as tm
 
 
@@ -91,3 +95,27 @@ def test_map_value_for_key_literal_broadcast(t):
     result = expr.execute()
     expected = pd.Series([4, 1, 4], name="dup_strings")
     tm.assert_series_equal(result, expected.astype(expr.type().to_pandas()))
+
+
+@pytest.fixture
+def arrow_map_table():
+    typ = pa.map_(pa.string(), pa.int64())
+    values = [[("a", 1), ("b", None)], None, [], [("b", 2)]]
+    df = pd.DataFrame({"m": pd.Series(values, dtype=pd.ArrowDtype(typ))})
+    return ibis.pandas.connect({"df": df}).table("df")
+
+
+@pytest.mark.parametrize(
+    ("func", "expected"),
+    [
+        param(lambda m: m.length(), [2, pd.NA, 0, 1], id="length"),
+        param(lambda m: m.keys(), [["a", "b"], pd.NA, [], ["b"]], id="keys"),
+        param(lambda m: m.values(), [[1, None], pd.NA, [], [2]], id="values"),
+        param(lambda m: m.get("b", 0), [pd.NA, pd.NA, 0, 2], id="get"),
+        param(lambda m: m.contains("a"), [True, pd.NA, False, False], id="contains"),
+    ],
+)
+def test_map_arrow_series(arrow_map_table, func, expected):
+    result = execute(func(arrow_map_table.m).op())
+    assert isinstance(result.dtype, pd.ArrowDtype)
+    assert result.tolist() == expected
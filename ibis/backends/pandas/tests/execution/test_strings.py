@@ -3,10 +3,13 @@ from __future__ import annotations
 from warnings import catch_warnings
 
 import numpy as np
+import pandas as pd
 import pandas.testing as tm
+import pyarrow as pa
 import pytest
 from pytest import param
 
+import ibis
 from ibis.backends.pandas.execution.strings import sql_like_to_regex
 
 
@@ -165,3 +168,73 @@ def test_translate(
     table = str.maketrans(from_str, to_str)
     series = df.strings_with_space.str.translate(table)
     tm.assert_series_equal(result, series, check_names=False)
+
+
+@pytest.mark.parametrize("dtype", ["string[pyarrow]", pd.ArrowDtype(pa.string())])
+@pytest.mark.parametrize(
+    ("case_func", "expected"),
+    [
+        param(lambda s: s.length(), [3, 0, None, 3], id="length"),
+        param(lambda s: s.ascii_str(), [97, 0, None, 0xE9], id="ascii"),
+        param(
+            lambda s: s.re_search("b{2}"), [False, False, None, True], id="re_search"
+        ),
+        param(
+            lambda s: s.re_replace("(b+)", r"<\1>"),
+            ["a<b>c", "", None, "é<bb>"],
+            id="re_replace",
+        ),
+    ],
+)
+def test_arrow_string_ops(dtype, case_func, expected):
+    df = pd.DataFrame({"s": pd.Series(["abc", "", None, "ébb"], dtype=dtype)})
+    t = ibis.pandas.connect({"df": df}).table("df")
+    result = case_func(t.s).execute()
+    np.testing.assert_array_equal(
+        result.astype(object).where(result.notna(), None), expected
+    )
+
+
+@pytest.mark.parametrize(
+    ("case_func", "expected"),
+    [
+        param(lambda s: s.re_replace("b", r"\\"), ["a\\c", ""], id="re_replace"),
+        param(lambda s: s.re_search(r"(?<=a)b"), [True, False], id="re_search"),
+    ],
+)
+def test_arrow_string_ops_python_fallback(case_func, expected):
+    # neither the replacement nor the lookbehind are supported by RE2
+    df = pd.DataFrame({"s": pd.Series(["abc", ""], dtype="string[pyarrow]")})
+    t = ibis.pandas.connect({"df": df}).table("df")
+    result = case_func(t.s).execute()
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "case_func",
+    [
+        param(lambda s: s.re_replace(r"\w+", "X"), id="replace_word"),
+        param(lambda s: s.re_replace("b*", "-"), id="replace_empty_match"),
+        param(lambda s: s.re_replace("(a|é)", r"<\1>"), id="replace_group"),
+        param(lambda s: s.re_search(r"^\d+$"), id="search_digits"),
+        param(lambda s: s.re_search("a$"), id="search_end"),
+        param(lambda s: s.re_search(r"\bé"), id="search_boundary"),
+        param(lambda s: s.re_search("[[:alpha:]]"), id="search_posix_class"),
+        param(lambda s: s.re_search("(?i)É"), id="search_ignore_case"),
+    ],
+)
+def test_arrow_string_regex_parity(case_func):
+    data = ["ab é", "٣4", "a\n", "abc", "é"]
+    results = []
+    for dtype in (object, "string[pyarrow]"):
+        df = pd.DataFrame({"s": pd.Series(data, dtype=dtype)})
+        t = ibis.pandas.connect({"df": df}).table("df")
+        results.append(case_func(t.s).execute().tolist())
+    assert results[0] == results[1]
+
+
+def test_arrow_string_split():
+    df = pd.DataFrame({"s": pd.Series(["a b", "c"], dtype="string[pyarrow]")})
+    t = ibis.pandas.connect({"df": df}).table("df")
+    result = t.s.split(" ").execute()
+    assert [list(x) for x in result] == [["a", "b"], ["c"]]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections import OrderedDict
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ibis
@@ -86,3 +87,15 @@ def test_struct_field_series_group_by_value(struct_table):
             total=lambda df: df.total.astype(expr.total.type().to_pandas())
         ),
     )
+
+
+def test_struct_field_arrow_series():
+    typ = pa.struct([("fruit", pa.string()), ("weight", pa.int8())])
+    values = [{"fruit": "apple", "weight": None}, None, {"fruit": "pear", "weight": 1}]
+    df = pd.DataFrame({"s": pd.Series(values, dtype=pd.ArrowDtype(typ))})
+    t = Backend().connect({"t": df}).table("t")
+
+    result = execute(t.s["weight"].op())
+    assert result.dtype == pd.ArrowDtype(pa.int8())
+    assert result.name == "weight"
+    assert result.tolist() == [pd.NA, pd.NA, 1]
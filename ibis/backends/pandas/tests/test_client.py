@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+
 import numpy as np
 import pandas as pd
 import pandas.testing as tm
@@ -95,3 +98,66 @@ def test_datetime64_infer(client, unit):
     expr = ibis.literal(value, type="timestamp")
     result = client.execute(expr)
     assert result == pd.Timestamp(value).to_pydatetime()
+
+
+def test_to_pyarrow_batches(table):
+    with table.to_pyarrow_batches(chunk_size=2) as reader:
+        batches = list(reader)
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert all(batch.schema == table.schema().to_pyarrow() for batch in batches)
+    assert pa.Table.from_batches(batches).to_pydict() == {
+        "a": [1, 2, 3],
+        "b": ["a", "b", "c"],
+    }
+
+
+def test_execute_many(client, table):
+    exprs = [table.a.sum(), table.filter(table.a > 1), table.b.length().max()]
+    results = client.execute_many(exprs)
+
+    assert results[0] == 6
+    tm.assert_frame_equal(results[1], table.filter(table.a > 1).execute())
+    assert results[2] == 1
+
+
+def test_execute_many_concurrently(client, table, monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+    execute = client.execute
+
+    def wait_and_execute(expr, **kwargs):
+        # only passes if both expressions are executed at the same time
+        barrier.wait()
+        return execute(expr, **kwargs)
+
+    monkeypatch.setattr(client, "supports_concurrent_execution", True)
+    monkeypatch.setattr(client, "execute", wait_and_execute)
+
+    results = client.execute_many([table.a.sum(), table.a.max()], max_concurrency=2)
+    assert results == [6, 3]
+
+
+def test_execute_async(client, table):
+    async def run():
+        return await asyncio.gather(
+            table.a.sum().execute_async(),
+            client.execute_async(table.b.length().max()),
+            table.to_pyarrow_async(),
+        )
+
+    total, longest, arrow = asyncio.run(run())
+    assert total == 6
+    assert longest == 1
+    assert arrow.to_pydict() == {"a": [1, 2, 3], "b": ["a", "b", "c"]}
+
+
+def test_to_pyarrow_batches_async(table):
+    async def collect():
+        return [batch async for batch in table.to_pyarrow_batches_async(chunk_size=2)]
+
+    batches = asyncio.run(collect())
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert pa.Table.from_batches(batches).to_pydict() == {
+        "a": [1, 2, 3],
+        "b": ["a", "b", "c"],
+    }
@@ -386,6 +386,51 @@ def test_udaf_window_nan():
     tm.assert_frame_equal(result, expected)
 
 
+def test_udaf_window_batched(t2, df2):
+    calls = []
+
+    @udf.reduction(["double", "double"], "double")
+    def my_wm(v, w):
+        raise AssertionError("the batched implementation must be used")
+
+    @my_wm.window
+    def my_wm(lower, upper, v, w):
+        calls.append(len(lower))
+        return [
+            np.average(v[start:stop], weights=w[start:stop])
+            for start, stop in zip(lower, upper)
+        ]
+
+    window = ibis.trailing_window(2, order_by="a", group_by="key")
+    expr = t2.mutate(rolled=my_wm(t2.b, t2.c + 1.0).over(window))
+    result = expr.execute().sort_values(["key", "a"])
+
+    @udf.reduction(["double", "double"], "double")
+    def my_wm_rowwise(v, w):
+        return np.average(v, weights=w)
+
+    expr = t2.mutate(rolled=my_wm_rowwise(t2.b, t2.c + 1.0).over(window))
+    expected = expr.execute().sort_values(["key", "a"])
+
+    tm.assert_frame_equal(result, expected)
+    assert calls == [len(df2)]
+
+
+def test_udaf_window_numba(t2, df2):
+    numba = pytest.importorskip("numba")
+
+    @udf.reduction(["double"], "double")
+    @numba.njit
+    def my_jitted_mean(v):
+        return v.mean()
+
+    window = ibis.trailing_window(2, order_by="a", group_by="key")
+    expr = t2.mutate(rolled=my_jitted_mean(t2.b).over(window))
+    result = expr.execute().sort_values(["key", "a"])
+    expected = t2.mutate(rolled=my_mean(t2.b).over(window)).execute()
+    tm.assert_frame_equal(result, expected.sort_values(["key", "a"]))
+
+
 @pytest.fixture(params=[[0.25, 0.75], [0.01, 0.99]])
 def qs(request):
     return request.param
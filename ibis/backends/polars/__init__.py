@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import tempfile
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -18,7 +20,7 @@ from ibis.common.patterns import Replace
 from ibis.util import gen_name, normalize_filename
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, MutableMapping
+    from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 
     import pandas as pd
     import pyarrow as pa
@@ -465,9 +467,46 @@ class Backend(BaseBackend):
         chunk_size: int = 1_000_000,
         **kwargs: Any,
     ):
-        self._import_pyarrow()
-        table = self._to_pyarrow_table(expr, params=params, limit=limit, **kwargs)
-        return table.to_reader(chunk_size)
+        pa = self._import_pyarrow()
+
+        lf = self.compile(expr, params=params, **kwargs)
+        if limit == "default":
+            limit = ibis.options.sql.default_limit
+        if limit is not None:
+            lf = lf.limit(limit)
+
+        schema = expr.as_table().schema().to_pyarrow()
+        return pa.RecordBatchReader.from_batches(
+            schema, self._stream_batches(lf, schema, chunk_size)
+        )
+
+    @staticmethod
+    def _stream_batches(
+        lf: pl.LazyFrame, schema: pa.Schema, chunk_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        import pyarrow as pa
+
+        def convert(table):
+            table = table.rename_columns(schema.names).cast(schema)
+            return table.to_batches(max_chunksize=chunk_size)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "result.arrow")
+
+            # let the streaming engine spill the result to disk, then read it
+            # back one batch at a time from a memory map
+            try:
+                lf.sink_ipc(path, compression=None)
+            except pl.InvalidOperationError:
+                # the query isn't supported by the streaming engine
+                yield from convert(lf.collect().to_arrow())
+                return
+
+            with pa.memory_map(path) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    batch = reader.get_batch(i)
+                    yield from convert(pa.Table.from_batches([batch]))
 
     def _load_into_cache(self, name, expr):
         self.create_table(name, self.compile(expr).cache())
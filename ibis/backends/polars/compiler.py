@@ -43,10 +43,33 @@ def _literal_value(op, nan_as_none=False):
 
 
 @singledispatch
-def translate(expr, *, ctx):
+def _translate(expr, *, ctx, **_):
     raise NotImplementedError(expr)
 
 
+def translate(expr, *, ctx, cache=None, **kw):
+    """Translate an ibis operation into a polars expression or LazyFrame.
+
+    Translations are memoized per compilation, so subexpressions referenced
+    multiple times, e.g. in self joins, are translated only once and the
+    resulting plans share the same `LazyFrame` objects, which allows polars to
+    eliminate the common subplans.
+    """
+    if cache is None:
+        cache = {}
+    if not isinstance(expr, ops.Node):
+        return _translate(expr, ctx=ctx, cache=cache, **kw)
+    try:
+        return cache[expr]
+    except KeyError:
+        result = cache[expr] = _translate(expr, ctx=ctx, cache=cache, **kw)
+        return result
+
+
+translate.register = _translate.register
+translate.registry = _translate.registry
+
+
 @translate.register(ops.Node)
 def operation(op, **_):
     raise com.OperationNotDefinedError(f"No translation rule for {type(op)}")
@@ -134,13 +157,13 @@ _TIMESTAMP_SCALE_TO_UNITS = {
 
 
 @translate.register(ops.Cast)
-def cast(op, **_):
-    return _cast(op, strict=True)
+def cast(op, **kw):
+    return _cast(op, strict=True, **kw)
 
 
 @translate.register(ops.TryCast)
-def try_cast(op, **_):
-    return _cast(op, strict=False)
+def try_cast(op, **kw):
+    return _cast(op, strict=False, **kw)
 
 
 def _cast(op, strict=True, **kw):
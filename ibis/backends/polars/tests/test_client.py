@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+
+import ibis
+
+pl = pytest.importorskip("polars")
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def table():
+    con = ibis.polars.connect({"t": pl.DataFrame({"a": [3, 1, 2], "b": list("xyz")})})
+    return con.table("t")
+
+
+@pytest.mark.parametrize(
+    ("make_expr", "expected"),
+    [
+        pytest.param(
+            lambda t: t.filter(t.a > 1),
+            {"a": [3, 2], "b": ["x", "z"]},
+            id="streaming",
+        ),
+        pytest.param(
+            lambda t: t.order_by("a"),
+            {"a": [1, 2, 3], "b": ["y", "z", "x"]},
+            id="sort",
+        ),
+    ],
+)
+def test_to_pyarrow_batches(table, make_expr, expected):
+    expr = make_expr(table)
+    with expr.to_pyarrow_batches(chunk_size=1) as reader:
+        batches = list(reader)
+
+    assert all(batch.num_rows == 1 for batch in batches)
+    assert all(batch.schema == expr.schema().to_pyarrow() for batch in batches)
+    assert pa.Table.from_batches(batches).to_pydict() == expected
+
+
+def test_to_pyarrow_batches_not_streamable(table, monkeypatch):
+    def sink_ipc(*_, **__):
+        raise pl.InvalidOperationError("not supported in standard engine")
+
+    monkeypatch.setattr(pl.LazyFrame, "sink_ipc", sink_ipc)
+
+    with table.to_pyarrow_batches(chunk_size=2) as reader:
+        batches = list(reader)
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert pa.Table.from_batches(batches).to_pydict() == {
+        "a": [3, 1, 2],
+        "b": ["x", "y", "z"],
+    }
+
+
+def test_to_pyarrow_batches_limit(table):
+    with table.to_pyarrow_batches(limit=2) as reader:
+        assert reader.read_all().num_rows == 2
+
+
+def test_compile_translates_shared_subexpressions_once(table, mocker):
+    from ibis.backends.polars import compiler
+
+    spy = mocker.spy(compiler, "_translate")
+
+    filtered = table.filter(table.a > 1)
+    expr = filtered.join(filtered.view(), "a").select("a", "b_right")
+    result = expr.execute()
+
+    translated = [call.args[0] for call in spy.call_args_list]
+    assert len(translated) == len(set(translated))
+    assert sorted(result.a) == [2, 3]
+
+
+@pytest.mark.parametrize("method", ["cast", "try_cast"])
+def test_cast(table, method):
+    expr = getattr(table.a, method)("float64")
+    assert table._find_backend().compile(expr) is not None
+    assert expr.execute().tolist() == [3.0, 1.0, 2.0]
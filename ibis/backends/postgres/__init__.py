@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import inspect
+import io
 import textwrap
 from typing import TYPE_CHECKING, Callable, Literal
 
@@ -19,9 +20,26 @@ from ibis.common.exceptions import InvalidDecoratorError
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    import pyarrow as pa
+
     import ibis.expr.datatypes as dt
 
 
+def _copyable_as_csv(typ: pa.DataType) -> bool:
+    import pyarrow as pa
+
+    return (
+        pa.types.is_integer(typ)
+        or pa.types.is_floating(typ)
+        or pa.types.is_decimal(typ)
+        or pa.types.is_boolean(typ)
+        or pa.types.is_string(typ)
+        or pa.types.is_large_string(typ)
+        or pa.types.is_date(typ)
+        or pa.types.is_timestamp(typ)
+    )
+
+
 def _verify_source_line(func_name: str, line: str):
     if line.startswith("@"):
         raise InvalidDecoratorError(func_name, line)
@@ -288,6 +306,33 @@ ORDER BY attnum"""
         yield f"DROP VIEW IF EXISTS {name}"
         yield f"CREATE TEMPORARY VIEW {name} AS {definition}"
 
+    def _bulk_insert(self, con, table: sa.Table, data: pa.Table) -> None:
+        import pyarrow.csv as pacsv
+
+        if not all(map(_copyable_as_csv, data.schema.types)):
+            super()._bulk_insert(con, table, data)
+            return
+
+        preparer = con.dialect.identifier_preparer
+        columns = ", ".join(map(preparer.quote, data.column_names))
+        # arrow quotes all strings and writes nulls as empty unquoted fields,
+        # which is exactly how COPY's csv format tells the two apart
+        sql = (
+            f"COPY {preparer.format_table(table)} ({columns}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        options = pacsv.WriteOptions(include_header=False)
+
+        cursor = con.connection.cursor()
+        try:
+            for batch in data.to_batches(max_chunksize=self.insert_batch_size):
+                buf = io.BytesIO()
+                pacsv.write_csv(batch, buf, write_options=options)
+                buf.seek(0)
+                cursor.copy_expert(sql, buf)
+        finally:
+            cursor.close()
+
     def create_schema(
         self, name: str, database: str | None = None, force: bool = False
     ) -> None:
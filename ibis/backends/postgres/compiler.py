@@ -36,4 +36,6 @@ def _any_all_no_op(expr):
 
 class PostgreSQLCompiler(AlchemyCompiler):
     translator_class = PostgreSQLExprTranslator
+    # larger in-memory tables are uploaded into temporary tables
+    in_memory_table_registration_threshold = 1_000
     rewrites = AlchemyCompiler.rewrites | rewrite_sample
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -7,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 import pyspark
 import sqlalchemy as sa
 import sqlglot as sg
+import toolz
 from pyspark import SparkConf
 from pyspark.sql import DataFrame, SparkSession
 
@@ -48,6 +50,26 @@ def normalize_filenames(source_list):
     return list(map(util.normalize_filename, source_list))
 
 
+def _is_nested_timestamp(typ) -> bool:
+    """Whether the Arrow type `typ` holds timestamps inside a nested type."""
+    import pyarrow as pa
+
+    if pa.types.is_list(typ) or pa.types.is_large_list(typ):
+        value_type = typ.value_type
+        return pa.types.is_timestamp(value_type) or _is_nested_timestamp(value_type)
+    if pa.types.is_map(typ):
+        return any(
+            pa.types.is_timestamp(t) or _is_nested_timestamp(t)
+            for t in (typ.key_type, typ.item_type)
+        )
+    if pa.types.is_struct(typ):
+        return any(
+            pa.types.is_timestamp(field.type) or _is_nested_timestamp(field.type)
+            for field in typ
+        )
+    return False
+
+
 class _PySparkCursor:
     """Spark cursor.
 
@@ -281,12 +303,14 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         Table
             Table named `name` from `database`
         """
-        jtable = self._get_jtable(name, database)
-        name, database = jtable.name(), jtable.database()
 
-        qualified_name = self._fully_qualified_name(name, database)
+        def fetch():
+            jtable = self._get_jtable(name, database)
+            table_name, table_database = jtable.name(), jtable.database()
+            qualified_name = self._fully_qualified_name(table_name, table_database)
+            return table_name, table_database, self.get_schema(qualified_name)
 
-        schema = self.get_schema(qualified_name)
+        name, database, schema = self._cached_schema(("table", name, database), fetch)
         node = ops.DatabaseTable(
             name, schema, self, namespace=ops.Namespace(database=database)
         )
@@ -411,6 +435,7 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
                 spark_df = self._session.createDataFrame(obj)
                 mode = "overwrite" if overwrite else "error"
                 spark_df.write.saveAsTable(name, format=format, mode=mode)
+                self.invalidate_schema(name)
                 return None
             else:
                 self._register_in_memory_tables(obj)
@@ -435,6 +460,7 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
             )
 
         self.raw_sql(statement.compile())
+        self.invalidate_schema(name)
         return self.table(name, database=database)
 
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
@@ -472,6 +498,7 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
             name, select, database=database, can_exist=overwrite, temporary=True
         )
         self.raw_sql(statement.compile())
+        self.invalidate_schema(name)
         return self.table(name, database=database)
 
     def drop_table(
@@ -520,6 +547,7 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         """
         statement = DropTable(name, database=database, must_exist=not force)
         self.raw_sql(statement.compile())
+        self.invalidate_schema(name)
 
     def rename_table(self, old_name: str, new_name: str) -> None:
         """Rename an existing table.
@@ -533,6 +561,8 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         """
         statement = ddl.RenameTable(old_name, new_name)
         self.raw_sql(statement.compile())
+        self.invalidate_schema(old_name)
+        self.invalidate_schema(new_name)
 
     def truncate_table(self, name: str, database: str | None = None) -> None:
         """Delete all rows from an existing table.
@@ -642,6 +672,7 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         table_name = table_name or util.gen_name("read_delta")
 
         spark_df.createOrReplaceTempView(table_name)
+        self.invalidate_schema(table_name)
         return self.table(table_name)
 
     def read_parquet(
@@ -673,6 +704,7 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         table_name = table_name or util.gen_name("read_parquet")
 
         spark_df.createOrReplaceTempView(table_name)
+        self.invalidate_schema(table_name)
         return self.table(table_name)
 
     def read_csv(
@@ -709,6 +741,7 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         table_name = table_name or util.gen_name("read_csv")
 
         spark_df.createOrReplaceTempView(table_name)
+        self.invalidate_schema(table_name)
         return self.table(table_name)
 
     def read_json(
@@ -741,6 +774,7 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         table_name = table_name or util.gen_name("read_json")
 
         spark_df.createOrReplaceTempView(table_name)
+        self.invalidate_schema(table_name)
         return self.table(table_name)
 
     def register(
@@ -825,6 +859,44 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         """
         expr.compile().write.format("delta").save(os.fspath(path), **kwargs)
 
+    def _compile_with_limit(self, table_expr, params=None, limit=None, **kwargs):
+        df = self.compile(table_expr, params=params, **kwargs)
+        if limit == "default":
+            limit = ibis.options.sql.default_limit
+        if limit is not None:
+            df = df.limit(limit)
+        return df
+
+    @staticmethod
+    def _arrow_schema(df) -> pa.Schema | None:
+        """Return the Arrow schema of `df` if Spark is able to export it to Arrow."""
+        from pyspark.sql.pandas.types import to_arrow_schema
+
+        try:
+            return to_arrow_schema(df.schema)
+        except TypeError:
+            return None
+
+    @classmethod
+    def _collect_as_arrow(cls, df) -> pa.Table | None:
+        """Collect `df` as an Arrow table, or return None if Spark can't.
+
+        `DataFrame._collect_as_arrow` is private to PySpark, so fall back to
+        the pandas conversion if it is missing or fails.
+        """
+        import pyarrow as pa
+
+        collect = getattr(df, "_collect_as_arrow", None)
+        if collect is None or (arrow_schema := cls._arrow_schema(df)) is None:
+            return None
+        try:
+            batches = collect()
+        except Exception:  # noqa: BLE001
+            return None
+        if batches:
+            return pa.Table.from_batches(batches)
+        return arrow_schema.empty_table()
+
     def to_pyarrow(
         self,
         expr: ir.Expr,
@@ -838,10 +910,12 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         from ibis.formats.pyarrow import PyArrowData
 
         table_expr = expr.as_table()
-        output = pa.Table.from_pandas(
-            self.execute(table_expr, params=params, limit=limit, **kwargs),
-            preserve_index=False,
-        )
+        df = self._compile_with_limit(table_expr, params=params, limit=limit, **kwargs)
+
+        if (output := self._collect_as_arrow(df)) is None:
+            frame = table_expr.__pandas_result__(df.toPandas())
+            output = pa.Table.from_pandas(frame, preserve_index=False)
+
         table = PyArrowData.convert_table(output, table_expr.schema())
         return expr.__pyarrow_result__(table)
 
@@ -854,10 +928,56 @@ class Backend(BaseSQLBackend, CanCreateDatabase):
         chunk_size: int = 1000000,
         **kwargs: Any,
     ) -> pa.ipc.RecordBatchReader:
+        import pandas as pd
+
+        from ibis.formats.pyarrow import PyArrowData
+
         pa = self._import_pyarrow()
-        pa_table = self.to_pyarrow(
-            expr.as_table(), params=params, limit=limit, **kwargs
-        )
-        return pa.RecordBatchReader.from_batches(
-            pa_table.schema, pa_table.to_batches(max_chunksize=chunk_size)
-        )
+
+        table_expr = expr.as_table()
+        schema = table_expr.schema()
+        df = self._compile_with_limit(table_expr, params=params, limit=limit, **kwargs)
+        arrow_schema = self._arrow_schema(df)
+        if arrow_schema is not None and any(
+            _is_nested_timestamp(field.type) for field in arrow_schema
+        ):
+            # timestamps nested in rows can't be localized below
+            arrow_schema = None
+
+        def to_arrow(column, field):
+            if pa.types.is_timestamp(field.type):
+                # `Row` timestamps are naive datetimes in the driver's local
+                # time zone, so turn them into the UTC instants Spark's own
+                # Arrow serialization produces
+                column = [
+                    None if value is None else value.astimezone(datetime.timezone.utc)
+                    for value in column
+                ]
+            return pa.array(column, type=field.type)
+
+        def convert(chunk):
+            if arrow_schema is not None:
+                # build the arrow columns straight from the rows
+                columns = zip(*chunk)
+                output = pa.Table.from_arrays(
+                    [
+                        to_arrow(column, field)
+                        for column, field in zip(columns, arrow_schema)
+                    ],
+                    schema=arrow_schema,
+                )
+            else:
+                frame = table_expr.__pandas_result__(
+                    pd.DataFrame.from_records(chunk, columns=df.columns)
+                )
+                output = pa.Table.from_pandas(frame, preserve_index=False)
+            return PyArrowData.convert_table(output, schema)
+
+        # pull the result one partition at a time instead of collecting it on
+        # the driver in one go, casting every chunk to the expected schema
+        def batches():
+            rows = df.toLocalIterator(prefetchPartitions=True)
+            for chunk in toolz.partition_all(chunk_size, rows):
+                yield from convert(chunk).replace_schema_metadata().to_batches()
+
+        return pa.RecordBatchReader.from_batches(schema.to_pyarrow(), batches())
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pandas as pd
 import pandas.testing as tm
+import pyarrow as pa
 import pytest
 from pytest import param
 
@@ -241,3 +242,23 @@ def test_interval_columns_invalid(con):
     msg = r"DayTimeIntervalType\(0, 1\) couldn't be converted to Interval"
     with pytest.raises(IbisTypeError, match=msg):
         con.table("invalid_interval_table")
+
+
+@pytest.mark.parametrize("limit", [None, 3])
+def test_to_pyarrow(con, limit):
+    table = con.table("basic_table")
+    result = table.to_pyarrow(limit=limit)
+
+    n = 10 if limit is None else limit
+    assert result.schema == table.schema().to_pyarrow()
+    assert result.to_pydict() == {"id": list(range(n)), "str_col": ["value"] * n}
+
+
+def test_to_pyarrow_batches(con):
+    table = con.table("basic_table")
+    with table.to_pyarrow_batches(chunk_size=4) as reader:
+        batches = list(reader)
+
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
+    assert all(batch.schema == table.schema().to_pyarrow() for batch in batches)
+    assert sorted(pa.Table.from_batches(batches)["id"].to_pylist()) == list(range(10))
@@ -126,6 +126,9 @@ class Backend(AlchemyCrossSchemaBackend, CanCreateDatabase, AlchemyCanCreateSche
     compiler = SnowflakeCompiler
     supports_create_or_replace = True
     supports_python_udfs = True
+    # the number of result chunks downloaded and converted concurrently by
+    # `to_pyarrow_batches`, bounding the number of chunks held in memory
+    prefetch_batches = 4
 
     _latest_udf_python_version = (3, 10)
 
@@ -275,6 +278,8 @@ $$ {defn["source"]} $$"""
                         )
 
         super().do_connect(engine)
+        # content digest of uploaded in-memory tables to their names
+        self._memtables: dict[bytes, str] = {}
 
         def normalize_name(name):
             if name is None:
@@ -383,8 +388,7 @@ $$"""
 
         self._run_pre_execute_hooks(expr)
 
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        sql = self._compile_query(expr, limit=limit, params=params)
         with self.begin() as con:
             res = con.execute(sql).cursor.fetch_arrow_all()
 
@@ -409,8 +413,7 @@ $$"""
         **_: Any,
     ) -> Iterator[pd.DataFrame | pd.Series | Any]:
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        sql = self._compile_query(expr, limit=limit, params=params)
         target_schema = expr.as_table().schema()
         converter = functools.partial(
             SnowflakePandasData.convert_table, schema=target_schema
@@ -432,8 +435,7 @@ $$"""
         **_: Any,
     ) -> pa.ipc.RecordBatchReader:
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        sql = self._compile_query(expr, limit=limit, params=params)
         target_schema = expr.as_table().schema().to_pyarrow()
 
         return pa.RecordBatchReader.from_batches(
@@ -446,14 +448,28 @@ $$"""
     def _make_batch_iter(
         self, sql: str, *, target_schema: sch.Schema, chunk_size: int
     ) -> Iterator[pa.RecordBatch]:
-        with self.begin() as con, contextlib.closing(con.execute(sql)) as cur:
-            yield from itertools.chain.from_iterable(
-                t.rename_columns(target_schema.names)
+        def convert(table: pa.Table) -> list[pa.RecordBatch]:
+            return (
+                table.rename_columns(target_schema.names)
                 .cast(target_schema)
                 .to_batches(max_chunksize=chunk_size)
-                for t in cur.cursor.fetch_arrow_batches()
             )
 
+        with self.begin() as con, contextlib.closing(con.execute(sql)) as cur:
+            cursor = cur.cursor
+            if (result_batches := cursor.get_result_batches()) is None:
+                chunks = map(convert, cursor.fetch_arrow_batches())
+            else:
+                # the result chunks are independent of each other, so download
+                # and convert the upcoming chunks while the current one is
+                # consumed
+                chunks = util.map_threaded(
+                    lambda batch: convert(batch.to_arrow(cursor.connection)),
+                    result_batches,
+                    maxsize=self.prefetch_batches,
+                )
+            yield from itertools.chain.from_iterable(chunks)
+
     def _metadata(self, query: str) -> Iterable[tuple[str, dt.DataType]]:
         with self.begin() as con:
             con.exec_driver_sql(query)
@@ -544,8 +560,24 @@ $$"""
 
         raw_name = op.name
 
+        try:
+            digest = op.data.digest(op.schema)
+        except TypeError:
+            digest = None
+
         with self.begin() as con:
-            if con.exec_driver_sql(f"SHOW TABLES LIKE '{raw_name}'").scalar() is None:
+            if (
+                con.exec_driver_sql(f"SHOW TABLES LIKE '{raw_name}'").scalar()
+                is not None
+            ):
+                return
+            elif (source := self._memtables.get(digest)) is not None:
+                # the same data has already been uploaded under another name
+                con.exec_driver_sql(
+                    f"CREATE OR REPLACE TEMP VIEW {self._quote(raw_name)} "
+                    f"AS SELECT * FROM {self._quote(source)}"
+                )
+            else:
                 tmpdir = tempfile.TemporaryDirectory()
                 try:
                     path = os.path.join(tmpdir.name, f"{raw_name}.parquet")
@@ -558,6 +590,8 @@ $$"""
                 finally:
                     with contextlib.suppress(Exception):
                         shutil.rmtree(tmpdir.name)
+                if digest is not None:
+                    self._memtables[digest] = raw_name
 
     def _get_temp_view_definition(
         self, name: str, definition: sa.sql.compiler.Compiled
@@ -706,6 +740,7 @@ $$"""
         with self.begin() as con:
             con.exec_driver_sql(create_stmt)
 
+        self.invalidate_schema(name)
         return self.table(name, schema=db, database=catalog)
 
     def drop_table(
@@ -724,6 +759,7 @@ $$"""
 
         with self.begin() as con:
             con.exec_driver_sql(drop_stmt)
+        self.invalidate_schema(name)
 
     def read_csv(
         self, path: str | Path, table_name: str | None = None, **kwargs: Any
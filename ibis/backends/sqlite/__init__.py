@@ -36,6 +36,8 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
     from pathlib import Path
 
+    import pyarrow as pa
+
     import ibis.expr.operations as ops
     import ibis.expr.types as ir
 
@@ -102,6 +104,9 @@ class Backend(BaseAlchemyBackend, CanListDatabases):
         engine = sa.create_engine(
             f"sqlite:///{database if database is not None else ':memory:'}",
             poolclass=sa.pool.StaticPool,
+            # the `*_async` methods run queries on a worker thread; the single
+            # pooled connection and the single worker serialize access to it
+            connect_args={"check_same_thread": False},
         )
 
         if type_map:
@@ -261,3 +266,37 @@ class Backend(BaseAlchemyBackend, CanListDatabases):
         return super()._get_compiled_statement(
             view, definition, compile_kwargs={"literal_binds": True}
         )
+
+    def _bulk_insert(self, con, table: sa.Table, data: pa.Table) -> None:
+        # execute a single prepared statement per batch, binding whole columns
+        # at a time instead of going through sqlalchemy's per row processing
+        dialect = con.dialect
+        try:
+            columns = [table.c[name] for name in data.column_names]
+        except KeyError:
+            # let sqlalchemy raise an informative error
+            super()._bulk_insert(con, table, data)
+            return
+
+        quote = dialect.identifier_preparer.quote
+        names = ", ".join(quote(column.name) for column in columns)
+        placeholders = ", ".join("?" * len(columns))
+        sql = (
+            f"INSERT INTO {dialect.identifier_preparer.format_table(table)} "
+            f"({names}) VALUES ({placeholders})"
+        )
+        processors = [
+            column.type.dialect_impl(dialect).bind_processor(dialect)
+            for column in columns
+        ]
+
+        cursor = con.connection.cursor()
+        try:
+            for batch in data.to_batches(max_chunksize=self.insert_batch_size):
+                values = [
+                    values if process is None else list(map(process, values))
+                    for values, process in zip(batch.to_pydict().values(), processors)
+                ]
+                cursor.executemany(sql, zip(*values))
+        finally:
+            cursor.close()
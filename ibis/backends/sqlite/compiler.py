@@ -32,5 +32,8 @@ rewrites = SQLiteExprTranslator.rewrites
 class SQLiteCompiler(AlchemyCompiler):
     translator_class = SQLiteExprTranslator
     support_values_syntax_in_select = False
+    # larger in-memory tables are uploaded into temporary tables, SQLite
+    # doesn't allow more than 500 terms in a compound SELECT by default
+    in_memory_table_registration_threshold = 500
     null_limit = None
     rewrites = AlchemyCompiler.rewrites | rewrite_sample
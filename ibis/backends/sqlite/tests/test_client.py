@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import uuid
 from pathlib import Path
 
@@ -132,3 +133,200 @@ def test_builtin_agg_udf(con):
     expr = total(con.tables.functional_alltypes.limit(2).select(n=ibis.NA).n)
     result = con.execute(expr)
     assert result == 0.0
+
+
+def test_to_pyarrow_batches_columnar():
+    pa = pytest.importorskip("pyarrow")
+
+    con = ibis.sqlite.connect()
+    with con.begin() as c:
+        c.exec_driver_sql("CREATE TABLE t (a INTEGER, b TEXT, c REAL)")
+        c.exec_driver_sql(
+            "INSERT INTO t VALUES (1, 'x', 1.5), (NULL, NULL, NULL), (3, 'z', 2.5)"
+        )
+    t = con.table("t")
+
+    with con.to_pyarrow_batches(t, chunk_size=2) as reader:
+        batches = list(reader)
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    result = pa.Table.from_batches(batches)
+    assert result.schema == t.schema().to_pyarrow()
+    assert result.to_pydict() == {
+        "a": [1, None, 3],
+        "b": ["x", None, "z"],
+        "c": [1.5, None, 2.5],
+    }
+
+
+def test_to_pyarrow_batches_native_arrow(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+
+    con = ibis.sqlite.connect()
+    with con.begin() as c:
+        c.exec_driver_sql("CREATE TABLE t (a INTEGER, b TEXT)")
+    t = con.table("t")
+
+    # emulate a driver that can fetch arrow data natively, with column names
+    # and types that differ from the expected ones
+    class Cursor:
+        def fetch_record_batch(self):
+            data = pa.table({"A": pa.array([1, 2, 3], pa.int64()), "B": list("xyz")})
+            return pa.RecordBatchReader.from_batches(data.schema, data.to_batches())
+
+    @contextlib.contextmanager
+    def safe_raw_sql(*_, **__):
+        yield Cursor()
+
+    monkeypatch.setattr(con, "_safe_raw_sql", safe_raw_sql)
+
+    with con.to_pyarrow_batches(t, chunk_size=2) as reader:
+        batches = list(reader)
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    result = pa.Table.from_batches(batches)
+    assert result.schema == t.schema().to_pyarrow()
+    assert result.to_pydict() == {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+
+@pytest.mark.parametrize("wrap", [lambda df: df, ibis.memtable], ids=["df", "memtable"])
+def test_bulk_insert(monkeypatch, wrap):
+    pd = pytest.importorskip("pandas")
+
+    con = ibis.sqlite.connect()
+    monkeypatch.setattr(con, "insert_batch_size", 2)
+    schema = ibis.schema(
+        {"a": "int64", "b": "string", "c": "timestamp", "d": "float64", "e": "date"}
+    )
+    con.create_table("t", schema=schema)
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": ["x", None, ""],
+            "c": [pd.Timestamp("2020-01-01 01:02:03.123456"), None, pd.Timestamp(0)],
+            "d": [1.5, None, 2.5],
+            "e": pd.to_datetime(["2020-01-02", None, "2021-01-02"]).date,
+        }
+    )
+
+    con.insert("t", wrap(df))
+    con.insert("t", wrap(df), overwrite=True)
+
+    result = con.table("t").order_by("a").execute()
+    expected = df.assign(e=lambda df: df.e.where(df.e.notna(), None))
+    tm.assert_frame_equal(result, expected)
+
+    # values are stored in the same format as the sqlalchemy based insert
+    raw = con.raw_sql("SELECT c, e FROM t WHERE a = 1").fetchall()
+    assert raw == [("2020-01-01 01:02:03.123456", "2020-01-02")]
+
+
+def test_bulk_insert_mixed_objects():
+    pd = pytest.importorskip("pandas")
+
+    con = ibis.sqlite.connect()
+    with con.begin() as c:
+        c.exec_driver_sql("CREATE TABLE t (x TEXT)")
+
+    # can't be converted to arrow, inserted row by row instead
+    con.insert("t", pd.DataFrame({"x": [1, "a"]}))
+    assert con.raw_sql("SELECT x FROM t").fetchall() == [("1",), ("a",)]
+
+
+def test_large_memtable_is_uploaded(mocker):
+    pd = pytest.importorskip("pandas")
+
+    con = ibis.sqlite.connect()
+    n = con.compiler.in_memory_table_registration_threshold + 1
+    t = ibis.memtable(pd.DataFrame({"a": range(n), "b": ["x", "y"] * (n // 2) + ["x"]}))
+
+    # large tables are referenced by name instead of being inlined
+    assert t.op().name in ibis.to_sql(t, dialect="sqlite")
+
+    spy = mocker.spy(con, "_bulk_insert")
+    expr = t.group_by("b").agg(n=t.a.count(), s=t.a.sum()).order_by("b")
+    expected = pd.DataFrame(
+        {
+            "b": ["x", "y"],
+            "n": [n // 2 + 1, n // 2],
+            "s": [n**2 // 4, n**2 // 4 - n // 2],
+        }
+    )
+    tm.assert_frame_equal(con.execute(expr), expected)
+    assert con.execute(t.join(t.view(), "a").count()) == n
+
+    # the data is only uploaded once
+    assert spy.call_count == 1
+
+
+def test_small_memtable_is_inlined():
+    con = ibis.sqlite.connect()
+    t = ibis.memtable({"a": [1, 2, 2], "b": ["x", "x", None]})
+    assert t.op().name not in ibis.to_sql(t, dialect="sqlite")
+    assert con.execute(t.a.sum()) == 5
+    assert con.execute(t.b.isnull().sum()) == 1
+
+
+def test_create_view_over_large_memtable(tmp_path):
+    path = tmp_path / "test.db"
+    con = ibis.sqlite.connect(path)
+    n = con.compiler.in_memory_table_registration_threshold + 100
+    con.create_view("v", ibis.memtable({"a": range(n)}))
+
+    # the view doesn't depend on a temporary table, it outlives the connection
+    con = ibis.sqlite.connect(path)
+    v = con.table("v")
+    assert v.count().execute() == n
+    assert v.a.sum().execute() == n * (n - 1) // 2
+
+
+def test_memtable_literals_are_not_conflated():
+    from decimal import Decimal
+
+    from ibis.backends.base.sql.compiler.query_builder import (
+        translate_in_memory_table_rows,
+    )
+
+    pd = pytest.importorskip("pandas")
+
+    df = pd.DataFrame(
+        {
+            "x": [0.0, -0.0, 0.0],
+            "y": [Decimal("1.0"), Decimal("1.00"), Decimal("1.0")],
+        }
+    )
+    translated = []
+
+    def translate(op):
+        translated.append(op)
+        return op
+
+    rows = translate_in_memory_table_rows(ibis.memtable(df).op(), translate)
+    assert [str(x.value) for x, _ in rows] == ["0.0", "-0.0", "0.0"]
+    # equal values with different representations are translated separately
+    assert len(translated) == 4
+
+
+def test_execute_async():
+    import asyncio
+
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", ibis.memtable({"a": [1, 2, 3]}))
+
+    async def run():
+        return await asyncio.gather(
+            t.a.sum().execute_async(),
+            t.to_pyarrow_async(),
+            collect(t.to_pyarrow_batches_async(chunk_size=2)),
+        )
+
+    async def collect(batches):
+        return [batch.num_rows async for batch in batches]
+
+    total, arrow, batches = asyncio.run(run())
+    assert total == 6
+    assert arrow.to_pydict() == {"a": [1, 2, 3]}
+    assert batches == [2, 1]
+
+    # the connection is still usable, in-memory data included
+    assert t.a.sum().execute() == 6
@@ -387,6 +387,7 @@ class Backend(AlchemyCrossSchemaBackend, AlchemyCanCreateSchema, CanListDatabase
                     f"ALTER TABLE IF EXISTS {table_ref} RENAME TO {self._quote(orig_table_ref)}"
                 )
 
+        self.invalidate_schema(name)
         return self.table(orig_table_ref)
 
     def _table_from_schema(
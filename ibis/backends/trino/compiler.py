@@ -5,6 +5,9 @@ import sqlalchemy as sa
 import ibis.expr.operations as ops
 from ibis.backends.base.sql.alchemy import AlchemyCompiler, AlchemyExprTranslator
 from ibis.backends.base.sql.alchemy.query_builder import _AlchemyTableSetFormatter
+from ibis.backends.base.sql.compiler.query_builder import (
+    translate_in_memory_table_rows,
+)
 from ibis.backends.trino.datatypes import TrinoType
 from ibis.backends.trino.registry import operation_registry
 from ibis.common.exceptions import UnsupportedOperationError
@@ -67,13 +70,10 @@ class TrinoTableSetFormatter(_AlchemyTableSetFormatter):
                 )
             ).limit(0)
 
-        op_schema = list(op.schema.items())
+        names = op.schema.names
         rows = [
-            tuple(
-                translator.translate(ops.Literal(col, dtype=type_)).label(name)
-                for col, (name, type_) in zip(row, op_schema)
-            )
-            for row in op.data.to_frame().itertuples(index=False)
+            tuple(literal.label(name) for literal, name in zip(row, names))
+            for row in translate_in_memory_table_rows(op, translator.translate)
         ]
         columns = translator._schema_to_sqlalchemy_columns(op.schema)
         return sa.values(*columns, name=op.name).data(rows).select().subquery()
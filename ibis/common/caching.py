@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import functools
+import hashlib
+import os
 import weakref
 from collections import Counter, defaultdict
 from collections.abc import MutableMapping
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
 from bidict import bidict
@@ -13,6 +16,8 @@ from ibis.common.exceptions import IbisError
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    import pyarrow as pa
+
 
 def memoize(func: Callable) -> Callable:
     """Memoize a function."""
@@ -147,3 +152,147 @@ class RefCountedCache:
         if not self.refs[inv_key]:
             del self.cache[inv_key], self.refs[inv_key]
             self.finalize(key)
+
+
+def _fingerprint(obj: Any) -> str:
+    # deferred to avoid a circular import, the fingerprinting module depends
+    # on the node classes
+    from ibis.common.fingerprint import fingerprint, tokenize
+    from ibis.common.graph import Node
+
+    if isinstance(obj, Node):
+        return fingerprint(obj)
+    return hashlib.sha256(tokenize(obj)).hexdigest()
+
+
+class PersistentCache:
+    """A size-bounded, on-disk cache of PyArrow tables.
+
+    Entries are stored as Parquet files named after their key, so the cache
+    can be shared between processes and survives interpreter restarts.
+    Eviction is least-recently-used, based on file modification times which
+    are refreshed on every hit.
+
+    Parameters
+    ----------
+    directory
+        Directory where cache entries are stored. It is created if it doesn't
+        exist.
+    max_size
+        Maximum total size of the cache entries in bytes. [](`None`) means the
+        cache is unbounded.
+    key
+        Function used to compute the key of an object passed to `get`, `store`
+        or `invalidate`. Strings are always used as-is. Defaults to a
+        content-based digest that is stable across processes.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_size: int | None = None,
+        key: Callable[[Any], str] | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.key = key or _fingerprint
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.directory)!r})"
+
+    def _path(self, key: Any) -> Path:
+        if not isinstance(key, str):
+            key = self.key(key)
+        return self.directory / f"{key}{self.suffix}"
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob(f"*{self.suffix}"))
+
+    def __contains__(self, key: Any) -> bool:
+        return self._path(key).exists()
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the cache entries in bytes."""
+        return sum(path.stat().st_size for path in self._entries())
+
+    def get(self, key: Any, default: Any = None) -> pa.Table | Any:
+        """Return the table stored under `key`, or `default` if missing."""
+        import pyarrow.parquet as pq
+
+        path = self._path(key)
+        try:
+            table = pq.read_table(path)
+        except FileNotFoundError:
+            return default
+        # mark the entry as recently used
+        path.touch()
+        return table
+
+    def store(self, key: Any, table: pa.Table) -> None:
+        """Store `table` under `key`, evicting older entries if needed."""
+        import pyarrow.parquet as pq
+
+        path = self._path(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first so that concurrent readers never
+        # observe a partially written entry
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            pq.write_table(table, tmp)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        if self.max_size is None:
+            return
+
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_size:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def invalidate(self, key: Any) -> bool:
+        """Remove the entry stored under `key`.
+
+        Returns
+        -------
+        bool
+            Whether an entry was removed.
+        """
+        path = self._path(key)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
@@ -0,0 +1,273 @@
+"""Deterministic, content-based digests of expression graphs.
+
+Unlike `hash()`, which depends on object identity and on the per-process
+randomization of string hashes, the digests computed here are stable across
+processes and interpreter restarts, so they can be used as keys for caches
+shared between sessions.
+"""
+from __future__ import annotations
+
+import datetime
+import decimal
+import enum
+import hashlib
+import struct
+import types
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from ibis.common.collections import frozendict
+from ibis.common.dispatch import lazy_singledispatch
+from ibis.common.graph import Node
+from ibis.common.grounds import Concrete
+from ibis.util import PseudoHashable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pandas as pd
+    import pyarrow as pa
+
+
+class _Digest(bytes):
+    """Digest of an already fingerprinted node."""
+
+    __slots__ = ()
+
+
+def _token(tag: bytes, payload: bytes) -> bytes:
+    # length-prefix every token so that the concatenation of tokens is
+    # unambiguous
+    return tag + struct.pack("<Q", len(payload)) + payload
+
+
+def _sha256(*parts: bytes) -> bytes:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part)
+    return h.digest()
+
+
+@lazy_singledispatch
+def tokenize(obj: Any) -> bytes:
+    """Return a deterministic byte representation of `obj`.
+
+    Implementations for additional types can be registered with
+    `tokenize.register`. Objects of unsupported types raise a `TypeError`.
+    """
+    raise TypeError(f"Cannot fingerprint object of type {type(obj).__name__!r}")
+
+
+@tokenize.register(type(None))
+def _(obj: None) -> bytes:
+    return _token(b"N", b"")
+
+
+@tokenize.register(bool)
+def _(obj: bool) -> bytes:
+    return _token(b"?", b"\x01" if obj else b"\x00")
+
+
+@tokenize.register(int)
+def _(obj: int) -> bytes:
+    return _token(b"i", str(obj).encode())
+
+
+@tokenize.register(float)
+def _(obj: float) -> bytes:
+    return _token(b"f", struct.pack("<d", obj))
+
+
+@tokenize.register(complex)
+def _(obj: complex) -> bytes:
+    return _token(b"c", struct.pack("<dd", obj.real, obj.imag))
+
+
+@tokenize.register(str)
+def _(obj: str) -> bytes:
+    return _token(b"s", obj.encode("utf-8", "surrogatepass"))
+
+
+@tokenize.register((bytes, bytearray, memoryview))
+def _(obj: bytes) -> bytes:
+    if isinstance(obj, _Digest):
+        return _token(b"#", obj)
+    return _token(b"b", bytes(obj))
+
+
+@tokenize.register(decimal.Decimal)
+def _(obj: decimal.Decimal) -> bytes:
+    return _token(b"d", str(obj).encode())
+
+
+@tokenize.register(
+    (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)
+)
+def _(obj) -> bytes:
+    return _token(b"t", tokenize(type(obj)) + repr(obj).encode())
+
+
+@tokenize.register(uuid.UUID)
+def _(obj: uuid.UUID) -> bytes:
+    return _token(b"u", obj.bytes)
+
+
+@tokenize.register(enum.Enum)
+def _(obj: enum.Enum) -> bytes:
+    return _token(b"e", tokenize(type(obj)) + tokenize(obj.name))
+
+
+@tokenize.register(type)
+def _(obj: type) -> bytes:
+    return _token(b"T", f"{obj.__module__}.{obj.__qualname__}".encode())
+
+
+@tokenize.register((tuple, list))
+def _(obj) -> bytes:
+    return _token(b"(", b"".join(map(tokenize, obj)))
+
+
+@tokenize.register(frozenset)
+def _(obj: frozenset) -> bytes:
+    # element order isn't deterministic, so sort the element tokens instead
+    return _token(b"{", b"".join(sorted(map(tokenize, obj))))
+
+
+@tokenize.register((dict, frozendict))
+def _(obj) -> bytes:
+    items = (tokenize(k) + tokenize(v) for k, v in obj.items())
+    return _token(b"m", b"".join(items))
+
+
+@tokenize.register(types.FunctionType)
+def _(obj: types.FunctionType) -> bytes:
+    parts = [
+        tokenize(obj.__module__),
+        tokenize(obj.__qualname__),
+        tokenize(obj.__code__),
+        tokenize(obj.__defaults__),
+        # closed over values affect the result of the function
+        tokenize(tuple(cell.cell_contents for cell in obj.__closure__ or ())),
+    ]
+    return _token(b"F", b"".join(parts))
+
+
+@tokenize.register(types.CodeType)
+def _(obj: types.CodeType) -> bytes:
+    parts = [obj.co_code, tokenize(obj.co_consts), tokenize(obj.co_names)]
+    return _token(b"C", b"".join(parts))
+
+
+@tokenize.register(types.BuiltinFunctionType)
+def _(obj: types.BuiltinFunctionType) -> bytes:
+    return _token(b"B", f"{obj.__module__}.{obj.__qualname__}".encode())
+
+
+@tokenize.register("pyarrow.Array")
+def _(obj: pa.Array) -> bytes:
+    h = hashlib.sha256()
+    h.update(tokenize(str(obj.type)))
+    # the offset and length are needed to tell slices sharing buffers apart
+    h.update(struct.pack("<QQ", obj.offset, len(obj)))
+    for buf in obj.buffers():
+        if buf is None:
+            h.update(b"\x00")
+        else:
+            h.update(struct.pack("<Q", buf.size))
+            h.update(buf)
+    if (dictionary := getattr(obj, "dictionary", None)) is not None:
+        h.update(tokenize(dictionary))
+    return _token(b"A", h.digest())
+
+
+@tokenize.register("pyarrow.ChunkedArray")
+def _(obj: pa.ChunkedArray) -> bytes:
+    return _token(b"A", b"".join(map(tokenize, obj.chunks)))
+
+
+@tokenize.register(("pyarrow.Table", "pyarrow.RecordBatch"))
+def _(obj: pa.Table | pa.RecordBatch) -> bytes:
+    parts = [tokenize(obj.schema.names), tokenize(list(obj.columns))]
+    return _token(b"P", _sha256(*parts))
+
+
+@tokenize.register("pandas.DataFrame")
+def _(obj: pd.DataFrame) -> bytes:
+    import pyarrow as pa
+
+    try:
+        table = pa.Table.from_pandas(obj, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        raise TypeError(f"Cannot fingerprint DataFrame: {e}") from e
+    return tokenize(table)
+
+
+@tokenize.register(PseudoHashable)
+def _(obj: PseudoHashable) -> bytes:
+    return tokenize(obj.obj)
+
+
+def _tokenize_node(node: Node, args: Iterable[tuple[str, Any]]) -> bytes:
+    parts = [tokenize(type(node))]
+    if (func := getattr(node, "__func__", None)) is not None:
+        # user defined functions are represented by dynamically created
+        # classes, so include the wrapped function itself
+        parts.append(tokenize(func))
+    for name, value in args:
+        parts.append(tokenize(name))
+        parts.append(tokenize(value))
+    return _sha256(*parts)
+
+
+@lazy_singledispatch
+def fingerprint_args(node: Node, args: dict[str, Any]) -> Iterable[tuple[str, Any]]:
+    """Return the arguments of `node` contributing to its fingerprint.
+
+    `args` maps the argument names of `node` to their values, with the child
+    nodes replaced by their digests. Register implementations for node types
+    with arguments that don't affect the computed result, e.g. randomly
+    generated names.
+    """
+    return args.items()
+
+
+def fingerprint(node: Node) -> str:
+    """Compute a deterministic, content-based digest of an expression graph.
+
+    The digest is a Merkle hash: every node is hashed together with the
+    digests of its children, so shared subexpressions are only hashed once.
+    Equal fingerprints imply structurally equal graphs, even across processes.
+
+    Parameters
+    ----------
+    node
+        The root of the graph.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest.
+
+    Raises
+    ------
+    TypeError
+        If the graph contains values which can't be fingerprinted.
+    """
+
+    def fn(node, _, /, **kwargs):
+        args = fingerprint_args(node, kwargs)
+        return _Digest(_tokenize_node(node, args))
+
+    return node.map(fn)[node].hex()
+
+
+@tokenize.register(Concrete)
+def _(obj: Concrete) -> bytes:
+    if isinstance(obj, Node):
+        return tokenize(_Digest(bytes.fromhex(fingerprint(obj))))
+    return _token(b"O", tokenize(type(obj)) + tokenize(obj.__args__))
+
+
+@tokenize.register(Node)
+def _(obj: Node) -> bytes:
+    return tokenize(_Digest(bytes.fromhex(fingerprint(obj))))
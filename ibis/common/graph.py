@@ -1,6 +1,7 @@
 """Various traversal utilities for the expression graph."""
 from __future__ import annotations
 
+import functools
 from abc import abstractmethod
 from collections import deque
 from collections.abc import Iterable, Iterator, KeysView, Mapping, Sequence
@@ -197,6 +198,80 @@ def _coerce_replacer(obj: ReplacerLike, context: Optional[dict] = None) -> Repla
     return fn
 
 
+def _subtree_types(root: Node) -> frozenset[type]:
+    """Return the types of all nodes in the subtree rooted at `root`.
+
+    The result is cached on nodes providing a `__subtree_types__` slot, so every
+    subtree is summarized at most once during the lifetime of its root. Nodes
+    without such a slot are summarized again on every call.
+
+    Parameters
+    ----------
+    root
+        Root node of the subtree.
+
+    Returns
+    -------
+    The set of node types in the subtree, including the type of `root`.
+    """
+    if (types := getattr(root, "__subtree_types__", None)) is not None:
+        return types
+
+    # summaries of the nodes which can't cache them, keyed by identity since
+    # all of them are kept alive by the root during the traversal
+    memo: dict[int, frozenset[type]] = {}
+
+    def lookup(node):
+        if (types := getattr(node, "__subtree_types__", None)) is None:
+            return memo.get(id(node))
+        return types
+
+    # iterative post-order traversal to avoid hitting the recursion limit
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        if lookup(node) is not None:
+            stack.pop()
+            continue
+
+        children = node.__children__
+        if pending := [child for child in children if lookup(child) is None]:
+            stack.extend(pending)
+            continue
+        stack.pop()
+
+        # reuse the summary of a child where possible, the type sets are
+        # typically shared by large parts of the graph
+        types = None
+        for child in children:
+            child_types = lookup(child)
+            if types is None or child_types > types:
+                types = child_types
+            elif not child_types <= types:
+                types = types | child_types
+        if types is None:
+            types = frozenset((type(node),))
+        elif type(node) not in types:
+            types = types | {type(node)}
+
+        try:
+            object.__setattr__(node, "__subtree_types__", types)
+        except AttributeError:
+            memo[id(node)] = types
+
+    return lookup(root)
+
+
+@functools.lru_cache(maxsize=4096)
+def _any_subclass(types: frozenset[type], classinfo: _ClassInfo) -> bool:
+    return any(issubclass(typ, classinfo) for typ in types)
+
+
+def _contains_instance(node: Node, classinfo: _ClassInfo) -> bool:
+    """Check whether the subtree rooted at `node` has instances of `classinfo`."""
+    return _any_subclass(_subtree_types(node), classinfo)
+
+
 class Node(Hashable):
     __slots__ = ()
 
@@ -283,6 +358,20 @@ class Node(Hashable):
         The list of nodes matching the given pattern. The order of the nodes is
         determined by a breadth-first search.
         """
+        if isinstance(finder, (tuple, type)):
+            # only descend into subtrees containing instances of the searched
+            # types, the subtree summaries are cached so searching for absent
+            # types doesn't traverse the graph at all
+            if not _contains_instance(self, finder):
+                return []
+            if filter is None:
+                filter = functools.partial(_contains_instance, classinfo=finder)
+            else:
+                user_filter = _coerce_finder(filter, context)
+
+                def filter(node, classinfo=finder):
+                    return user_filter(node) and _contains_instance(node, classinfo)
+
         nodes = Graph.from_bfs(self, filter=filter, context=context).nodes()
         finder = _coerce_finder(finder, context)
         return [node for node in nodes if finder(node)]
@@ -310,6 +399,21 @@ class Node(Hashable):
         seen = set()
         queue = deque([self])
         result = []
+
+        if isinstance(finder, (tuple, type)):
+            classinfo = finder
+            if not _contains_instance(self, classinfo):
+                return result
+
+            def children(node):
+                return (
+                    c for c in node.__children__ if _contains_instance(c, classinfo)
+                )
+        else:
+
+            def children(node):
+                return node.__children__
+
         finder = _coerce_finder(finder, context)
 
         while queue:
@@ -317,7 +421,7 @@ class Node(Hashable):
                 if finder(node):
                     result.append(node)
                 else:
-                    queue.extend(node.__children__)
+                    queue.extend(children(node))
                 seen.add(node)
         return result
 
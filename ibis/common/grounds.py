@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+from contextvars import ContextVar
 from copy import copy
 from typing import (
     Any,
@@ -8,6 +9,7 @@ from typing import (
     Union,
     get_origin,
 )
+from weakref import WeakValueDictionary
 
 from typing_extensions import Self, dataclass_transform
 
@@ -183,11 +185,64 @@ class Annotable(Abstract, metaclass=AnnotableMeta):
         return this
 
 
+# the interning table of the active `interning()` block, kept in a context
+# variable so that threads and asyncio tasks don't share each other's tables
+_interned: ContextVar[WeakValueDictionary | None] = ContextVar(
+    "_interned", default=None
+)
+
+
+@contextlib.contextmanager
+def interning():
+    """Intern the `Concrete` instances created within the block.
+
+    Instances of the same class with equal arguments are deduplicated at
+    construction time, so structurally identical objects are the same object.
+    This reduces the memory footprint of large generated expressions and turns
+    equality checks between identical subtrees into identity checks.
+
+    The interning table holds weak references only, and is shared with nested
+    blocks of the same thread or asyncio task.
+
+    Examples
+    --------
+    >>> import ibis
+    >>> from ibis.common.grounds import interning
+    >>> t = ibis.table(dict(a="int64"), name="t")
+    >>> with interning():
+    ...     (t.a + 1).op() is (t.a + 1).op()
+    True
+    """
+    if _interned.get() is not None:
+        yield
+        return
+
+    token = _interned.set(WeakValueDictionary())
+    try:
+        yield
+    finally:
+        _interned.reset(token)
+
+
 class Concrete(Immutable, Comparable, Annotable):
     """Opinionated base class for immutable data classes."""
 
     __slots__ = ("__args__", "__precomputed_hash__")
 
+    @classmethod
+    def __create__(cls, *args: Any, **kwargs: Any) -> Self:
+        instance = super().__create__(*args, **kwargs)
+        if (interned := _interned.get()) is None:
+            return instance
+        return interned.setdefault((cls, instance.__args__), instance)
+
+    @classmethod
+    def __recreate__(cls, kwargs: Any) -> Self:
+        instance = super().__recreate__(kwargs)
+        if (interned := _interned.get()) is None:
+            return instance
+        return interned.setdefault((cls, instance.__args__), instance)
+
     def __init__(self, **kwargs: Any) -> None:
         # collect and set the arguments in a single pass
         args = []
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from ibis.common.caching import PersistentCache
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PersistentCache(tmp_path / "cache")
+
+
+def test_persistent_cache_roundtrip(cache):
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    assert "key" not in cache
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+    cache.store("key", table)
+
+    assert "key" in cache
+    assert len(cache) == 1
+    assert cache.get("key").equals(table)
+    assert cache.size > 0
+
+
+def test_persistent_cache_non_string_keys(cache):
+    table = pa.table({"a": [1]})
+    cache.store(("a", 1), table)
+
+    assert ("a", 1) in cache
+    assert ("a", 2) not in cache
+    assert cache.get(("a", 1)).equals(table)
+
+    # keys are stable across instances pointing at the same directory
+    other = PersistentCache(cache.directory)
+    assert other.get(("a", 1)).equals(table)
+
+
+def test_persistent_cache_invalidate(cache):
+    cache.store("a", pa.table({"a": [1]}))
+    cache.store("b", pa.table({"a": [2]}))
+
+    assert cache.invalidate("a")
+    assert not cache.invalidate("a")
+    assert "a" not in cache
+    assert "b" in cache
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_persistent_cache_lru_eviction(tmp_path):
+    table = pa.table({"a": list(range(1000))})
+
+    probe = PersistentCache(tmp_path / "probe")
+    probe.store("probe", table)
+    entry_size = probe.size
+
+    cache = PersistentCache(tmp_path / "cache", max_size=2 * entry_size)
+    cache.store("a", table)
+    cache.store("b", table)
+
+    # make `a` older than `b`, then use it so that `b` is the least recently
+    # used entry
+    os.utime(cache._path("a"), (0, 0))
+    os.utime(cache._path("b"), (1, 1))
+    assert cache.get("a") is not None
+
+    cache.store("c", table)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.size <= cache.max_size
+
+
+def test_persistent_cache_keys_are_stable_across_processes(cache):
+    import subprocess
+    import sys
+
+    import ibis
+
+    t = ibis.table({"a": "int64", "b": "string"}, name="t")
+    expr = t.filter(t.b.isin(["x", "y"])).select("a")
+    cache.store(expr.op(), pa.table({"a": [1]}))
+
+    script = f"""
+import ibis
+from ibis.common.caching import PersistentCache
+
+t = ibis.table({{"a": "int64", "b": "string"}}, name="t")
+expr = t.filter(t.b.isin(["x", "y"])).select("a")
+assert expr.op() in PersistentCache({str(cache.directory)!r})
+"""
+    for seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        subprocess.run([sys.executable, "-c", script], env=env, check=True)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from ibis.common.collections import frozendict
+from ibis.common.fingerprint import fingerprint, tokenize
+from ibis.common.graph import Node
+from ibis.common.grounds import Concrete
+
+pa = pytest.importorskip("pyarrow")
+
+
+class MyNode(Concrete, Node):
+    value: object
+    children: tuple[Node, ...] = ()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        1,
+        1.5,
+        "a",
+        b"a",
+        decimal.Decimal("1.5"),
+        datetime.date(2023, 1, 1),
+        datetime.datetime(2023, 1, 1, 12),
+        (1, "a"),
+        frozenset({1, 2}),
+        frozendict({"a": 1}),
+    ],
+)
+def test_tokenize_is_deterministic(value):
+    assert tokenize(value) == tokenize(value)
+
+
+@pytest.mark.parametrize(
+    ("left", "right"),
+    [
+        (1, "1"),
+        (1, 1.0),
+        (True, 1),
+        ("ab", ("a", "b")),
+        (("a", "bc"), ("ab", "c")),
+        (b"a", "a"),
+        (None, ()),
+        (frozendict({"a": 1}), (("a", 1),)),
+    ],
+)
+def test_tokenize_distinguishes_values(left, right):
+    assert tokenize(left) != tokenize(right)
+
+
+def test_tokenize_unsupported_type():
+    with pytest.raises(TypeError, match="Cannot fingerprint"):
+        tokenize(object())
+
+
+def test_tokenize_arrow_data():
+    table = pa.table({"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]})
+
+    assert tokenize(table) == tokenize(pa.table({"a": [1, 2, 3, 4], "b": list("wxyz")}))
+    assert tokenize(table) != tokenize(table.slice(1))
+    assert tokenize(table.slice(0, 2)) != tokenize(table.slice(2, 2))
+    assert tokenize(table) != tokenize(table.rename_columns(["a", "c"]))
+
+
+def test_fingerprint():
+    a = MyNode(1)
+    b = MyNode(2)
+    c = MyNode("c", (a, b))
+
+    assert fingerprint(c) == fingerprint(MyNode("c", (MyNode(1), MyNode(2))))
+    assert fingerprint(c) != fingerprint(MyNode("c", (b, a)))
+    assert fingerprint(a) != fingerprint(b)
+    assert len(fingerprint(c)) == 64
+
+
+def test_fingerprint_is_stable_across_processes():
+    code = textwrap.dedent(
+        """
+        from ibis.common.fingerprint import fingerprint
+        from ibis.common.tests.test_fingerprint import MyNode
+
+        print(fingerprint(MyNode("c", (MyNode("a"), MyNode(frozenset("xyz"))))))
+        """
+    )
+    results = {
+        subprocess.check_output(
+            [sys.executable, "-c", code], env={"PYTHONHASHSEED": str(seed)}, text=True
+        )
+        for seed in range(3)
+    }
+    assert len(results) == 1
@@ -12,6 +12,7 @@ from ibis.common.graph import (
     _coerce_replacer,
     _flatten_collections,
     _recursive_lookup,
+    _subtree_types,
     bfs,
     bfs_while,
     dfs,
@@ -427,3 +428,77 @@ def test_node_find_topmost_dont_traverse_the_same_node_twice():
     result = E.find_topmost(If(_.name == "G"))
     expected = [G]
     assert result == expected
+
+
+class CachedNode(Concrete, Node):
+    __slots__ = ("__subtree_types__",)
+
+    name = InstanceOf(str)
+    children = TupleOf(InstanceOf(Node))
+
+
+class Foo(CachedNode):
+    pass
+
+
+class Bar(CachedNode):
+    pass
+
+
+def test_subtree_types():
+    d = Foo("d", ())
+    b = CachedNode("b", (d,))
+    c = Bar("c", (d,))
+    a = CachedNode("a", (b, c))
+
+    assert _subtree_types(d) == {Foo}
+    assert _subtree_types(a) == {CachedNode, Foo, Bar}
+    assert a.__subtree_types__ == {CachedNode, Foo, Bar}
+    assert b.__subtree_types__ == {CachedNode, Foo}
+    # the summaries are shared where no new types are introduced
+    assert _subtree_types(CachedNode("e", (a,))) is a.__subtree_types__
+
+    # nodes without the slot are summarized without caching
+    assert _subtree_types(A) == {MyNode}
+    assert _subtree_types(MyNode(name="X", children=[a])) == {
+        MyNode,
+        CachedNode,
+        Foo,
+        Bar,
+    }
+
+
+def test_node_find_prunes_subtrees_without_matching_types():
+    class Counting(CachedNode):
+        visited = []
+
+        @property
+        def __children__(self):
+            self.visited.append(self.name)
+            return super().__children__
+
+    leaf = Foo("leaf", ())
+    b = Counting("b", (leaf,))
+    c = Counting("c", (Bar("bar", ()),))
+    a = Counting("a", (b, c))
+
+    assert a.find(Bar) == [c.children[0]]
+    # the summaries are computed once, afterwards subtrees without instances of
+    # the searched types are skipped
+    Counting.visited.clear()
+    assert a.find(Bar) == [c.children[0]]
+    assert Counting.visited == ["a", "c"]
+
+    Counting.visited.clear()
+    assert a.find(int) == []
+    assert a.find_topmost(int) == []
+    assert Counting.visited == []
+
+    assert a.find((Foo, Bar)) == [leaf, c.children[0]]
+    assert a.find(CachedNode) == [a, b, c, leaf, c.children[0]]
+    assert a.find(Foo, filter=If(_.name != "b")) == []
+    assert a.find(Foo, filter=If(_.name != "c")) == [leaf]
+
+    Counting.visited.clear()
+    assert a.find_topmost(Bar) == [c.children[0]]
+    assert Counting.visited == ["a", "c"]
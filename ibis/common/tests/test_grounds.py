@@ -29,6 +29,7 @@ from ibis.common.grounds import (
     Concrete,
     Immutable,
     Singleton,
+    interning,
 )
 from ibis.common.patterns import (
     Any,
@@ -1004,7 +1005,7 @@ def test_concrete():
         object,
     )
 
-    assert BetweenWithCalculated.__create__.__func__ is Annotable.__create__.__func__
+    assert BetweenWithCalculated.__create__.__func__ is Concrete.__create__.__func__
     assert BetweenWithCalculated.__eq__ is Comparable.__eq__
     assert BetweenWithCalculated.__argnames__ == ("value", "lower", "upper")
 
@@ -1037,6 +1038,50 @@ def test_concrete():
     assert pickle.loads(pickle.dumps(obj)) == obj
 
 
+def test_concrete_interning():
+    obj = BetweenWithCalculated(10, lower=5, upper=15)
+    with interning():
+        obj1 = BetweenWithCalculated(10, lower=5, upper=15)
+        obj2 = BetweenWithCalculated(10, lower=5, upper=15)
+        obj3 = BetweenWithCalculated(11, lower=5, upper=15)
+        # recreated instances are interned as well
+        assert obj3.copy(value=10) is obj1
+        assert pickle.loads(pickle.dumps(obj1)) is obj1
+
+        with interning():
+            assert BetweenWithCalculated(10, lower=5, upper=15) is obj1
+
+    assert obj1 is obj2
+    assert obj1 is not obj3
+    assert obj1 is not obj
+    assert obj1 == obj
+
+    # interning is only active within the block
+    assert BetweenWithCalculated(10, lower=5, upper=15) is not obj1
+
+    # the interning table doesn't keep the instances alive
+    ref = weakref.ref(obj3)
+    del obj3
+    assert ref() is None
+
+
+def test_concrete_interning_is_thread_local():
+    import threading
+
+    with interning():
+        obj = BetweenWithCalculated(10, lower=5, upper=15)
+
+        # other threads don't see, nor populate, this block's table
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(BetweenWithCalculated(10, lower=5, upper=15))
+        )
+        thread.start()
+        thread.join()
+        assert results[0] is not obj
+        assert BetweenWithCalculated(10, lower=5, upper=15) is obj
+
+
 def test_composition_of_concrete_and_singleton():
     class ConcSing(Concrete, Singleton):
         value = CoercedTo(int)
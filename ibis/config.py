@@ -71,6 +71,25 @@ class SQL(Config):
     default_dialect: str = "duckdb"
 
 
+class Cache(Config):
+    """Options controlling the caching of table expressions.
+
+    Attributes
+    ----------
+    directory : str | None
+        Directory of the persistent cache used by `Table.cache()`. Results
+        stored there are reused across sessions and processes for identical
+        expressions. [](`None`), the default, disables the persistent cache.
+    max_size : int | None
+        Maximum size of the persistent cache in bytes. Least recently used
+        entries are evicted when the limit is exceeded. [](`None`) means no
+        limit.
+    """
+
+    directory: Optional[str] = None
+    max_size: Optional[PosInt] = None
+
+
 class Interactive(Config):
     """Options controlling the interactive repr.
 
@@ -150,6 +169,8 @@ class Options(Config):
         Options related to time context adjustment.
     sql: SQL
         SQL-related options.
+    cache : Cache
+        Options controlling the caching of table expressions.
     clickhouse : Config | None
         Clickhouse specific options.
     dask : Config | None
@@ -170,6 +191,7 @@ class Options(Config):
     default_backend: Optional[Any] = None
     context_adjustment: ContextAdjustment = ContextAdjustment()
     sql: SQL = SQL()
+    cache: Cache = Cache()
     clickhouse: Optional[Config] = None
     dask: Optional[Config] = None
     impala: Optional[Config] = None
@@ -5,6 +5,7 @@ from __future__ import annotations
 import builtins
 import datetime
 import functools
+import importlib
 import numbers
 import operator
 from collections import Counter
@@ -24,7 +25,6 @@ from ibis.common.grounds import Concrete
 from ibis.common.temporal import normalize_datetime, normalize_timezone
 from ibis.expr.decompile import decompile
 from ibis.expr.schema import Schema
-from ibis.expr.sql import parse_sql, to_sql
 from ibis.expr.types import (
     DateValue,
     Expr,
@@ -142,7 +142,6 @@ __all__ = (
     "null",
     "or_",
     "param",
-    "parse_sql",
     "pi",
     "random",
     "range",
@@ -159,7 +158,6 @@ __all__ = (
     "selectors",
     "set_backend",
     "struct",
-    "to_sql",
     "table",
     "time",
     "timestamp",
@@ -174,6 +172,25 @@ __all__ = (
     "_",
 )
 
+# attributes which are expensive to import and are resolved on first access,
+# see `__getattr__`
+_LAZY_ATTRIBUTES = {
+    # depend on sqlglot
+    "parse_sql": "ibis.expr.sql",
+    "to_sql": "ibis.expr.sql",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 dtype = dt.dtype
 infer_dtype = dt.infer
@@ -20,6 +20,10 @@ from ibis.common.typing import DefaultTypeVars, VarTuple
 
 @public
 class Node(Concrete, Traversable):
+    # lazily computed summary of the node types in the subtree, see
+    # ibis.common.graph._subtree_types
+    __slots__ = ("__subtree_types__",)
+
     def equals(self, other) -> bool:
         if not isinstance(other, Node):
             raise TypeError(
@@ -14,6 +14,7 @@ from ibis import util
 from ibis.common.annotations import annotated, attribute
 from ibis.common.collections import FrozenDict  # noqa: TCH001
 from ibis.common.deferred import Deferred
+from ibis.common.fingerprint import fingerprint_args
 from ibis.common.grounds import Concrete
 from ibis.common.patterns import Between, Coercible, Eq
 from ibis.common.typing import VarTuple  # noqa: TCH001
@@ -116,6 +117,13 @@ class InMemoryTable(PhysicalTable):
     data: TableProxy
 
 
+@fingerprint_args.register(InMemoryTable)
+def _fingerprint_in_memory_table(node, args):
+    # the name is usually randomly generated, so only the contents matter; use
+    # the digest memoized on the data to avoid rehashing it every time
+    return [("schema", args["schema"]), ("data", node.data.digest(node.schema))]
+
+
 # TODO(kszucs): desperately need to clean this up, the majority of this
 # functionality should be handled by input rules for the Join class
 def _clean_join_predicates(left, right, predicates):
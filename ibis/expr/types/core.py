@@ -17,6 +17,7 @@ from ibis.config import _default_backend, options as opts
 from ibis.util import experimental
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from pathlib import Path
 
     import pandas as pd
@@ -128,6 +129,43 @@ class Expr(Immutable, Coercible):
             )
         return self._arg.equals(other._arg)
 
+    def fingerprint(self) -> str:
+        """Return a deterministic digest of the expression's structure and data.
+
+        Unlike `hash()`, the fingerprint is stable across processes: it is
+        computed from the contents of the expression graph, including the data
+        of in-memory tables, so it can be used as a key for caches shared
+        between sessions. Expressions with equal fingerprints are structurally
+        equivalent.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-256 digest
+
+        Raises
+        ------
+        TypeError
+            If the expression contains values that can't be fingerprinted.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> t1 = ibis.table(dict(a="int"), name="t")
+        >>> t2 = ibis.table(dict(a="int"), name="t")
+        >>> t1.fingerprint() == t2.fingerprint()
+        True
+        >>> m1 = ibis.memtable({"a": [1, 2, 3]})
+        >>> m2 = ibis.memtable({"a": [1, 2, 3]})
+        >>> m1.fingerprint() == m2.fingerprint()
+        True
+        >>> t1.a.sum().fingerprint() == t1.a.mean().fingerprint()
+        False
+        """
+        from ibis.common.fingerprint import fingerprint
+
+        return fingerprint(self._arg)
+
     def __bool__(self) -> bool:
         raise ValueError("The truth value of an Ibis expression is not defined")
 
@@ -323,6 +361,30 @@ class Expr(Immutable, Coercible):
             self, limit=limit, timecontext=timecontext, params=params, **kwargs
         )
 
+    async def execute_async(
+        self,
+        limit: int | str | None = "default",
+        timecontext: TimeContext | None = None,
+        params: Mapping[ir.Value, Any] | None = None,
+        **kwargs: Any,
+    ):
+        """Asynchronously execute an expression against its backend.
+
+        See `execute` for a description of the parameters. The query runs on
+        an executor managed by the backend, so it doesn't block the event loop.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> import ibis
+        >>> t = ibis.memtable({"a": [1, 2, 3]})
+        >>> asyncio.run(t.a.sum().execute_async())
+        6
+        """
+        return await self._find_backend(use_default=True).execute_async(
+            self, limit=limit, timecontext=timecontext, params=params, **kwargs
+        )
+
     def compile(
         self,
         limit: int | None = None,
@@ -390,6 +452,32 @@ class Expr(Immutable, Coercible):
             **kwargs,
         )
 
+    @experimental
+    def to_pyarrow_batches_async(
+        self,
+        *,
+        limit: int | str | None = None,
+        params: Mapping[ir.Value, Any] | None = None,
+        chunk_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Execute expression and asynchronously iterate over record batches.
+
+        See `to_pyarrow_batches` for a description of the parameters.
+
+        Returns
+        -------
+        AsyncIterator[pa.RecordBatch]
+            An asynchronous iterator of record batches.
+        """
+        return self._find_backend(use_default=True).to_pyarrow_batches_async(
+            self,
+            params=params,
+            limit=limit,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
     @experimental
     def to_pyarrow(
         self,
@@ -422,6 +510,27 @@ class Expr(Immutable, Coercible):
             self, params=params, limit=limit, **kwargs
         )
 
+    @experimental
+    async def to_pyarrow_async(
+        self,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        **kwargs: Any,
+    ) -> pa.Table:
+        """Asynchronously execute expression and return results as a pyarrow table.
+
+        See `to_pyarrow` for a description of the parameters.
+
+        Returns
+        -------
+        Table
+            A pyarrow table holding the results of the executed expression.
+        """
+        return await self._find_backend(use_default=True).to_pyarrow_async(
+            self, params=params, limit=limit, **kwargs
+        )
+
     @experimental
     def to_pandas_batches(
         self,
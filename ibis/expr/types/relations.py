@@ -3259,6 +3259,11 @@ class Table(Expr, _FixedTextJupyterMixin):
         chaining will not incur the overhead of caching more than once.
         :::
 
+        If `ibis.options.cache.directory` is set, cached results are also
+        written to a persistent on-disk cache and reused by later sessions
+        that cache an identical expression. Stale entries can be removed with
+        `ibis.common.caching.PersistentCache.invalidate` or `.clear()`.
+
         Returns
         -------
         Table
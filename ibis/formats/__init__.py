@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
 
 from ibis.util import PseudoHashable, indent
 
@@ -223,6 +224,30 @@ class DataMapper(Generic[S, C, T]):
 
 
 class TableProxy(PseudoHashable[T]):
+    __slots__ = ("_cache",)
+
+    def __init__(self, obj: T):
+        super().__init__(obj)
+        # the wrapped data is treated as immutable, so conversions of it are
+        # computed once and reused every time the table is registered
+        self._cache: dict[tuple, Any] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the memoized conversions can be derived from the data again
+        return {"obj": self.obj, "hash": self.hash}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.obj = state["obj"]
+        self.hash = state["hash"]
+        self._cache = {}
+
+    def _memoize(self, key: tuple, func: Callable[[], S]) -> S:
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = func()
+            return result
+
     def __repr__(self) -> str:
         data_repr = indent(repr(self.obj), spaces=2)
         return f"{self.__class__.__name__}:\n{data_repr}"
@@ -238,6 +263,25 @@ class TableProxy(PseudoHashable[T]):
     def to_pyarrow(self, schema: Schema) -> pa.Table:  # pragma: no cover
         """Convert this input to a PyArrow Table."""
 
+    def digest(self, schema: Schema) -> bytes:
+        """Compute a content digest of this input converted to `schema`.
+
+        Inputs holding the same data have the same digest, regardless of the
+        format they are stored in.
+        """
+        import pyarrow as pa
+
+        from ibis.common.fingerprint import tokenize
+
+        def compute():
+            try:
+                data = self.to_pyarrow(schema)
+            except pa.ArrowException as e:
+                raise TypeError(f"Cannot compute a digest of the data: {e}") from e
+            return hashlib.sha256(tokenize(data)).digest()
+
+        return self._memoize(("digest", schema), compute)
+
     def to_pyarrow_bytes(self, schema: Schema) -> bytes:
         import pyarrow as pa
         import pyarrow_hotfix  # noqa: F401
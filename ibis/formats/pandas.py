@@ -25,6 +25,10 @@ if not _has_arrow_dtype:
     )
 
 
+def _identity(value):
+    return value
+
+
 class PandasType(NumpyType):
     @classmethod
     def to_ibis(cls, typ, nullable=True):
@@ -120,10 +124,47 @@ class PandasData(DataMapper):
         df.columns = schema.names
         return df
 
+    @classmethod
+    def convert_pyarrow_table(cls, table, schema):
+        """Convert a pyarrow `Table` or `RecordBatch` to a DataFrame.
+
+        Columns are converted by Arrow, so numeric columns without nulls are
+        converted without copying; only nested columns are materialized as
+        Python objects.
+        """
+        df = pd.DataFrame(
+            {
+                name: cls._pyarrow_column_to_pandas(column)
+                for name, column in zip(table.schema.names, table.columns)
+            }
+        )
+        return cls.convert_table(df, schema)
+
+    @staticmethod
+    def _pyarrow_column_to_pandas(column):
+        typ = column.type
+        if len(column) and column.null_count == len(column):
+            # columns of NULL literals aren't always typed as null by the
+            # backend, so make sure they're rendered as None
+            return pd.Series([None] * len(column), dtype=object)
+        elif pa.types.is_nested(typ):
+            return pd.Series(column.to_pylist(), dtype=object)
+        elif pa.types.is_timestamp(typ):
+            # timestamps outside the bounds of nanosecond precision fall
+            # through to Python objects
+            with contextlib.suppress(pa.ArrowInvalid):
+                return column.cast(pa.timestamp("ns", typ.tz)).to_pandas()
+        return column.to_pandas(timestamp_as_object=True)
+
     @classmethod
     def convert_column(cls, obj, dtype):
         pandas_type = PandasType.from_ibis(dtype)
 
+        if _has_arrow_dtype and isinstance(obj.dtype, pd.ArrowDtype):
+            result = cls._convert_arrow_column(obj, dtype)
+            if result is not None:
+                return result
+
         if obj.dtype == pandas_type and dtype.is_primitive():
             return obj
 
@@ -134,6 +175,32 @@ class PandasData(DataMapper):
         assert not isinstance(result, np.ndarray), f"{convert_method} -> {type(result)}"
         return result
 
+    @staticmethod
+    def _convert_arrow_column(s, dtype):
+        """Convert a column with an `ArrowDtype` without leaving Arrow memory.
+
+        Returns `None` if the column converts to a numpy dtype without loss,
+        in which case the regular conversion applies.
+        """
+        array = pa.array(s.array)
+        if not (
+            dtype.is_nested()
+            # numpy can't represent these types with nulls losslessly
+            or (array.null_count and (dtype.is_integer() or dtype.is_boolean()))
+        ):
+            return None
+
+        target = PyArrowType.from_ibis(dtype)
+        if array.type == target:
+            return s
+        try:
+            array = array.cast(target)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return None
+        return pd.Series(
+            pd.arrays.ArrowExtensionArray(array), index=s.index, name=s.name
+        )
+
     @classmethod
     def convert_scalar(cls, obj, dtype):
         df = PandasData.convert_table(obj, sch.Schema({obj.columns[0]: dtype}))
@@ -249,13 +316,26 @@ class PandasData(DataMapper):
     @classmethod
     def get_element_converter(cls, dtype):
         name = f"convert_{type(dtype).__name__}_element"
-        funcgen = getattr(cls, name, lambda _: lambda x: x)
+        funcgen = getattr(cls, name, lambda _: _identity)
         return funcgen(dtype)
 
     @classmethod
     def convert_Struct_element(cls, dtype):
         converters = tuple(map(cls.get_element_converter, dtype.types))
 
+        if all(converter is _identity for converter in converters):
+
+            def convert(values, names=dtype.names):
+                if values is None:
+                    return values
+                return (
+                    dict(values)
+                    if isinstance(values, dict)
+                    else dict(zip(names, values))
+                )
+
+            return convert
+
         def convert(values, names=dtype.names, converters=converters):
             if values is None:
                 return values
@@ -314,6 +394,13 @@ class PandasData(DataMapper):
     def convert_Array_element(cls, dtype):
         convert_value = cls.get_element_converter(dtype.value_type)
 
+        if convert_value is _identity:
+
+            def convert(values):
+                return values if values is None else list(values)
+
+            return convert
+
         def convert(values):
             if values is None:
                 return values
@@ -329,6 +416,13 @@ class PandasData(DataMapper):
         convert_key = cls.get_element_converter(dtype.key_type)
         convert_value = cls.get_element_converter(dtype.value_type)
 
+        if convert_key is _identity and convert_value is _identity:
+
+            def convert(raw_row):
+                return raw_row if raw_row is None else dict(raw_row)
+
+            return convert
+
         def convert(raw_row):
             if raw_row is None:
                 return raw_row
@@ -365,5 +459,8 @@ class PandasDataFrameProxy(TableProxy[pd.DataFrame]):
         return self.obj
 
     def to_pyarrow(self, schema: sch.Schema) -> pa.Table:
-        pyarrow_schema = PyArrowSchema.from_ibis(schema)
-        return pa.Table.from_pandas(self.obj, schema=pyarrow_schema)
+        def convert():
+            pyarrow_schema = PyArrowSchema.from_ibis(schema)
+            return pa.Table.from_pandas(self.obj, schema=pyarrow_schema)
+
+        return self._memoize(("pyarrow", schema), convert)
@@ -296,7 +296,7 @@ class PyArrowData(DataMapper):
 
 class PyArrowTableProxy(TableProxy[pa.Table]):
     def to_frame(self):
-        return self.obj.to_pandas()
+        return self._memoize(("frame",), self.obj.to_pandas)
 
     def to_pyarrow(self, schema: Schema) -> pa.Table:
         return self.obj
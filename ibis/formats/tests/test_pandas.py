@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import time
+from datetime import datetime, time
 from decimal import Decimal
 
 import numpy as np
@@ -13,7 +13,13 @@ from pytest import param
 import ibis
 import ibis.expr.datatypes as dt
 import ibis.expr.schema as sch
-from ibis.formats.pandas import PandasData, PandasSchema, PandasType
+from ibis.formats.pandas import (
+    PandasData,
+    PandasDataFrameProxy,
+    PandasSchema,
+    PandasType,
+)
+from ibis.formats.pyarrow import PyArrowTableProxy
 
 
 @pytest.mark.parametrize(
@@ -429,3 +435,89 @@ def test_convert_dataframe_with_timezone():
     desired_schema = ibis.schema(dict(time='timestamp("EST")'))
     result = PandasData.convert_table(df.copy(), desired_schema)
     tm.assert_frame_equal(expected, result)
+
+
+def test_dataframe_proxy_memoizes_conversions():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": list("xyz")})
+    schema = ibis.schema({"a": "int64", "b": "string"})
+    proxy = PandasDataFrameProxy(df)
+
+    table = proxy.to_pyarrow(schema)
+    assert proxy.to_pyarrow(schema) is table
+    assert table.schema.remove_metadata() == schema.to_pyarrow()
+
+    # the digest only depends on the data
+    assert proxy.digest(schema) == PandasDataFrameProxy(df.copy()).digest(schema)
+    assert proxy.digest(schema) == PyArrowTableProxy(table).digest(schema)
+    assert proxy.digest(schema) != PandasDataFrameProxy(df.head(2)).digest(schema)
+
+
+def test_convert_pyarrow_table():
+    table = pa.table(
+        {
+            "a": pa.array([1, 2, 3], type=pa.int64()),
+            "b": pa.array([1, None, 3], type=pa.int32()),
+            "c": pa.array([0, 1, 2], type=pa.timestamp("us", "UTC")),
+            "d": pa.array([[1, 2], None, []]),
+            "e": pa.array(
+                [[("x", 1)], [], None], type=pa.map_(pa.string(), pa.int64())
+            ),
+            "f": pa.array([None, None, None], type=pa.int32()),
+        }
+    )
+    schema = ibis.schema(
+        {
+            "a": "int64",
+            "b": "int32",
+            "c": "timestamp('UTC')",
+            "d": "array<int64>",
+            "e": "map<string, int64>",
+            "f": "null",
+        }
+    )
+    result = PandasData.convert_pyarrow_table(table, schema)
+    expected = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [1.0, np.nan, 3.0],
+            "c": pd.to_datetime([0, 1000, 2000], utc=True),
+            "d": [[1, 2], None, []],
+            "e": [{"x": 1}, {}, None],
+            "f": [None, None, None],
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_convert_pyarrow_table_out_of_bounds_timestamp():
+    value = datetime(3000, 1, 1)
+    table = pa.table({"t": pa.array([value], type=pa.timestamp("us"))})
+    result = PandasData.convert_pyarrow_table(table, ibis.schema({"t": "timestamp"}))
+    assert result.t.iat[0] == value
+
+
+@pytest.mark.parametrize(
+    ("data", "typ", "dtype"),
+    [
+        param([1, None], pa.int16(), "int16", id="nullable_int"),
+        param([None, True], pa.bool_(), "boolean", id="nullable_bool"),
+        param([[1], None], pa.list_(pa.int64()), "array<int64>", id="array"),
+        param(
+            [{"a": 1}, None],
+            pa.struct([("a", pa.int64())]),
+            "struct<a: int64>",
+            id="struct",
+        ),
+    ],
+)
+def test_convert_arrow_dtype_column_stays_arrow(data, typ, dtype):
+    s = pd.Series(data, dtype=pd.ArrowDtype(typ))
+    result = PandasData.convert_column(s, dt.dtype(dtype))
+    assert result.dtype == pd.ArrowDtype(typ)
+    assert result.tolist() == s.tolist()
+
+
+def test_convert_arrow_dtype_column_to_numpy():
+    s = pd.Series([1, 2], dtype="int32[pyarrow]")
+    result = PandasData.convert_column(s, dt.int32)
+    assert result.dtype == np.dtype("int32")
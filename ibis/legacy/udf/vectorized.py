@@ -19,6 +19,7 @@ from ibis.expr.operations import (
     ElementWiseVectorizedUDF,
     ReductionVectorizedUDF,
 )
+from ibis.formats.numpy import NumpyType
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -185,6 +186,49 @@ def _coerce_to_dataframe(
     return result
 
 
+def _is_numba_function(func) -> bool:
+    return type(func).__module__.startswith("numba.") and hasattr(func, "py_func")
+
+
+@functools.cache
+def _numba_window_loop(nargs: int):
+    import numba
+
+    names = [f"arg{i}" for i in range(nargs)]
+    slices = ", ".join(f"{name}[lower[i] : upper[i]]" for name in names)
+    source = f"""\
+def loop(func, lower, upper, out, {", ".join(names)}):
+    for i in range(len(lower)):
+        out[i] = func({slices})
+"""
+    namespace = {}
+    exec(source, namespace)
+    return numba.njit(namespace["loop"])
+
+
+def _numba_window_apply(
+    func, dtype: np.dtype, lower: np.ndarray, upper: np.ndarray, *args: Any
+) -> np.ndarray:
+    """Apply the jitted `func` to every window in a compiled loop."""
+    import numba
+
+    out = np.empty(len(lower), dtype=dtype)
+    if all(isinstance(arg, np.ndarray) and arg.dtype.kind in "biuf" for arg in args):
+        loop = _numba_window_loop(len(args))
+        try:
+            loop(func, lower, upper, out, *args)
+        except numba.core.errors.TypingError:
+            pass
+        else:
+            return out
+
+    for i, (start, stop) in enumerate(zip(lower, upper)):
+        out[i] = func(
+            *(arg[start:stop] if isinstance(arg, np.ndarray) else arg for arg in args)
+        )
+    return out
+
+
 class UserDefinedFunction:
     """Class representing a user defined function.
 
@@ -198,6 +242,7 @@ class UserDefinedFunction:
 
         self.func = func
         self.func_type = func_type
+        self.window_func = None
         self.input_type = list(map(dt.dtype, input_type))
         self.output_type = dt.dtype(output_type)
         self.coercion_fn = self._get_coercion_function()
@@ -228,6 +273,46 @@ class UserDefinedFunction:
             # len-0 value such as a single integer or float).
             return None
 
+    def window(self, window_func):
+        """Register a batched implementation of the UDF over bounded windows.
+
+        `window_func` is called once with the lower and upper (exclusive)
+        row indices of every window, followed by the full input columns as
+        numpy arrays, and must return one value per window. Backends that
+        support it use this instead of calling the UDF once per window.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import ibis.expr.datatypes as dt
+        >>> from ibis.legacy.udf.vectorized import reduction
+        >>> @reduction(input_type=[dt.double], output_type=dt.double)
+        ... def my_sum(series):
+        ...     return series.sum()
+        >>> @my_sum.window
+        ... def my_sum(lower, upper, values):
+        ...     sums = np.concatenate([[0.0], np.cumsum(values)])
+        ...     return sums[upper] - sums[lower]
+        """
+        self.window_func = window_func
+        return self
+
+    def _get_window_function(self, kwargs):
+        if self.window_func is not None:
+            return functools.partial(self.window_func, **kwargs)
+        elif (
+            not kwargs
+            and self.coercion_fn is None
+            and self.output_type.is_numeric()
+            and _is_numba_function(self.func)
+        ):
+            return functools.partial(
+                _numba_window_apply,
+                self.func,
+                NumpyType.from_ibis(self.output_type),
+            )
+        return None
+
     def __call__(self, *args, **kwargs):
         # kwargs cannot be part of the node object because it can contain
         # unhashable object, e.g., list.
@@ -244,6 +329,9 @@ class UserDefinedFunction:
                 result = self.coercion_fn(result, self.output_type, saved_index)
             return result
 
+        if (window_func := self._get_window_function(kwargs)) is not None:
+            func.__window_func__ = window_func
+
         op = self.func_type(
             func=func,
             func_args=args,
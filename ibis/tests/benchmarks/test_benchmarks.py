@@ -6,6 +6,8 @@ import inspect
 import itertools
 import os
 import string
+import subprocess
+import sys
 
 import numpy as np
 import pandas as pd
@@ -900,3 +902,35 @@ def test_big_join_execute(benchmark, nrels):
     expr = src.join(diff, ["validation_name"], how="outer")
     t = benchmark.pedantic(expr.to_pyarrow, rounds=1, iterations=1, warmup_rounds=1)
     assert len(t)
+
+
+def test_import_time(benchmark):
+    # every round runs in a fresh interpreter so nothing is cached in
+    # `sys.modules`
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", "import ibis"],),
+        kwargs=dict(check=True),
+        rounds=5,
+        iterations=1,
+        warmup_rounds=1,
+    )
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "asyncio",
+        "ibis.examples",
+        "ibis.expr.sql",
+        "importlib.metadata",
+        "numpy",
+        "pandas",
+        "pyarrow",
+        "sqlglot",
+    ],
+)
+def test_import_is_lazy(module):
+    code = f"import sys, ibis; sys.exit({module!r} in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+    assert result.returncode == 0, f"`import ibis` eagerly imports {module}"
@@ -142,6 +142,8 @@ class MockAlchemyBackend(MockBackend):
     def _get_sqla_table(self, name, **_):
         return self.tables[name]
 
+    _get_cached_sqla_table = _get_sqla_table
+
 
 GEO_TABLE = {
     "geo": [
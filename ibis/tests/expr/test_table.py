@@ -1842,3 +1842,32 @@ def test_invalid_distinct_empty_key():
     t = ibis.table(dict(a="int", b="string"), name="t")
     with pytest.raises(com.IbisInputError):
         t.distinct(on="c", keep="first")
+
+
+def test_fingerprint():
+    t1 = ibis.table(dict(a="int", b="string"), name="t")
+    t2 = ibis.table(dict(a="int", b="string"), name="t")
+
+    expr1 = t1.filter(t1.a > 1).group_by("b").aggregate(n=t1.a.sum())
+    expr2 = t2.filter(t2.a > 1).group_by("b").aggregate(n=t2.a.sum())
+    assert expr1.fingerprint() == expr2.fingerprint()
+
+    expr3 = t2.filter(t2.a > 2).group_by("b").aggregate(n=t2.a.sum())
+    assert expr1.fingerprint() != expr3.fingerprint()
+
+    other = ibis.table(dict(a="int", b="string"), name="u")
+    assert t1.fingerprint() != other.fingerprint()
+
+
+def test_fingerprint_memtable():
+    pa = pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": list("xyz")})
+
+    # memtable names are random, only the data matters
+    assert ibis.memtable(df).fingerprint() == ibis.memtable(df.copy()).fingerprint()
+    assert ibis.memtable(df).fingerprint() != ibis.memtable(df.head(2)).fingerprint()
+    assert (
+        ibis.memtable(df).fingerprint()
+        == ibis.memtable(pa.Table.from_pandas(df)).fingerprint()
+    )
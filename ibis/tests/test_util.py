@@ -1,9 +1,18 @@
 """Test ibis.util utilities."""
 from __future__ import annotations
 
+import threading
+
 import pytest
 
-from ibis.util import PseudoHashable, flatten_iterable, import_object
+from ibis.util import (
+    PseudoHashable,
+    flatten_iterable,
+    import_object,
+    map_threaded,
+    merge_threaded,
+    prefetch,
+)
 
 
 @pytest.mark.parametrize(
@@ -50,6 +59,103 @@ def test_import_object():
         import_object("collections.this_attribute_doesnt_exist")
 
 
+def test_prefetch():
+    assert list(prefetch(iter(range(10)), maxsize=3)) == list(range(10))
+    assert list(prefetch([])) == []
+
+    with pytest.raises(ValueError):
+        list(prefetch([1], maxsize=0))
+
+
+def test_prefetch_bounded():
+    produced = []
+
+    def items():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    nthreads = threading.active_count()
+    it = prefetch(items(), maxsize=2)
+    assert next(it) == 0
+    # closing the generator stops and joins the producer thread
+    it.close()
+    # one item handed out, at most two buffered and one pending
+    assert len(produced) <= 4
+    assert threading.active_count() == nthreads
+
+
+def test_prefetch_error():
+    def items():
+        yield 1
+        raise ZeroDivisionError
+
+    it = prefetch(items())
+    assert next(it) == 1
+    with pytest.raises(ZeroDivisionError):
+        next(it)
+
+
+def test_merge_threaded():
+    first, second = threading.Event(), threading.Event()
+
+    def items(name, wait, notify):
+        yield f"{name}1"
+        # interleave the two producers, so both are consumed concurrently
+        notify.set()
+        assert wait.wait(timeout=5)
+        yield f"{name}2"
+
+    result = list(
+        merge_threaded([items("a", first, second), items("b", second, first)])
+    )
+    assert sorted(result) == ["a1", "a2", "b1", "b2"]
+    assert result.index("a1") < result.index("a2")
+    assert result.index("b1") < result.index("b2")
+
+    assert list(merge_threaded([])) == []
+
+
+def test_map_threaded():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def square(x):
+        # all three calls have to run concurrently to get past the barrier
+        if x < 3:
+            barrier.wait()
+        return x * x
+
+    assert list(map_threaded(square, range(6), maxsize=3)) == [0, 1, 4, 9, 16, 25]
+    assert list(map_threaded(square, [])) == []
+
+    with pytest.raises(ValueError):
+        list(map_threaded(square, [1], maxsize=0))
+
+
+def test_map_threaded_bounded():
+    called = []
+
+    def func(x):
+        called.append(x)
+        return x
+
+    it = map_threaded(func, range(100), maxsize=2)
+    assert next(it) == 0
+    it.close()
+    # one result handed out and at most two computed ahead
+    assert len(called) <= 3
+
+
+def test_map_threaded_error():
+    def func(x):
+        return 1 / x
+
+    it = map_threaded(func, [1, 0, 2])
+    assert next(it) == 1
+    with pytest.raises(ZeroDivisionError):
+        next(it)
+
+
 # TODO(kszucs): add tests for promote_list and promote_tuple
 
 
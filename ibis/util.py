@@ -5,13 +5,15 @@ import base64
 import collections
 import collections.abc
 import functools
-import importlib.metadata
+import importlib
 import itertools
 import logging
 import operator
 import os
+import queue
 import sys
 import textwrap
+import threading
 import types
 import uuid
 import warnings
@@ -30,7 +32,7 @@ import toolz
 from ibis.common.typing import Coercible
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Iterable, Iterator, Sequence
     from numbers import Real
     from pathlib import Path
 
@@ -367,6 +369,119 @@ def consume(iterator: Iterator[T], n: int | None = None) -> None:
         next(itertools.islice(iterator, n, n), None)
 
 
+def prefetch(iterable: Iterable[T], maxsize: int = 1) -> Iterator[T]:
+    """Consume `iterable` on a background thread, `maxsize` items ahead.
+
+    This overlaps producing items, e.g. fetching rows over the network, with
+    the caller's processing of the previous items while keeping at most
+    `maxsize` items buffered. Exceptions raised by `iterable` are re-raised in
+    the caller, and closing the returned generator stops the background
+    thread.
+    """
+    yield from merge_threaded([iterable], maxsize=maxsize)
+
+
+def merge_threaded(iterables: Iterable[Iterable[T]], maxsize: int = 1) -> Iterator[T]:
+    """Consume `iterables` concurrently, each on its own background thread.
+
+    Items are yielded in the order they are produced; items of the same
+    iterable keep their relative order. At most `maxsize` items are buffered
+    in total. The first exception raised by any of the iterables is re-raised
+    in the caller, and closing the returned generator stops all the background
+    threads.
+
+    Examples
+    --------
+    >>> from ibis.util import merge_threaded
+    >>> sorted(merge_threaded([range(3), range(10, 12)]))
+    [0, 1, 2, 10, 11]
+    """
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+    done = object()
+    buffer = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def produce(iterable):
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as e:  # noqa: BLE001
+            put((done, e))
+        else:
+            put((done, None))
+
+    threads = [
+        threading.Thread(target=produce, args=(iterable,), daemon=True)
+        for iterable in iterables
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        remaining = len(threads)
+        while remaining:
+            item, error = buffer.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        stopped.set()
+        for thread in threads:
+            thread.join()
+
+
+def map_threaded(
+    func: Callable[[T], U], iterable: Iterable[T], maxsize: int = 1
+) -> Iterator[U]:
+    """Apply `func` to the items of `iterable` on up to `maxsize` threads.
+
+    Results are yielded in the order of `iterable`, computing at most
+    `maxsize` results ahead of the caller. The first exception raised by
+    `func` is re-raised in the caller, and closing the returned generator
+    cancels the pending calls.
+
+    Examples
+    --------
+    >>> from ibis.util import map_threaded
+    >>> list(map_threaded(str.upper, "abc", maxsize=2))
+    ['A', 'B', 'C']
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+    items = iter(iterable)
+    with ThreadPoolExecutor(max_workers=maxsize) as executor:
+        pending = collections.deque(
+            executor.submit(func, item) for item in itertools.islice(items, maxsize)
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                pending.extend(
+                    executor.submit(func, item) for item in itertools.islice(items, 1)
+                )
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 def flatten_iterable(iterable):
     """Recursively flatten the iterable `iterable`."""
     if not is_iterable(iterable):
@@ -486,6 +601,8 @@ def experimental(func):
 
 def backend_entry_points() -> list[importlib.metadata.EntryPoint]:
     """Get the list of installed `ibis.backend` entrypoints."""
+    # importing importlib.metadata is slow, so defer it until it's needed
+    import importlib.metadata
 
     if sys.version_info < (3, 10):
         eps = importlib.metadata.entry_points()["ibis.backends"]